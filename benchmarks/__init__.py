@@ -0,0 +1,14 @@
+"""
+Benchmarks for sendtools.
+
+Each scenario runs the same job three ways: with sendtools consumers, with a
+hand-written for-loop and with the nearest itertools/collections/builtin
+equivalent. Run from the top of the source tree:
+
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json
+
+The comparison uses the ratio of each variant's time to the for-loop's time
+in the same run, so results from different machines or loads can be compared.
+"""
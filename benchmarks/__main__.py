@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+
+from . import runner
+from .scenarios import SCENARIOS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="sendtools benchmarks")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="run the scenarios")
+    run.add_argument("patterns", nargs="*",
+                     help="glob patterns selecting scenarios (default: all)")
+    run.add_argument("-n", type=int, default=100000,
+                     help="number of items per scenario")
+    run.add_argument("-r", "--repeat", type=int, default=5,
+                     help="number of timed repeats (the best is kept)")
+    run.add_argument("-o", "--output", help="save the results to this JSON file")
+
+    compare = commands.add_parser("compare", help="compare two saved runs")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("-t", "--threshold", type=float, default=0.1,
+                         help="relative slow-down reported as a regression")
+
+    commands.add_parser("list", help="list the scenarios")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = runner.run(args.n, args.repeat, args.patterns)
+        if args.output:
+            runner.save(results, args.output)
+    elif args.command == "compare":
+        regressions = runner.compare(runner.load(args.old),
+                                     runner.load(args.new), args.threshold)
+        return 1 if regressions else 0
+    elif args.command == "list":
+        for name in SCENARIOS:
+            print(name)
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
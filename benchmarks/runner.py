@@ -0,0 +1,115 @@
+"""
+Timing, memory measurement, saving and comparison of benchmark runs.
+"""
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from fnmatch import fnmatch
+
+from .scenarios import SCENARIOS
+
+
+def measure(func, data, repeat):
+    """
+    Returns the best time (seconds) over repeat calls of func(data) and the
+    peak memory (bytes) allocated by one call
+    """
+    timer = timeit.Timer(lambda :func(data))
+    seconds = min(timer.repeat(repeat, 1))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def verify(name, make, data, variants):
+    """
+    Runs each variant once and raises AssertionError if its result does not
+    match the for-loop's, as judged by the scenario's check function
+    """
+    expected = variants["loop"](data)
+    for variant, func in variants.items():
+        result = func(data)
+        if not make.check(expected, result):
+            raise AssertionError("%s: %s gave %.200r, loop gave %.200r"%(
+                                    name, variant, result, expected))
+
+
+def run(n=100000, repeat=5, patterns=None, out=sys.stdout):
+    """
+    Runs the scenarios whose names match any of the glob patterns (all of
+    them, by default) with n items each. The variants of each scenario are 
+    checked against each other before they are timed. Returns the results 
+    as a dict.
+    """
+    results = {}
+    for name, make in SCENARIOS.items():
+        if patterns and not any(fnmatch(name, p) for p in patterns):
+            continue
+        data, variants = make(n)
+        verify(name, make, data, variants)
+        results[name] = entry = {}
+        for variant, func in variants.items():
+            seconds, peak = measure(func, data, repeat)
+            entry[variant] = {"seconds": seconds,
+                              "items_per_sec": n/seconds,
+                              "ns_per_item": seconds*1e9/n,
+                              "peak_bytes": peak}
+        loop = entry["loop"]["seconds"]
+        for variant, stats in entry.items():
+            stats["vs_loop"] = stats["seconds"]/loop
+            print("%-22s %-10s %12.0f items/s %8.1f ns/item %6.2fx loop %10d bytes"%(
+                    name, variant, stats["items_per_sec"], stats["ns_per_item"],
+                    stats["vs_loop"], stats["peak_bytes"]), file=out)
+    return {"meta": {"n": n,
+                     "repeat": repeat,
+                     "python": sys.version,
+                     "platform": platform.platform(),
+                     "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "results": results}
+
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(old, new, threshold=0.1, out=sys.stdout):
+    """
+    Compares two runs, as returned by run() or load(). Each variant's time
+    is taken relative to the for-loop in the same run, so the comparison is
+    of the overhead per item rather than of the machines. Returns the list
+    of (scenario, variant, change) for which the relative time grew by more
+    than threshold.
+    """
+    regressions = []
+    old_results, new_results = old["results"], new["results"]
+    for name in new_results:
+        if name not in old_results:
+            continue
+        for variant, stats in new_results[name].items():
+            if variant == "loop" or variant not in old_results[name]:
+                continue
+            before = old_results[name][variant]["vs_loop"]
+            after = stats["vs_loop"]
+            change = after/before - 1
+            flag = ""
+            if change > threshold:
+                regressions.append((name, variant, change))
+                flag = "  REGRESSION"
+            print("%-22s %-10s %6.2fx -> %6.2fx loop %+7.1f%%%s"%(
+                    name, variant, before, after, change*100, flag), file=out)
+    return regressions
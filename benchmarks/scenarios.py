@@ -0,0 +1,701 @@
+"""
+Benchmark scenarios. Each scenario is a function taking the number of items
+and returning (data, variants), where variants maps a variant name to a
+function of data. All variants of a scenario compute the same result, as
+checked by the scenario's check function (same(), unless the scenario is an
+estimate) before they are timed.
+"""
+import pyximport
+pyximport.install()
+
+import sendtools as st
+import itertools
+import heapq
+import math
+import random
+import statistics
+from collections import OrderedDict, defaultdict, deque, Counter
+from array import array
+from operator import itemgetter, attrgetter
+
+SCENARIOS = OrderedDict()
+
+
+def plain(value):
+    """value with arrays, buffers and tuples turned into lists"""
+    if isinstance(value, dict):
+        return {k:plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(v) for v in value]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if not isinstance(value, (str, bytes, int, float)):
+        try:
+            return memoryview(value).tolist()
+        except TypeError:
+            pass
+    return value
+
+
+def same(expected, result, rel=1e-9):
+    """
+    True if result equals expected, allowing for rounding of floats and for
+    containers of different types
+    """
+    expected, result = plain(expected), plain(result)
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool) \
+            and isinstance(result, (int, float)):
+        return math.isclose(expected, result, rel_tol=rel, abs_tol=rel)
+    if isinstance(expected, dict):
+        return isinstance(result, dict) and expected.keys() == result.keys() \
+            and all(same(expected[k], result[k], rel) for k in expected)
+    if isinstance(expected, list):
+        return isinstance(result, list) and len(expected) == len(result) \
+            and all(same(a, b, rel) for a, b in zip(expected, result))
+    return expected == result
+
+
+def within(rel):
+    """A check for estimates, allowing a relative error of rel"""
+    return lambda expected, result:same(expected, result, rel)
+
+
+def scenario(name, check=same):
+    def register(func):
+        func.check = check
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+def rows(n):
+    return [(i, "x"*(i%7), i*0.5) for i in range(n)]
+
+
+def floats(n):
+    return [((i*7919)%1000)*0.25 for i in range(n)]
+
+
+def times(n):
+    """Increasing timestamps, with gaps every so often"""
+    return [i*0.37 + (i//50)*2.0 for i in range(n)]
+
+
+###Sinks###
+
+@scenario("append")
+def append(n):
+    def loop(data):
+        out = []
+        for item in data:
+            out.append(item)
+        return out
+    return list(range(n)), {"sendtools": lambda data:st.send(data, []),
+                            "loop": loop,
+                            "stdlib": list}
+
+
+@scenario("typed_append")
+def typed_append(n):
+    def loop(data):
+        out = array("d")
+        for item in data:
+            out.append(item)
+        return out
+    return floats(n), {"sendtools": lambda data:st.send(data, st.TypedAppend("d")),
+                       "loop": loop,
+                       "stdlib": lambda data:array("d", data)}
+
+
+@scenario("set")
+def add_to_set(n):
+    def loop(data):
+        out = set()
+        for item in data:
+            out.add(item)
+        return out
+    return [i%1000 for i in range(n)], {"sendtools": lambda data:st.send(data, set()),
+                                        "loop": loop,
+                                        "stdlib": set}
+
+
+###Nodes###
+
+@scenario("attr")
+def attr(n):
+    def loop(data):
+        out = []
+        for item in data:
+            out.append(item.imag)
+        return out
+    return [complex(i, -i) for i in range(n)], {
+        "sendtools": lambda data:st.send(data, st.Attr("imag", [])),
+        "loop": loop,
+        "stdlib": lambda data:list(map(attrgetter("imag"), data))}
+
+
+@scenario("get")
+def get(n):
+    def loop(data):
+        out = []
+        for item in data:
+            out.append(item[1])
+        return out
+    return rows(n), {"sendtools": lambda data:st.send(data, st.Get(1, [])),
+                     "loop": loop,
+                     "stdlib": lambda data:list(map(itemgetter(1), data))}
+
+
+@scenario("map_filter")
+def map_filter(n):
+    def loop(data):
+        out = []
+        for item in data:
+            if item % 3:
+                out.append(item*2)
+        return out
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Filter(lambda x:x%3,
+                                                st.Map(lambda x:x*2, []))),
+        "loop": loop,
+        "stdlib": lambda data:list(map(lambda x:x*2,
+                                       filter(lambda x:x%3, data)))}
+
+
+def chain(depth):
+    def make(n):
+        func = lambda x:x+1
+        def sendtools(data):
+            target = []
+            for i in range(depth):
+                target = st.Map(func, target)
+            return st.send(data, target)
+        def compiled(data):
+            target = []
+            for i in range(depth):
+                target = st.Map(func, target)
+            return st.send(data, st.compile(target))
+        def loop(data):
+            out = []
+            for item in data:
+                for i in range(depth):
+                    item = func(item)
+                out.append(item)
+            return out
+        def stdlib(data):
+            itr = iter(data)
+            for i in range(depth):
+                itr = map(func, itr)
+            return list(itr)
+        return list(range(n)), {"sendtools": sendtools, "compiled": compiled,
+                                "loop": loop, "stdlib": stdlib}
+    return make
+
+for depth in (1, 4, 16):
+    scenario("chain_depth_%d"%depth)(chain(depth))
+
+
+@scenario("get_chain")
+def get_chain(n):
+    #cheap stages, so the time is mostly the cost per node
+    def make():
+        return st.Get(0, st.Get(0, st.Get(0, st.Get(0, []))))
+    def loop(data):
+        out = []
+        for item in data:
+            out.append(item[0][0][0][0])
+        return out
+    return [((((i,),),),) for i in range(n)], {
+        "sendtools": lambda data:st.send(data, make()),
+        "compiled": lambda data:st.send(data, st.compile(make())),
+        "loop": loop,
+        "stdlib": lambda data:list(map(itemgetter(0), map(itemgetter(0), 
+                                   map(itemgetter(0), map(itemgetter(0), data)))))}
+
+
+@scenario("slice")
+def slice_(n):
+    def loop(data):
+        out = []
+        for i, item in enumerate(data):
+            if i >= n//2:
+                break
+            if i % 3 == 0:
+                out.append(item)
+        return out
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Slice(0, n//2, 3, [])),
+        "loop": loop,
+        "stdlib": lambda data:list(itertools.islice(data, 0, n//2, 3))}
+
+
+@scenario("limit")
+def limit(n):
+    def loop(data):
+        out = []
+        for item in data:
+            if len(out) == n//2:
+                break
+            out.append(item)
+        return out
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Limit(n//2, [])),
+        "loop": loop,
+        "stdlib": lambda data:list(itertools.islice(data, n//2))}
+
+
+@scenario("unique")
+def unique(n):
+    def loop(data):
+        seen = set()
+        out = []
+        for item in data:
+            if item not in seen:
+                seen.add(item)
+                out.append(item)
+        return out
+    return [(i*31)%(n//4 or 1) for i in range(n)], {
+        "sendtools": lambda data:st.send(data, st.Unique([])),
+        "loop": loop,
+        "stdlib": lambda data:list(dict.fromkeys(data))}
+
+
+def split(width):
+    def make(n):
+        def loop(data):
+            sums = [0]*width
+            for item in data:
+                for i in range(width):
+                    sums[i] += item
+            return tuple(sums)
+        return list(range(n)), {
+            "sendtools": lambda data:st.send(data,
+                                tuple([st.Sum() for i in range(width)])),
+            "loop": loop,
+            "stdlib": lambda data:tuple([sum(t) for t in
+                                         itertools.tee(data, width)])}
+    return make
+
+for width in (2, 8, 32):
+    scenario("split_width_%d"%width)(split(width))
+
+
+@scenario("unzip")
+def unzip(n):
+    def loop(data):
+        a, b, c = [], [], []
+        for x, y, z in data:
+            a.append(x)
+            b.append(y)
+            c.append(z)
+        return a, b, c
+    return rows(n), {
+        "sendtools": lambda data:st.send(data, st.Unzip([], [], [])),
+        "loop": loop,
+        "stdlib": lambda data:tuple(map(list, zip(*data)))}
+
+
+@scenario("unzip_columns")
+def unzip_columns(n):
+    def loop(data):
+        a, b, c = array("q"), [], array("d")
+        for x, y, z in data:
+            a.append(x)
+            b.append(y)
+            c.append(z)
+        return {"f0": a, "f1": b, "f2": c}
+    def stdlib(data):
+        a, b, c = zip(*data)
+        return {"f0": array("q", a), "f1": list(b), "f2": array("d", c)}
+    return rows(n), {
+        "sendtools": lambda data:st.send(data, st.UnzipColumns(("q", "O", "d"))),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+@scenario("switch")
+def switch(n):
+    def loop(data):
+        out = ([], [], [])
+        for item in data:
+            out[item%3].append(item)
+        return out
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Switch(lambda x:x%3, [], [], [])),
+        "loop": loop,
+        "stdlib": lambda data:tuple([list(itertools.compress(data, 
+                                    (x%3 == i for x in data))) for i in range(3)])}
+
+
+###Grouping###
+
+def switch_by_key(cardinality):
+    def make(n):
+        def loop(data):
+            out = defaultdict(list)
+            for item in data:
+                out[item%cardinality].append(item)
+            return dict(out)
+        def stdlib(data):
+            key = lambda x:x%cardinality
+            return dict((k, list(g)) for k, g in
+                        itertools.groupby(sorted(data, key=key), key))
+        return list(range(n)), {
+            "sendtools": lambda data:st.send(data,
+                                    st.SwitchByKey(lambda x:x%cardinality)),
+            "loop": loop,
+            "stdlib": stdlib}
+    return make
+
+for cardinality in (10, 1000, 100000):
+    scenario("switch_by_key_%d"%cardinality)(switch_by_key(cardinality))
+
+
+@scenario("count_by_key")
+def count_by_key(n):
+    def loop(data):
+        out = defaultdict(int)
+        for item in data:
+            out[item] += 1
+        return dict(out)
+    return [(i*31)%1000 for i in range(n)], {
+        "sendtools": lambda data:st.send(data, st.SwitchByKey(factory=st.Count)),
+        "loop": loop,
+        "stdlib": lambda data:dict(Counter(data))}
+
+
+@scenario("group_by_key")
+def group_by_key(n):
+    def loop(data):
+        out = []
+        group = None
+        last = object()
+        for item in data:
+            k = item//10
+            if k != last:
+                group = []
+                out.append(group)
+                last = k
+            group.append(item)
+        return out
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.GroupByKey(lambda x:x//10, [])),
+        "loop": loop,
+        "stdlib": lambda data:[list(g) for k, g in
+                               itertools.groupby(data, lambda x:x//10)]}
+
+
+@scenario("group_by_n")
+def group_by_n(n):
+    def loop(data):
+        out = []
+        group = []
+        for item in data:
+            group.append(item)
+            if len(group) == 10:
+                out.append(group)
+                group = []
+        if group:
+            out.append(group)
+        return out
+    def stdlib(data):
+        itr = iter(data)
+        return list(iter(lambda :list(itertools.islice(itr, 10)), []))
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.GroupByN(10, [])),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+@scenario("window_sum")
+def window_sum(n):
+    def loop(data):
+        out = []
+        window = deque()
+        total = 0
+        for item in data:
+            window.append(item)
+            total += item
+            if len(window) > 10:
+                total -= window.popleft()
+            if len(window) == 10:
+                out.append(total)
+        return out
+    def stdlib(data):
+        sums = itertools.accumulate(itertools.chain([0], data))
+        lagged, current = itertools.tee(sums)
+        return [c - l for l, c in zip(lagged, itertools.islice(current, 10, None))]
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Window(10, 1, [], agg=st.Sum)),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+@scenario("time_window")
+def time_window(n):
+    def loop(data):
+        out = []
+        start = None
+        for t in data:
+            this = (t//10)*10
+            if this != start:
+                out.append([this, 0])
+                start = this
+            out[-1][1] += 1
+        return out
+    return times(n), {
+        "sendtools": lambda data:st.send(data, st.TimeWindow(lambda t:t, 10, [], 
+                                                             factory=st.Count)),
+        "loop": loop,
+        "stdlib": lambda data:[(k, sum(1 for t in g)) for k, g in 
+                               itertools.groupby(data, lambda t:(t//10)*10)]}
+
+
+@scenario("session_window")
+def session_window(n):
+    def loop(data):
+        out = []
+        last = None
+        for t in data:
+            if last is None or t - last > 1.0:
+                out.append([t, t, 0])
+            out[-1][1] = t
+            out[-1][2] += 1
+            last = t
+        return out
+    def stdlib(data):
+        #number the sessions by counting the gaps so far
+        gaps = itertools.accumulate(b - a > 1.0 for a, b in 
+                                    zip([data[0]] + data, data))
+        out = []
+        for k, g in itertools.groupby(zip(gaps, data), itemgetter(0)):
+            ts = [t for k, t in g]
+            out.append((ts[0], ts[-1], len(ts)))
+        return out
+    return times(n), {
+        "sendtools": lambda data:st.send(data, st.SessionWindow(lambda t:t, 1.0, 
+                                                [], factory=st.Count)),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+@scenario("group_aggregate")
+def group_aggregate(n):
+    def loop(data):
+        out = {}
+        for item in data:
+            key = int(item)%100
+            x = float(item)
+            if key in out:
+                agg = out[key]
+                agg[0] += x
+                agg[1] += 1
+                if x < agg[2]:
+                    agg[2] = x
+                if x > agg[3]:
+                    agg[3] = x
+            else:
+                out[key] = [x, 1, x, x]
+        return {k:(s, c, lo, hi, s/c) for k, (s, c, lo, hi) in out.items()}
+    def stdlib(data):
+        groups = defaultdict(list)
+        for item in data:
+            groups[int(item)%100].append(float(item))
+        return {k:(math.fsum(g), len(g), min(g), max(g), statistics.fmean(g))
+                for k, g in groups.items()}
+    return floats(n), {
+        "sendtools": lambda data:st.send(data, st.GroupAggregate(
+                                                lambda x:int(x)%100)),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+###Aggregates###
+
+@scenario("count")
+def count(n):
+    def loop(data):
+        total = 0
+        for item in data:
+            total += 1
+        return total
+    return list(range(n)), {"sendtools": lambda data:st.send(data, st.Count()),
+                            "loop": loop,
+                            "stdlib": lambda data:sum(1 for item in data)}
+
+
+@scenario("ave")
+def ave(n):
+    def loop(data):
+        total = 0.0
+        count = 0
+        for item in data:
+            total += item
+            count += 1
+        return total/count
+    return floats(n), {"sendtools": lambda data:st.send(data, st.Ave()),
+                       "loop": loop,
+                       "stdlib": statistics.fmean}
+
+
+@scenario("any_all")
+def any_all(n):
+    #the only false item is the last, so neither is decided early
+    def loop(data):
+        found, every = False, True
+        for item in data:
+            if item < 0:
+                found = True
+            if not item:
+                every = False
+        return found, every
+    return list(range(n, 0, -1))[:-1] + [0], {
+        "sendtools": lambda data:st.send(data, (st.Map(lambda x:x < 0, st.Any()), 
+                                                st.All())),
+        "loop": loop,
+        "stdlib": lambda data:(any(x < 0 for x in data), all(data))}
+
+
+@scenario("select")
+def select(n):
+    def loop(data):
+        for i, item in enumerate(data):
+            if i == n//2:
+                return item
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Select(n//2)),
+        "loop": loop,
+        "stdlib": lambda data:next(itertools.islice(data, n//2, None))}
+
+
+@scenario("approx_count_distinct", check=within(0.03))
+def approx_count_distinct(n):
+    def loop(data):
+        seen = set()
+        for item in data:
+            seen.add(item)
+        return len(seen)
+    return [(i*31)%(n//3 or 1) for i in range(n)], {
+        "sendtools": lambda data:st.send(data, st.ApproxCountDistinct()),
+        "loop": loop,
+        "stdlib": lambda data:len(set(data))}
+
+
+@scenario("quantiles", check=within(0.02))
+def quantiles(n):
+    qs = (0.5, 0.9, 0.99)
+    def loop(data):
+        ordered = sorted(data)
+        return tuple(ordered[min(int(q*len(ordered)), len(ordered) - 1)] 
+                     for q in qs)
+    def stdlib(data):
+        cuts = statistics.quantiles(data, n=100, method="inclusive")
+        return tuple(cuts[int(q*100) - 1] for q in qs)
+    return floats(n), {
+        "sendtools": lambda data:st.send(data, st.Quantiles(qs)),
+        "loop": loop,
+        "stdlib": stdlib}
+
+
+def same_size_sample(expected, result):
+    """Samples differ between methods, so only their sizes are compared"""
+    return len(result) == len(expected) == len(set(result))
+
+
+@scenario("sample", check=same_size_sample)
+def sample(n):
+    def loop(data):
+        rng = random.Random(1)
+        reservoir = []
+        for i, item in enumerate(data):
+            if i < 100:
+                reservoir.append(item)
+            else:
+                j = rng.randrange(i + 1)
+                if j < 100:
+                    reservoir[j] = item
+        return reservoir
+    return list(range(n)), {
+        "sendtools": lambda data:st.send(data, st.Sample(100, seed=1)),
+        "loop": loop,
+        "stdlib": lambda data:random.Random(1).sample(data, min(100, len(data)))}
+
+
+@scenario("sum")
+def sum_(n):
+    def loop(data):
+        total = 0
+        for item in data:
+            total += item
+        return total
+    return list(range(n)), {"sendtools": lambda data:st.send(data, st.Sum()),
+                            "loop": loop,
+                            "stdlib": sum}
+
+
+@scenario("min_max")
+def min_max(n):
+    def loop(data):
+        lo = hi = data[0]
+        for item in data:
+            if item < lo:
+                lo = item
+            if item > hi:
+                hi = item
+        return lo, hi
+    return floats(n), {"sendtools": lambda data:st.send(data, (st.Min(), st.Max())),
+                       "loop": loop,
+                       "stdlib": lambda data:(min(data), max(data))}
+
+
+@scenario("stats")
+def stats(n):
+    def loop(data):
+        count = 0
+        mean = M2 = 0.0
+        for item in data:
+            count += 1
+            delta = item - mean
+            mean += delta/count
+            M2 += delta*(item - mean)
+        return count, mean, math.sqrt(M2/(count - 1))
+    return floats(n), {
+        "sendtools": lambda data:st.send(data, st.Stats()),
+        "loop": loop,
+        "stdlib": lambda data:(len(data), statistics.fmean(data), 
+                               statistics.stdev(data))}
+
+
+@scenario("top_k")
+def top_k(n):
+    def loop(data):
+        heap = []
+        for item in data:
+            if len(heap) < 10:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        return sorted(heap, reverse=True)
+    return floats(n), {"sendtools": lambda data:st.send(data, st.TopK(10)),
+                       "loop": loop,
+                       "stdlib": lambda data:heapq.nlargest(10, data)}
+
+
+@scenario("first_last")
+def first_last(n):
+    def loop(data):
+        first = last = None
+        for i, item in enumerate(data):
+            if i == 0:
+                first = item
+            last = item
+        return first, last
+    def stdlib(data):
+        itr = iter(data)
+        first = next(itr, None)
+        tail = deque(itr, maxlen=1)
+        return first, (tail[0] if tail else first)
+    return list(range(n)), {"sendtools": lambda data:st.send(data,
+                                                    (st.First(), st.Last())),
+                            "loop": loop,
+                            "stdlib": stdlib}
@@ -2,10 +2,52 @@
 """
 A cython implementation of the sendtools API
 """
-from collections.abc import MutableSequence, MutableSet, Callable, MutableMapping
-from collections import defaultdict
+from collections.abc import MutableSequence, MutableSet, Callable, MutableMapping, \
+    Mapping, Sequence
+from collections import defaultdict, OrderedDict, deque
 from types import GeneratorType
+from itertools import islice
 from math import sqrt
+from random import Random
+from array import array
+from multiprocessing import Pool
+from threading import Thread, Event
+from queue import Queue, Full
+from time import perf_counter
+from sys import getsizeof
+from tempfile import TemporaryFile
+from mmap import mmap, ACCESS_READ
+from bisect import bisect_right
+from heapq import merge as heap_merge
+from struct import Struct, calcsize
+from sys import byteorder as sys_byteorder
+import re
+from csv import reader as csv_reader
+from codecs import lookup as codec_lookup
+import pickle
+import os
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.buffer cimport PyObject_CheckBuffer, PyObject_GetBuffer, \
+    PyBuffer_Release, PyBUF_FORMAT, PyBUF_C_CONTIGUOUS, PyBUF_SIMPLE
+from libc.string cimport memcpy, memset, memchr
+from libc.stdlib cimport qsort
+from libc.math cimport asin, sin, exp, log, floor, fabs, M_PI, INFINITY
+from libc.stdint cimport uint64_t, uint32_t, uint8_t
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE, \
+    PyBytes_FromStringAndSize
+from cpython.unicode cimport PyUnicode_Decode
+from cpython.number cimport PyIndex_Check
+from cpython.ref cimport PyObject
+cimport cython
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object, Py_ssize_t *) except NULL
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 cdef class Consumer(object):
@@ -33,12 +75,82 @@ cdef class Consumer(object):
     
     def send(self, object item):
         self.send_(item)
+        
+    cdef void send_many_(self, object chunk) except *:
+        cdef object item
+        for item in chunk:
+            self.send_(item)
+            
+    def send_many(self, object chunk):
+        """
+        send_many(chunk)
+        
+        Sends a sequence of items into the consumer in a single call. Consumers
+        with a bulk implementation process the whole chunk at once; all others
+        receive the items one at a time.
+        """
+        self.send_many_(chunk)
     
     cdef void close_(self):
         self._alive = 0
         
     def close(self):
         self.close_()
+        
+    cdef object unmergeable_(self):
+        """
+        Returns the first consumer in this tree whose partial results 
+        cannot be merged, or None if the whole tree is mergeable
+        """
+        return self
+    
+    cdef object state_(self):
+        raise TypeError("%s consumers cannot be merged"%type(self).__name__)
+    
+    cdef void merge_state_(self, object state) except *:
+        raise TypeError("%s consumers cannot be merged"%type(self).__name__)
+    
+    cdef list children_(self):
+        """
+        Returns the list of consumers this consumer sends items to
+        """
+        return []
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        raise IndexError("%s has no child %d"%(type(self).__name__, i))
+    
+    def merge(self, Consumer other):
+        """
+        merge(other)
+        
+        Combines the partial result of other, a consumer of the same 
+        structure which has consumed a different part of the data, into 
+        this consumer.
+        """
+        node = self.unmergeable_()
+        if node is not None:
+            raise TypeError("%s consumers cannot be merged"%type(node).__name__)
+        if type(other) is not type(self):
+            raise TypeError("cannot merge %s into %s"%(type(other).__name__,
+                                                      type(self).__name__))
+        self.merge_state_(other.state_())
+    
+    
+cdef object unmergeable_of(targets):
+    cdef Consumer t
+    for t in targets:
+        node = t.unmergeable_()
+        if node is not None:
+            return node
+    return None
+
+
+cdef void merge_states(targets, tuple state) except *:
+    cdef Consumer t
+    if len(state) != len(targets):
+        raise TypeError("cannot merge consumers with different numbers of targets")
+    for t, item in zip(targets, state):
+        t.merge_state_(item)
     
     
 cdef class ConsumerSink(Consumer):
@@ -64,9 +176,24 @@ cdef class ConsumerNode(Consumer):
         return self.target.result_()
     
     cdef void close_(self):
-        if self._alive:
-            self.target.close_()
+        #closing always reaches the whole tree, even below finished nodes,
+        #so that nodes which send items on when closed (Sorted, say) do so
         self._alive = 0
+        self.target.close_()
+        
+    cdef object state_(self):
+        return self.target.state_()
+    
+    cdef void merge_state_(self, object state) except *:
+        self.target.merge_state_(state)
+        
+    cdef list children_(self):
+        return [self.target]
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        if i != 0:
+            raise IndexError("%s has no child %d"%(type(self).__name__, i))
+        self.target = child
     
     
 cdef class Append(ConsumerSink):
@@ -76,6 +203,18 @@ cdef class Append(ConsumerSink):
     cdef void send_(self, object item) except *:
         self.output.append(item)
         
+    cdef void send_many_(self, object chunk) except *:
+        self.output.extend(chunk)
+        
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return self.output
+    
+    cdef void merge_state_(self, object state) except *:
+        self.send_many_(state)
+        
     
 cdef class ListAppend(Append):
     def __cinit__(self, output, *args, **kdws):
@@ -83,6 +222,9 @@ cdef class ListAppend(Append):
         
     cdef void send_(self, object item) except *:
         (<list>self.output).append(item)
+        
+    cdef void send_many_(self, object chunk) except *:
+        (<list>self.output).extend(chunk)
     
     
 cdef class AddToSet(ConsumerSink):
@@ -91,14 +233,502 @@ cdef class AddToSet(ConsumerSink):
         
     cdef void send_(self, object item) except *:
         self.output.add(item)
+        
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return self.output
+    
+    cdef void merge_state_(self, object state) except *:
+        self.output |= state
+        
+        
+cdef dict TYPECODES = {
+    "b": sizeof(signed char), "B": sizeof(unsigned char),
+    "h": sizeof(short), "H": sizeof(unsigned short),
+    "i": sizeof(int), "I": sizeof(unsigned int),
+    "l": sizeof(long), "L": sizeof(unsigned long),
+    "q": sizeof(long long), "Q": sizeof(unsigned long long),
+    "f": sizeof(float), "d": sizeof(double)
+    }
+
+
+cdef str typecode_of(object dtype):
+    """
+    Returns the array-module typecode for dtype, which may be a typecode 
+    string or (if numpy is installed) anything numpy.dtype accepts
+    """
+    if isinstance(dtype, str) and dtype in TYPECODES:
+        return dtype
+    if numpy is not None:
+        try:
+            code = numpy.dtype(dtype).char
+        except TypeError:
+            pass
+        else:
+            if code in TYPECODES:
+                return code
+    raise TypeError("unsupported dtype %s; expected one of %s"%(repr(dtype), 
+                                                    "".join(TYPECODES)))
+
+
+cdef class TypedBuffer(object):
+    """
+    TypedBuffer(dtype) -> growable buffer of C numbers
+    
+    Stores numbers in a contiguous C array, growing by doubling. dtype is an 
+    array-module typecode (one of "bBhHiIlLqQfd") or a numpy dtype. The 
+    buffer supports the buffer protocol, so numpy arrays and memoryviews 
+    can share its memory. Such a view shows the items present when it was
+    made: if the buffer grows while views exist, the items are copied to a
+    new array and the old one is kept until the last view is released.
+    """
+    cdef:
+        char *data
+        char **retired
+        Py_ssize_t length, capacity, itemsize, nretired
+        char code
+        readonly str typecode
+        bytes format
+        int exports
+        
+    def __cinit__(self, dtype, Py_ssize_t capacity=16):
+        self.typecode = typecode_of(dtype)
+        self.format = self.typecode.encode("ascii")
+        self.code = self.format[0]
+        self.itemsize = TYPECODES[self.typecode]
+        self.length = 0
+        self.capacity = 0
+        self.exports = 0
+        self.reserve_(max(capacity, 1))
+        
+    def __dealloc__(self):
+        self.free_retired_()
+        PyMem_Free(self.retired)
+        PyMem_Free(self.data)
+        
+    def __len__(self):
+        return self.length
+    
+    cdef void free_retired_(self) noexcept:
+        cdef Py_ssize_t i
+        for i in range(self.nretired):
+            PyMem_Free(self.retired[i])
+        self.nretired = 0
+    
+    cdef int reserve_(self, Py_ssize_t n) except -1:
+        cdef:
+            Py_ssize_t capacity=self.capacity
+            char *data
+            char **retired
+        if n <= capacity:
+            return 0
+        if capacity == 0:
+            capacity = n
+        while capacity < n:
+            capacity *= 2
+        if self.exports > 0:
+            #views still use the old array, so copy to a new one and free
+            #the old one when the last view is released
+            retired = <char**>PyMem_Realloc(self.retired, 
+                                            (self.nretired + 1)*sizeof(char*))
+            if retired == NULL:
+                raise MemoryError()
+            self.retired = retired
+            data = <char*>PyMem_Malloc(capacity*self.itemsize)
+            if data == NULL:
+                raise MemoryError()
+            memcpy(data, self.data, self.length*self.itemsize)
+            self.retired[self.nretired] = self.data
+            self.nretired += 1
+        else:
+            data = <char*>PyMem_Realloc(self.data, capacity*self.itemsize)
+            if data == NULL:
+                raise MemoryError()
+        self.data = data
+        self.capacity = capacity
+        return 0
+    
+    cdef int append_(self, object item) except -1:
+        cdef char *p
+        if self.code != b'd' and self.code != b'f' and not PyIndex_Check(item):
+            raise TypeError("%s buffer items must be integers, not %s"%(
+                                self.typecode, type(item).__name__))
+        if self.length == self.capacity:
+            self.reserve_(self.length + 1)
+        p = self.data + self.length*self.itemsize
+        if self.code == b'd':
+            (<double*>p)[0] = item
+        elif self.code == b'q':
+            (<long long*>p)[0] = item
+        elif self.code == b'l':
+            (<long*>p)[0] = item
+        elif self.code == b'f':
+            (<float*>p)[0] = item
+        elif self.code == b'i':
+            (<int*>p)[0] = item
+        elif self.code == b'Q':
+            (<unsigned long long*>p)[0] = item
+        elif self.code == b'L':
+            (<unsigned long*>p)[0] = item
+        elif self.code == b'I':
+            (<unsigned int*>p)[0] = item
+        elif self.code == b'h':
+            (<short*>p)[0] = item
+        elif self.code == b'H':
+            (<unsigned short*>p)[0] = item
+        elif self.code == b'b':
+            (<signed char*>p)[0] = item
+        else:
+            (<unsigned char*>p)[0] = item
+        self.length += 1
+        return 0
+    
+    cdef int extend_(self, object chunk) except -1:
+        cdef: 
+            Py_buffer view
+            object item
+        if PyObject_CheckBuffer(chunk):
+            try:
+                PyObject_GetBuffer(chunk, &view, PyBUF_FORMAT|PyBUF_C_CONTIGUOUS)
+            except BufferError:
+                pass
+            else:
+                try:
+                    if self.compatible_(view.format, view.itemsize):
+                        self.reserve_(self.length + view.len//view.itemsize)
+                        memcpy(self.data + self.length*self.itemsize, 
+                               view.buf, view.len)
+                        self.length += view.len//view.itemsize
+                        return 0
+                finally:
+                    PyBuffer_Release(&view)
+        try:
+            self.reserve_(self.length + len(chunk))
+        except TypeError:
+            pass
+        for item in chunk:
+            self.append_(item)
+        return 0
+    
+    cdef bint compatible_(self, char *format, Py_ssize_t itemsize):
+        """
+        True if buffer data of the given struct format can be copied straight
+        into this buffer
+        """
+        cdef char code
+        if format == NULL or itemsize != self.itemsize:
+            return False
+        if format[0] == b'@' or format[0] == b'=':
+            format += 1
+        if format[0] == 0 or format[1] != 0:
+            return False
+        code = format[0]
+        if code == self.code:
+            return True
+        if code in b"bhilq" and self.code in b"bhilq":
+            return True
+        return code in b"BHILQ" and self.code in b"BHILQ"
+    
+    cdef bint clear_(self):
+        """
+        Empties the buffer, keeping its memory. Returns False (leaving the 
+        buffer unchanged) if the memory is in use by a view.
+        """
+        if self.exports > 0:
+            return False
+        self.length = 0
+        return True
+    
+    def append(self, item):
+        self.append_(item)
+        
+    def extend(self, chunk):
+        self.extend_(chunk)
+        
+    def asarray(self):
+        """
+        Returns a numpy array sharing the memory of this buffer, or a 
+        memoryview if numpy is not installed
+        """
+        if numpy is None:
+            return memoryview(self)
+        return numpy.frombuffer(self, dtype=self.typecode)
+    
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef Py_ssize_t *shape = <Py_ssize_t*>PyMem_Malloc(2*sizeof(Py_ssize_t))
+        if shape == NULL:
+            raise MemoryError()
+        shape[0] = self.length
+        shape[1] = self.itemsize
+        buffer.buf = self.data
+        buffer.obj = self
+        buffer.len = self.length*self.itemsize
+        buffer.readonly = 0
+        buffer.itemsize = self.itemsize
+        if flags & PyBUF_FORMAT:
+            buffer.format = self.format
+        else:
+            buffer.format = NULL
+        buffer.ndim = 1
+        buffer.shape = shape
+        buffer.strides = shape + 1
+        buffer.suboffsets = NULL
+        buffer.internal = shape
+        self.exports += 1
+        
+    def __releasebuffer__(self, Py_buffer *buffer):
+        PyMem_Free(buffer.internal)
+        self.exports -= 1
+        if self.exports == 0:
+            self.free_retired_()
+        
+        
+cdef class TypedAppend(Consumer):
+    """
+    TypedAppend(dtype) -> Consumer
+    
+    Collects numbers into a growable C buffer of the given dtype (an 
+    array-module typecode such as "d" or "q", or a numpy dtype). The result 
+    is a numpy array sharing the buffer's memory, or a memoryview of the 
+    buffer if numpy is not installed.
+    """
+    cdef TypedBuffer buffer
+    
+    def __cinit__(self, dtype="d"):
+        self.buffer = TypedBuffer(dtype)
+        
+    cdef object result_(self):
+        return self.buffer.asarray()
+        
+    cdef void send_(self, object item) except *:
+        self.buffer.append_(item)
+        
+    cdef void send_many_(self, object chunk) except *:
+        self.buffer.extend_(chunk)
+        
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return (self.buffer.typecode, bytes(memoryview(self.buffer)))
+    
+    cdef void merge_state_(self, object state) except *:
+        typecode, data = state
+        self.buffer.extend_(memoryview(data).cast(typecode))
+    
+    
+cdef class SpilledSequence(object):
+    """
+    SpilledSequence(memory_limit, dir=None, dtype=None) -> sequence
+    
+    A sequence which keeps at most about memory_limit bytes of items in 
+    memory, writing the rest to an anonymous temporary file (in dir) in 
+    blocks. Item sizes are estimated with sys.getsizeof, which does not 
+    count the contents of containers. If dtype is given, the items are 
+    numbers stored as raw C values and the spilled blocks are read back 
+    through mmap without copying. Created by SpillAppend.
+    
+    len() is cheap and iteration streams the blocks back from disk one at a
+    time. Indexing loads the block holding the item.
+    """
+    cdef:
+        Py_ssize_t memory_limit, nbytes, spilled, cached_block
+        object dir, file, mapped, cached
+        readonly object typecode
+        list offsets, sizes, starts, tail
+        TypedBuffer buffer
+        
+    def __cinit__(self, Py_ssize_t memory_limit, dir=None, dtype=None):
+        if memory_limit < 1:
+            raise ValueError("memory_limit must be a positive number of bytes")
+        self.memory_limit = memory_limit
+        self.dir = dir
+        self.offsets = []
+        self.sizes = []
+        self.starts = []
+        self.cached_block = -1
+        if dtype is None:
+            self.tail = []
+        else:
+            self.buffer = TypedBuffer(dtype)
+            self.typecode = self.buffer.typecode
+            
+    cdef void append_(self, object item) except *:
+        if self.buffer is None:
+            self.tail.append(item)
+            self.nbytes += getsizeof(item) + sizeof(void*)
+            if self.nbytes > self.memory_limit:
+                self.spill_()
+        else:
+            self.buffer.append_(item)
+            if self.buffer.length*self.buffer.itemsize >= self.memory_limit:
+                self.spill_()
+                
+    cdef void extend_(self, object chunk) except *:
+        if self.buffer is None:
+            self.tail.extend(chunk)
+            self.nbytes += sum(map(getsizeof, chunk)) + len(chunk)*sizeof(void*)
+            if self.nbytes > self.memory_limit:
+                self.spill_()
+        else:
+            self.buffer.extend_(chunk)
+            if self.buffer.length*self.buffer.itemsize >= self.memory_limit:
+                self.spill_()
+                
+    cdef void spill_(self) except *:
+        """
+        Writes the items held in memory to the end of the file as one block
+        """
+        cdef Py_ssize_t count
+        if self.buffer is None:
+            count = len(self.tail)
+            data = pickle.dumps(self.tail, pickle.HIGHEST_PROTOCOL)
+        else:
+            count = self.buffer.length
+            data = memoryview(self.buffer)
+        if count == 0:
+            return
+        if self.file is None:
+            self.file = TemporaryFile(dir=self.dir)
+        self.file.seek(0, 2)
+        self.offsets.append(self.file.tell())
+        self.file.write(data)
+        self.sizes.append(count)
+        self.starts.append(self.spilled)
+        self.spilled += count
+        if self.buffer is None:
+            self.tail = []
+            self.nbytes = 0
+        else:
+            data.release()
+            if not self.buffer.clear_():
+                self.buffer = TypedBuffer(self.typecode)
+            
+    cdef object block_(self, Py_ssize_t i):
+        """
+        Returns spilled block i: a list, or for typed data a numpy array (a
+        memoryview, without numpy) of the memory-mapped file
+        """
+        cdef Py_ssize_t offset=self.offsets[i], count=self.sizes[i], end
+        if self.buffer is None:
+            if i != self.cached_block:
+                self.file.seek(offset)
+                self.cached = pickle.load(self.file)
+                self.cached_block = i
+            return self.cached
+        end = offset + count*TYPECODES[self.typecode]
+        if self.mapped is None or len(self.mapped) < end:
+            self.file.flush()
+            self.mapped = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        if numpy is None:
+            return memoryview(self.mapped)[offset:end].cast(self.typecode)
+        return numpy.frombuffer(self.mapped, dtype=self.typecode, count=count,
+                                offset=offset)
+    
+    cdef object memory_(self):
+        """
+        Returns a copy of the items held in memory, as a list
+        """
+        if self.buffer is None:
+            return list(self.tail)
+        return memoryview(self.buffer).tolist()
+    
+    def blocks(self):
+        """
+        blocks() -> iterator
+        
+        Iterates over the items in blocks, as read from the file: lists, or 
+        arrays sharing the memory-mapped file for typed data. The items still 
+        in memory form the last block.
+        """
+        cdef Py_ssize_t i
+        for i in range(len(self.offsets)):
+            yield self.block_(i)
+        tail = self.memory_()
+        if tail:
+            if self.buffer is not None and numpy is not None:
+                tail = numpy.array(tail, dtype=self.typecode)
+            yield tail
+        
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(len(self.offsets)):
+            block = self.block_(i)
+            if self.buffer is not None:
+                block = memoryview(block).tolist()
+            yield from block
+        yield from self.memory_()
+        
+    def __len__(self):
+        if self.buffer is None:
+            return self.spilled + len(self.tail)
+        return self.spilled + self.buffer.length
+    
+    def __getitem__(self, index):
+        cdef Py_ssize_t i, n=len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(n))]
+        i = index
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("SpilledSequence index out of range")
+        if i >= self.spilled:
+            if self.buffer is None:
+                return self.tail[i - self.spilled]
+            return memoryview(self.buffer)[i - self.spilled]
+        block = bisect_right(self.starts, i) - 1
+        item = self.block_(block)[i - <Py_ssize_t>self.starts[block]]
+        return item.item() if self.buffer is not None and numpy is not None \
+            else item
+    
+    def close(self):
+        """
+        Deletes the temporary file. The sequence cannot be used afterwards.
+        """
+        self.mapped = self.cached = None
+        if self.file is not None:
+            self.file.close()
+            
+Sequence.register(SpilledSequence)
+
+
+cdef class SpillAppend(Consumer):
+    """
+    SpillAppend(memory_limit=64*2**20, dir=None, dtype=None) -> Consumer
+    
+    Collects items like a list, but once the items held in memory exceed
+    memory_limit bytes they are written to a temporary file (in dir) as a
+    pickled block. If dtype is given (as for TypedAppend), numbers are 
+    stored as raw C values and read back through mmap without copying. 
+    The result is a SpilledSequence, which supports len(), indexing and 
+    iteration, streaming the blocks back from disk.
+    """
+    cdef SpilledSequence output
+    
+    def __cinit__(self, memory_limit=64*2**20, dir=None, dtype=None):
+        self.output = SpilledSequence(memory_limit, dir, dtype)
+        
+    cdef object result_(self):
+        return self.output
+    
+    cdef void send_(self, object item) except *:
+        self.output.append_(item)
+        
+    cdef void send_many_(self, object chunk) except *:
+        self.output.extend_(chunk)
     
     
 cdef class Split(ConsumerNode):
     cdef:
-        list targets
+        list targets, live
 
     def __cinit__(self, *targets):
-        self.targets = [check(t) for t in targets]
+        cdef Consumer t
+        self.targets = [check(target) for target in targets]
+        self.live = [t for t in self.targets if t._alive]
         
     cdef object result_(self):
         cdef Consumer t
@@ -106,25 +736,63 @@ cdef class Split(ConsumerNode):
         
     cdef void send_(self, object item) except *:
         cdef:
-            int alive=0
+            Py_ssize_t i=0
+            list live=self.live
             Consumer t
-        for t in self.targets:
-            if t._alive:
-                try:
-                    t.send_(item)
-                    alive = 1
-                except StopIteration:
-                    t._alive = 0
-        if alive==0:
+        while i < len(live):
+            t = <Consumer>live[i]
+            try:
+                t.send_(item)
+                i += 1
+            except StopIteration:
+                t._alive = 0
+                del live[i]
+        if not live:
+            self._alive = 0
+            raise StopIteration
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef:
+            Py_ssize_t i=0
+            list live=self.live
+            Consumer t
+        while i < len(live):
+            t = <Consumer>live[i]
+            try:
+                t.send_many_(chunk)
+                i += 1
+            except StopIteration:
+                t._alive = 0
+                del live[i]
+        if not live:
             self._alive = 0
             raise StopIteration
     
     cdef void close_(self):
         cdef Consumer t
-        if self._alive:
-            for t in self.targets:
-                t.close_()
         self._alive = 0
+        for t in self.targets:
+            t.close_()
+        
+    cdef object unmergeable_(self):
+        return unmergeable_of(self.targets)
+    
+    cdef object state_(self):
+        cdef Consumer t
+        return tuple([t.state_() for t in self.targets])
+    
+    cdef void merge_state_(self, object state) except *:
+        merge_states(self.targets, state)
+        
+    cdef list children_(self):
+        return list(self.targets)
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        cdef Py_ssize_t j
+        for j in range(len(self.live)):
+            if self.live[j] is self.targets[i]:
+                self.live[j] = child
+        self.targets[i] = child
 
 
 cdef class Limit(ConsumerNode):
@@ -150,6 +818,19 @@ cdef class Limit(ConsumerNode):
             self.target.send_(item)
             self.count += 1
             
+    cdef void send_many_(self, object chunk) except *:
+        cdef Py_ssize_t n=len(chunk), remaining=self.total - self.count
+        if remaining <= 0:
+            self._alive = 0
+            raise StopIteration
+        if n > remaining:
+            self.target.send_many_(chunk[:remaining])
+            self.count = self.total
+            self._alive = 0
+            raise StopIteration
+        self.target.send_many_(chunk)
+        self.count += n
+            
 
 cdef class Slice(ConsumerNode):
     """
@@ -203,6 +884,30 @@ cdef class Slice(ConsumerNode):
             self.nxt += self.step
         self.count += 1
         
+    cdef void send_many_(self, object chunk) except *:
+        cdef:
+            Py_ssize_t n=len(chunk), first, end, last
+            object selected
+        if self.nxt >= self.stop > 0:
+            self._alive = 0
+            raise StopIteration
+        end = n
+        if self.stop > 0 and self.count + n > self.stop:
+            end = <Py_ssize_t>self.stop - <Py_ssize_t>self.count
+        first = <Py_ssize_t>self.nxt - <Py_ssize_t>self.count
+        if first < end:
+            selected = chunk[first:end:self.step]
+            self.target.send_many_(selected)
+            self.nxt += len(selected)*self.step
+        if self.nxt >= self.stop > 0:
+            #the item after the last one selected terminates the slice
+            last = <Py_ssize_t>(self.nxt - self.step) - <Py_ssize_t>self.count
+            if last + 1 < n:
+                self.count += last + 1
+                self._alive = 0
+                raise StopIteration
+        self.count += n
+        
         
 cdef class Filter(ConsumerNode):
     """
@@ -230,6 +935,19 @@ cdef class Filter(ConsumerNode):
         except:
             self._alive = 0
             raise
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef object func=self.func
+        if not self._alive:
+            raise StopIteration
+        try:
+            self.target.send_many_([item for item in chunk if func(item)])
+        except:
+            self._alive = 0
+            raise
+        
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
         
 
 cdef class Map(ConsumerNode):
@@ -264,92 +982,824 @@ cdef class Map(ConsumerNode):
         except:
             self._alive = 0
             raise
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef object func=self.func, item
+        if not self._alive:
+            raise StopIteration
+        if self.exc is not None:
+            #catch applies to exceptions from the target too, which can only
+            #be matched to their items when sent one at a time
+            for item in chunk:
+                self.send_(item)
+            return
+        try:
+            self.target.send_many_([func(item) for item in chunk])
+        except:
+            self._alive = 0
+            raise
         
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
         
-cdef class Get(ConsumerNode):
+        
+#marks a key not in a CachedMap's cache
+cdef object CACHE_MISS = object()
+
+
+cdef class CachedMap(ConsumerNode):
     """
-    Get(idx, target) -> Consumer
+    CachedMap(func, target, maxsize=128, key=None, catch=None) -> Consumer
     
-    Items sent into this consumer are sliced using idx as the slicing object. The
-    result is passed on to target.
+    Like Map, but remembers the results of func, so each distinct item is 
+    passed to func once. If key is given, key(item) identifies the item in
+    the cache (so unhashable items can be cached). At most maxsize results
+    are kept, the least recently used being evicted first; if maxsize is 
+    None the cache grows without limit. catch is as for Map; results of 
+    calls which raise are not cached.
     
-    Should I have called this Item?
+    The hits, misses and evictions attributes count the cache lookups, to 
+    help choose maxsize.
     """
-    cdef object selector
-    
-    def __cinit__(self, idx, target):
-        self.selector = idx
-        self.target = check(target)
+    cdef:
+        object func, key, exc
+        dict cache
+        Py_ssize_t maxsize
+        readonly Py_ssize_t hits, misses, evictions
         
-    cdef void send_(self, object item) except *:
-        self.target.send_(item[self.selector])
-    
-    
-cdef class Attr(ConsumerNode):
-    """
-    Attr(name, target) -> Consumer
-    
-    Retrieves the named attribute from objects send into this object and passes
-    them on to the target
-    """
-    cdef object attrname
-    
-    def __cinit__(self, name, target):
-        self.attrname = str(name)
+    def __cinit__(self, func, target, maxsize=128, key=None, catch=None):
+        if not isinstance(func, Callable):
+            raise TypeError("first argument must be a callable")
+        if key is not None and not isinstance(key, Callable):
+            raise TypeError("key must be a callable")
+        if catch is not None:
+            assert issubclass(catch, BaseException)
+        self.func = func
         self.target = check(target)
+        self.key = key
+        self.exc = catch
+        if maxsize is None:
+            self.maxsize = -1
+        else:
+            self.maxsize = maxsize
+            if self.maxsize < 1:
+                raise ValueError("maxsize must be a positive integer or None")
+        self.cache = {}
         
+    property currsize:
+        def __get__(self):
+            return len(self.cache)
+        
+    cdef object lookup_(self, object item):
+        cdef:
+            object k = item if self.key is None else self.key(item)
+            object value
+        if self.maxsize < 0:
+            value = self.cache.get(k, CACHE_MISS)
+        else:
+            #re-inserting a hit moves it to the end of the dict, so the 
+            #first key is always the least recently used
+            value = self.cache.pop(k, CACHE_MISS)
+            if value is not CACHE_MISS:
+                self.cache[k] = value
+        if value is not CACHE_MISS:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = self.func(item)
+        if self.maxsize > 0 and len(self.cache) >= self.maxsize:
+            del self.cache[next(iter(self.cache))]
+            self.evictions += 1
+        self.cache[k] = value
+        return value
+    
     cdef void send_(self, object item) except *:
-        self.target.send_(getattr(item, self.attrname))
+        if not self._alive:
+            raise StopIteration
+        try:
+            self.target.send_(self.lookup_(item))
+        except self.exc:
+            pass
+        except:
+            self._alive = 0
+            raise
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef object item
+        if not self._alive:
+            raise StopIteration
+        if self.exc is not None:
+            #as for Map, catch also applies to the target's exceptions
+            for item in chunk:
+                self.send_(item)
+            return
+        try:
+            self.target.send_many_([self.lookup_(item) for item in chunk])
+        except:
+            self._alive = 0
+            raise
+            
+    def cache_clear(self):
+        """
+        cache_clear()
         
+        Empties the cache. The counters are not reset.
+        """
+        self.cache.clear()
         
-cdef class Unzip(Consumer):
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
+        
+        
+cdef class BatchNode(ConsumerNode):
     """
-    Unzip(*targets) -> Consumer
-    
-    Unpacks sequences or iterables sent into this consumer into the given
-    sequence of target output consumers.
-    
-    If the input object contains more items than there are targets, the 
-    excess items will be discarded. If fewer items are provided, TypeError
-    will be raised.
+    Abstract base class for consumers which collect items into batches of a
+    fixed size and process each batch with a single call to func. The final,
+    partial batch is processed when the consumer is closed or its result is
+    taken.
     """
     cdef:
-        list targets
+        object func
+        list batch
+        Py_ssize_t size
+        bint asarray
         
-    def __cinit__(self, *targets):
-        self.targets = [check(t) for t in targets]
+    def __cinit__(self, func, target, Py_ssize_t size=1024, asarray=False):
+        if not isinstance(func, Callable):
+            raise TypeError("first argument must be a callable")
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        if asarray and numpy is None:
+            raise ImportError("asarray requires numpy")
+        self.func = func
+        self.target = check(target)
+        self.size = size
+        self.asarray = asarray
+        self.batch = []
         
-    cdef object result_(self):
-        cdef Consumer t
-        return tuple([t.result_() for t in self.targets])
+    cdef void process_(self, object batch) except *:
+        raise NotImplementedError
+    
+    cdef object call_(self, object batch):
+        """
+        Returns func(batch), checking the result has one entry per item
+        """
+        out = self.func(batch)
+        if len(out) != len(batch):
+            raise ValueError("%s function returned %d results for a batch of %d items"%(
+                                type(self).__name__, len(out), len(batch)))
+        return out
         
-    cdef void send_(self, object item) except *:
-        cdef:
-            int alive=0
-            Consumer t
-            object this
-            
-        items = iter(item)
+    cdef void flush_(self) except *:
+        cdef list batch=self.batch
+        if not batch:
+            return
+        self.batch = []
         try:
-            for t in self.targets:
-                this = next(items)
-                if t._alive:
-                    try:
-                        t.send_(this)
-                        alive = 1
-                    except StopIteration:
-                        t._alive = 0
-        #StopIteration must have been raised by the items.next() call
-        except StopIteration:
-            raise TypeError("Item length too small. Expecting length %d"%len(self.targets))
-        if alive==0:
+            self.process_(numpy.asarray(batch) if self.asarray else batch)
+        except:
             self._alive = 0
-            raise StopIteration
-        
+            raise
         
-cdef class Factory(object):
-    cdef object factory
-    
+    cdef void send_(self, object item) except *:
+        if not self._alive:
+            raise StopIteration
+        self.batch.append(item)
+        if len(self.batch) >= self.size:
+            self.flush_()
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef Py_ssize_t start, n=len(chunk), size=self.size
+        if not self._alive:
+            raise StopIteration
+        start = size - len(self.batch)
+        if start > n:
+            self.batch.extend(chunk)
+            return
+        self.batch.extend(chunk[:start])
+        self.flush_()
+        while start + size <= n:
+            self.batch = list(chunk[start:start + size])
+            self.flush_()
+            start += size
+        self.batch = list(chunk[start:])
+        
+    cdef object result_(self):
+        if self._alive:
+            try:
+                self.flush_()
+            except StopIteration:
+                pass
+        return self.target.result_()
+    
+    cdef void close_(self):
+        if self._alive:
+            try:
+                self.flush_()
+            except StopIteration:
+                pass
+        self._alive = 0
+        self.target.close_()
+        
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
+    
+    cdef object state_(self):
+        if self._alive:
+            self.flush_()
+        return self.target.state_()
+        
+        
+cdef class MapBatch(BatchNode):
+    """
+    MapBatch(func, target, size=1024, asarray=False) -> Consumer
+    
+    Collects the items sent in into lists of size items and calls func once
+    for each list. func must return a sequence with one result per item, and
+    the results are sent on to target. If asarray is true, func is called 
+    with a numpy array instead of a list. The last, partial batch is 
+    processed when the consumer is closed or its result is taken.
+    """
+    cdef void process_(self, object batch) except *:
+        self.target.send_many_(self.call_(batch))
+        
+        
+cdef class FilterBatch(BatchNode):
+    """
+    FilterBatch(pred, target, size=1024, asarray=False) -> Consumer
+    
+    Collects the items sent in into lists of size items and calls pred once
+    for each list. pred must return a sequence of booleans (a mask) with one
+    entry per item; the items whose entry is true are sent on to target. If 
+    asarray is true, pred is called with a numpy array and the selected
+    items are passed on as an array. The last, partial batch is processed 
+    when the consumer is closed or its result is taken.
+    """
+    cdef void process_(self, object batch) except *:
+        mask = self.call_(batch)
+        if self.asarray:
+            self.target.send_many_(batch[numpy.asarray(mask, dtype=bool)])
+        else:
+            self.target.send_many_([item for item, keep in zip(batch, mask) 
+                                    if keep])
+        
+        
+cdef class Unique(ConsumerNode):
+    """
+    Unique(target, key=None, window=None) -> Consumer
+    
+    Passes on the first occurrence of each item to target, dropping repeats.
+    If key is given, key(item) is used to identify repeats instead of the 
+    item itself.
+    
+    If window is given, only the last window distinct keys are remembered
+    (the least recently seen key is forgotten first), so memory use is 
+    bounded. Repeats more than window distinct keys apart are passed on 
+    again. This suits long streams where repeats are close together.
+    """
+    cdef:
+        object key, seen
+        Py_ssize_t window
+        
+    def __cinit__(self, target, key=None, window=None):
+        if key is not None and not isinstance(key, Callable):
+            raise TypeError("key must be a callable")
+        self.target = check(target)
+        self.key = key
+        if window is None:
+            self.window = 0
+            self.seen = set()
+        else:
+            self.window = window
+            if self.window < 1:
+                raise ValueError("window must be a positive integer")
+            self.seen = OrderedDict()
+            
+    cdef void send_(self, object item) except *:
+        cdef object k = item if self.key is None else self.key(item)
+        if self.window == 0:
+            if k in <set>self.seen:
+                return
+            (<set>self.seen).add(k)
+        else:
+            if k in self.seen:
+                self.seen.move_to_end(k)
+                return
+            self.seen[k] = None
+            if len(self.seen) > self.window:
+                self.seen.popitem(last=False)
+        self.target.send_(item)
+        
+        
+cdef class Get(ConsumerNode):
+    """
+    Get(idx, target) -> Consumer
+    
+    Items sent into this consumer are sliced using idx as the slicing object. The
+    result is passed on to target.
+    
+    Should I have called this Item?
+    """
+    cdef object selector
+    
+    def __cinit__(self, idx, target):
+        self.selector = idx
+        self.target = check(target)
+        
+    cdef void send_(self, object item) except *:
+        self.target.send_(item[self.selector])
+        
+    cdef void send_many_(self, object chunk) except *:
+        cdef object selector=self.selector, item
+        self.target.send_many_([item[selector] for item in chunk])
+        
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
+    
+    
+cdef class Attr(ConsumerNode):
+    """
+    Attr(name, target) -> Consumer
+    
+    Retrieves the named attribute from objects send into this object and passes
+    them on to the target
+    """
+    cdef object attrname
+    
+    def __cinit__(self, name, target):
+        self.attrname = str(name)
+        self.target = check(target)
+        
+    cdef void send_(self, object item) except *:
+        self.target.send_(getattr(item, self.attrname))
+        
+    cdef void send_many_(self, object chunk) except *:
+        cdef object name=self.attrname, item
+        self.target.send_many_([getattr(item, name) for item in chunk])
+        
+    cdef object unmergeable_(self):
+        return self.target.unmergeable_()
+        
+        
+cdef class Unzip(Consumer):
+    """
+    Unzip(*targets) -> Consumer
+    
+    Unpacks sequences or iterables sent into this consumer into the given
+    sequence of target output consumers.
+    
+    If the input object contains more items than there are targets, the 
+    excess items will be discarded. If fewer items are provided, TypeError
+    will be raised.
+    """
+    cdef:
+        list targets, live
+        Py_ssize_t ntargets
+        
+    def __cinit__(self, *targets):
+        cdef Consumer t
+        self.targets = [check(target) for target in targets]
+        self.ntargets = len(self.targets)
+        #indices of the targets still accepting items
+        self.live = [i for i, t in enumerate(self.targets) if t._alive]
+        
+    cdef object result_(self):
+        cdef Consumer t
+        return tuple([t.result_() for t in self.targets])
+        
+    cdef void send_(self, object item) except *:
+        cdef:
+            Py_ssize_t i, j=0
+            list live=self.live
+            Consumer t
+            
+        if type(item) is not tuple and type(item) is not list:
+            item = tuple(islice(item, self.ntargets))
+        if len(item) < self.ntargets:
+            raise TypeError("Item length too small. Expecting length %d"%self.ntargets)
+        while j < len(live):
+            i = live[j]
+            t = <Consumer>self.targets[i]
+            try:
+                t.send_(item[i])
+                j += 1
+            except StopIteration:
+                t._alive = 0
+                del live[j]
+        if not live:
+            self._alive = 0
+            raise StopIteration
+            
+    cdef void close_(self):
+        cdef Consumer t
+        self._alive = 0
+        for t in self.targets:
+            t.close_()
+        
+    cdef object unmergeable_(self):
+        return unmergeable_of(self.targets)
+    
+    cdef object state_(self):
+        cdef Consumer t
+        return tuple([t.state_() for t in self.targets])
+    
+    cdef void merge_state_(self, object state) except *:
+        merge_states(self.targets, state)
+        
+    cdef list children_(self):
+        return list(self.targets)
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        self.targets[i] = child
+        
+        
+cdef class UnzipColumns(Consumer):
+    """
+    UnzipColumns(dtypes, names=None, structured=False) -> Consumer
+    
+    Unpacks sequences sent into this consumer into typed columns, like
+    Unzip into a TypedAppend per field. dtypes gives the type of each field:
+    an array-module typecode or numpy dtype for numerical columns, or "O" 
+    (or object) for a column of Python objects. dtypes may also be a mapping
+    from column name to type. names gives the column names otherwise 
+    (default "f0", "f1", ...). Tuples and lists are indexed directly; other 
+    iterables are unpacked. As for Unzip, excess fields are discarded and 
+    TypeError is raised if an item has too few.
+    
+    The result is a dict mapping each name to a numpy array (a memoryview if
+    numpy is not installed) or, for object columns, a list. If structured 
+    is true, the result is a numpy structured array instead.
+    """
+    cdef:
+        list columns
+        tuple names, dtypes
+        bytes kinds
+        Py_ssize_t ncols
+        bint structured
+        
+    def __cinit__(self, dtypes, names=None, structured=False):
+        if isinstance(dtypes, Mapping):
+            names = list(dtypes)
+            dtypes = list(dtypes.values())
+        self.dtypes = tuple(dtypes)
+        self.ncols = len(self.dtypes)
+        if names is None:
+            names = ["f%d"%i for i in range(self.ncols)]
+        self.names = tuple(names)
+        if len(self.names) != self.ncols:
+            raise ValueError("expected %d names, got %d"%(self.ncols, len(self.names)))
+        if structured and numpy is None:
+            raise TypeError("structured output requires numpy")
+        self.structured = structured
+        self.columns = []
+        kinds = []
+        for dtype in self.dtypes:
+            if dtype is object or dtype == "O":
+                self.columns.append([])
+                kinds.append("O")
+            else:
+                self.columns.append(TypedBuffer(dtype))
+                kinds.append("n")
+        self.kinds = "".join(kinds).encode("ascii")
+        
+    cdef void send_(self, object item) except *:
+        cdef:
+            Py_ssize_t i
+            const char *kinds=self.kinds
+            list columns=self.columns
+        if type(item) is not tuple and type(item) is not list:
+            item = tuple(islice(item, self.ncols))
+        if len(item) < self.ncols:
+            raise TypeError("Item length too small. Expecting length %d"%self.ncols)
+        if type(item) is tuple:
+            for i in range(self.ncols):
+                if kinds[i] == b'O':
+                    (<list>columns[i]).append((<tuple>item)[i])
+                else:
+                    (<TypedBuffer>columns[i]).append_((<tuple>item)[i])
+        else:
+            for i in range(self.ncols):
+                if kinds[i] == b'O':
+                    (<list>columns[i]).append((<list>item)[i])
+                else:
+                    (<TypedBuffer>columns[i]).append_((<list>item)[i])
+                    
+    cdef object result_(self):
+        cdef Py_ssize_t i
+        if self.structured:
+            out = numpy.empty(len(self.columns[0]) if self.ncols else 0, 
+                              dtype=[(name, "O" if self.kinds[i] == b'O' 
+                                      else (<TypedBuffer>self.columns[i]).typecode)
+                                     for i, name in enumerate(self.names)])
+            for i, name in enumerate(self.names):
+                if self.kinds[i] == b'O':
+                    out[name] = self.columns[i]
+                else:
+                    out[name] = (<TypedBuffer>self.columns[i]).asarray()
+            return out
+        return dict([(name, col if self.kinds[i] == b'O' 
+                      else (<TypedBuffer>col).asarray())
+                     for i, (name, col) in enumerate(zip(self.names, self.columns))])
+    
+    
+cdef struct Field:
+    Py_ssize_t offset, size
+    char kind   #b'i' signed, b'u' unsigned, b'f' float, b'?' bool, b's' bytes
+    bint little
+    
+    
+ctypedef fused cnumber:
+    long long
+    unsigned long long
+    double
+    
+    
+cdef int buffer_store(TypedBuffer buffer, cnumber value) except -1:
+    """
+    Appends a C number to buffer, converting it as by a C cast
+    """
+    cdef char *p
+    if buffer.length == buffer.capacity:
+        buffer.reserve_(buffer.length + 1)
+    p = buffer.data + buffer.length*buffer.itemsize
+    if buffer.code == b'd':
+        (<double*>p)[0] = <double>value
+    elif buffer.code == b'q':
+        (<long long*>p)[0] = <long long>value
+    elif buffer.code == b'l':
+        (<long*>p)[0] = <long>value
+    elif buffer.code == b'f':
+        (<float*>p)[0] = <float>value
+    elif buffer.code == b'i':
+        (<int*>p)[0] = <int>value
+    elif buffer.code == b'Q':
+        (<unsigned long long*>p)[0] = <unsigned long long>value
+    elif buffer.code == b'L':
+        (<unsigned long*>p)[0] = <unsigned long>value
+    elif buffer.code == b'I':
+        (<unsigned int*>p)[0] = <unsigned int>value
+    elif buffer.code == b'h':
+        (<short*>p)[0] = <short>value
+    elif buffer.code == b'H':
+        (<unsigned short*>p)[0] = <unsigned short>value
+    elif buffer.code == b'b':
+        (<signed char*>p)[0] = <signed char>value
+    else:
+        (<unsigned char*>p)[0] = <unsigned char>value
+    buffer.length += 1
+    return 0
+
+
+cdef inline uint64_t read_bits(const unsigned char *p, Py_ssize_t size, 
+                               bint little) noexcept nogil:
+    """
+    Reads an unsigned integer of size bytes in the given byte order
+    """
+    cdef:
+        uint64_t value=0
+        Py_ssize_t k
+    if little:
+        for k in range(size - 1, -1, -1):
+            value = (value << 8) | p[k]
+    else:
+        for k in range(size):
+            value = (value << 8) | p[k]
+    return value
+
+
+cdef inline long long read_signed(const unsigned char *p, Py_ssize_t size, 
+                                  bint little) noexcept nogil:
+    cdef uint64_t value=read_bits(p, size, little)
+    if size < 8 and (value >> (8*size - 1)) & 1:
+        value |= (<uint64_t>-1) << (8*size)
+    return <long long>value
+
+
+cdef inline double read_float(const unsigned char *p, Py_ssize_t size, 
+                              bint little) noexcept nogil:
+    cdef:
+        uint64_t bits=read_bits(p, size, little)
+        uint32_t bits32
+        float f
+        double d
+    if size == 4:
+        bits32 = <uint32_t>bits
+        memcpy(&f, &bits32, 4)
+        return f
+    memcpy(&d, &bits, 8)
+    return d
+
+
+cdef list parse_format(str fmt):
+    """
+    Returns a list of (offset, size, kind) for each field of a struct format,
+    with the offsets found using struct.calcsize (so native alignment is 
+    respected), and whether the format is little-endian
+    """
+    cdef:
+        list fields=[]
+        str order="@", prefix, code
+        Py_ssize_t count, i
+    fmt = "".join(fmt.split())
+    if fmt and fmt[0] in "@=<>!":
+        order = fmt[0]
+        fmt = fmt[1:]
+    prefix = order
+    for count_str, code in re.findall(r"(\d*)(.)", fmt):
+        count = int(count_str) if count_str else 1
+        if code == "x":
+            prefix += "%dx"%count
+            continue
+        if code == "s":
+            prefix += "%ds"%count
+            fields.append((calcsize(prefix) - count, count, "s"))
+            continue
+        if code not in "cbB?hHiIlLqQnNfd":
+            raise ValueError("unsupported struct format code %s"%repr(code))
+        for i in range(count):
+            prefix += code
+            size = calcsize(order + code)
+            if code == "c":
+                kind = "s"
+            elif code == "?":
+                kind = "?"
+            elif code in "fd":
+                kind = "f"
+            elif code in "bhilqn":
+                kind = "i"
+            else:
+                kind = "u"
+            fields.append((calcsize(prefix) - size, size, kind))
+    if order in "@=":
+        little = sys_byteorder == "little"
+    else:
+        little = order == "<"
+    return [field + (little,) for field in fields]
+
+
+cdef class Unpack(Consumer):
+    """
+    Unpack(fmt, *targets) -> Consumer
+    
+    Decodes packed binary records, as described by the struct format fmt,
+    and sends each field to the corresponding target (the pad bytes have 
+    no target). Each item sent in is a bytes-like object holding one or
+    more whole records. Fields are decoded in C and sent straight to their
+    targets without building a tuple per record. For TypedAppend targets the
+    values are stored in the target's buffer, converted as by a C cast, 
+    without creating Python objects at all.
+    
+    The supported format codes are x, c, s, ?, b, B, h, H, i, I, l, L, q, Q,
+    n, N, f and d. The result is a tuple of the targets' results.
+    """
+    cdef:
+        list targets, buffers
+        Field *fields
+        Py_ssize_t nfields, size
+        
+    def __cinit__(self, fmt, *targets):
+        cdef:
+            list fields
+            Py_ssize_t i
+        if isinstance(fmt, Struct):
+            fmt = fmt.format
+        fields = parse_format(fmt)
+        self.size = calcsize(fmt)
+        if self.size == 0:
+            raise ValueError("record format has zero size")
+        if len(targets) != len(fields):
+            raise TypeError("format has %d fields, but %d targets were given"%(
+                                len(fields), len(targets)))
+        self.fields = <Field*>PyMem_Malloc(max(len(fields), 1)*sizeof(Field))
+        if self.fields == NULL:
+            raise MemoryError()
+        self.nfields = len(fields)
+        for i, (offset, size, kind, little) in enumerate(fields):
+            self.fields[i].offset = offset
+            self.fields[i].size = size
+            self.fields[i].kind = ord(kind)
+            self.fields[i].little = little
+        self.targets = [check(target) for target in targets]
+        self.buffers = [self.buffer_of_(target) for target in self.targets]
+        
+    def __dealloc__(self):
+        PyMem_Free(self.fields)
+        
+    cdef object buffer_of_(self, Consumer target):
+        """
+        The TypedBuffer to store values in directly, for a TypedAppend target
+        """
+        if type(target) is TypedAppend:
+            return (<TypedAppend>target).buffer
+        return None
+        
+    cdef object result_(self):
+        cdef Consumer t
+        return tuple([t.result_() for t in self.targets])
+    
+    cdef object value_(self, Field *field, const unsigned char *p):
+        p += field.offset
+        if field.kind == b'i':
+            return read_signed(p, field.size, field.little)
+        elif field.kind == b'u':
+            return read_bits(p, field.size, field.little)
+        elif field.kind == b'f':
+            return read_float(p, field.size, field.little)
+        elif field.kind == b'?':
+            return p[0] != 0
+        return PyBytes_FromStringAndSize(<const char*>p, field.size)
+    
+    cdef void store_(self, TypedBuffer buffer, Field *field, 
+                     const unsigned char *p) except *:
+        p += field.offset
+        if field.kind == b'i':
+            buffer_store(buffer, read_signed(p, field.size, field.little))
+        elif field.kind == b'u':
+            buffer_store(buffer, <unsigned long long>read_bits(p, field.size, 
+                                                               field.little))
+        elif field.kind == b'f':
+            buffer_store(buffer, read_float(p, field.size, field.little))
+        elif field.kind == b'?':
+            buffer_store(buffer, <long long>(p[0] != 0))
+        else:
+            raise TypeError("cannot store a bytes field in a TypedAppend")
+        
+    cdef void send_(self, object item) except *:
+        cdef:
+            Py_buffer view
+            const unsigned char *record
+            Py_ssize_t n, r, i, alive
+            Consumer t
+            object buffer
+        PyObject_GetBuffer(item, &view, PyBUF_SIMPLE)
+        try:
+            if view.len % self.size:
+                raise ValueError("buffer length %d is not a multiple of the "
+                                 "record size %d"%(view.len, self.size))
+            n = view.len//self.size
+            for r in range(n):
+                record = <const unsigned char*>view.buf + r*self.size
+                alive = 0
+                for i in range(self.nfields):
+                    t = <Consumer>self.targets[i]
+                    if not t._alive:
+                        continue
+                    buffer = self.buffers[i]
+                    if buffer is not None:
+                        self.store_(<TypedBuffer>buffer, &self.fields[i], record)
+                    else:
+                        try:
+                            t.send_(self.value_(&self.fields[i], record))
+                        except StopIteration:
+                            t._alive = 0
+                            continue
+                    alive = 1
+                if not alive:
+                    self._alive = 0
+                    raise StopIteration
+        finally:
+            PyBuffer_Release(&view)
+            
+    cdef void close_(self):
+        cdef Consumer t
+        self._alive = 0
+        for t in self.targets:
+            t.close_()
+        
+    cdef object unmergeable_(self):
+        return unmergeable_of(self.targets)
+    
+    cdef object state_(self):
+        cdef Consumer t
+        return tuple([t.state_() for t in self.targets])
+    
+    cdef void merge_state_(self, object state) except *:
+        merge_states(self.targets, state)
+        
+    cdef list children_(self):
+        return list(self.targets)
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        self.targets[i] = child
+        self.buffers[i] = self.buffer_of_(child)
+        
+        
+cdef void send_to_group(Consumer group, object item) except *:
+    """
+    Sends item to a group created by a grouping node. A group which raises
+    StopIteration is finished, and later items for it are dropped, so one 
+    finished group does not end the whole pipeline.
+    """
+    if group._alive:
+        try:
+            group.send_(item)
+        except StopIteration:
+            group._alive = 0
+            
+            
+cdef class Factory(object):
+    cdef object factory
+    
     def __cinit__(self, factory):
         assert isinstance(factory, Callable)
         self.factory = factory
@@ -398,15 +1848,202 @@ cdef class GroupByN(ConsumerNode):
         
         
     cdef void send_(self, object item) except *:
-        cdef:
-            object gout, out, output
-    
-        self.this_grp.send_(item)
+        if not self._alive:
+            raise StopIteration
+        send_to_group(self.this_grp, item)
         self.count += 1
         if self.count >= self.n:
-            self.target.send_(self.this_grp.result_())
+            self.this_grp.close_()
+            try:
+                self.target.send_(self.this_grp.result_())
+            except StopIteration:
+                self._alive = 0
+                raise
             self.count = 0
             self.this_grp = self.factory()
+            
+    cdef void close_(self):
+        #the incomplete group is not passed on, but still closed
+        self._alive = 0
+        self.this_grp.close_()
+        self.target.close_()
+    
+    
+cdef enum WindowKind:
+    WINDOW_LIST, WINDOW_SUM, WINDOW_AVE, WINDOW_STATS, WINDOW_MIN, WINDOW_MAX
+    
+    
+cdef class Window(ConsumerNode):
+    """
+    Window(size, step, target, agg=list) -> Consumer
+    
+    Sliding windows over the last size items. Once size items have been 
+    received, and after every step further items, the aggregate of the 
+    current window is sent on to target. agg is one of:
+    
+     * list - the window's items, oldest first
+     * Sum, Ave - the sum or mean of the window
+     * Stats - the (count, mean, std) of the window, as for Stats
+     * Min, Max - the smallest or largest item in the window
+     
+    Each aggregate is updated incrementally as items enter and leave the 
+    window, rather than recomputed from the whole window. Float items are 
+    summed with compensation, so large items leaving the window do not 
+    take the precision of the later sums with them. For example:
+    >>> send(range(6), Window(3, 1, [], agg=Sum))
+    [3, 6, 9, 12]
+    """
+    cdef:
+        Py_ssize_t size, step, count, pos
+        WindowKind kind
+        list ring
+        object total, extremes
+        double mean, M2, fsum, fcomp
+        Py_ssize_t nfloat
+        
+    def __cinit__(self, Py_ssize_t size, Py_ssize_t step, target, agg=list):
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be positive integers")
+        self.target = check(target)
+        self.size = size
+        self.step = step
+        self.count = 0
+        self.pos = 0
+        if agg is list:
+            self.kind = WINDOW_LIST
+        elif agg is Sum:
+            self.kind = WINDOW_SUM
+        elif agg is Ave:
+            self.kind = WINDOW_AVE
+        elif agg is Stats:
+            self.kind = WINDOW_STATS
+        elif agg is Min:
+            self.kind = WINDOW_MIN
+        elif agg is Max:
+            self.kind = WINDOW_MAX
+        else:
+            raise TypeError("agg must be one of list, Sum, Ave, Stats, Min or Max")
+        if self.kind == WINDOW_MIN or self.kind == WINDOW_MAX:
+            #a monotonic deque of (index, item) pairs
+            self.extremes = deque()
+        else:
+            self.ring = []
+        self.total = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        
+    cdef void push_(self, object item) except *:
+        """Adds item to the window, evicting the oldest item if it is full"""
+        cdef:
+            object old
+            bint full=len(self.ring) == self.size
+            double delta, x, mean
+        if full:
+            old = self.ring[self.pos]
+            self.ring[self.pos] = item
+            self.pos = (self.pos + 1) % self.size
+        else:
+            self.ring.append(item)
+        if self.kind == WINDOW_SUM or self.kind == WINDOW_AVE:
+            self.add_(item, 1)
+            if full:
+                self.add_(old, -1)
+        elif self.kind == WINDOW_STATS:
+            x = item
+            delta = x - self.mean
+            self.mean += delta/(len(self.ring) + full)
+            self.M2 += delta*(x - self.mean)
+            if full:
+                #Welford's update in reverse, for the evicted item
+                x = old
+                mean = (self.mean*(self.size + 1) - x)/self.size
+                self.M2 -= (x - self.mean)*(x - mean)
+                self.mean = mean
+                if self.count % self.size == 0:
+                    self.restat_()
+                    
+    cdef void add_(self, object x, int sign) except *:
+        """
+        Adds (sign 1) or subtracts (sign -1) x to the window's total. Floats
+        are kept apart, in a compensated sum.
+        """
+        cdef double v, t
+        if not isinstance(x, float):
+            if sign > 0:
+                self.total += x
+            else:
+                self.total -= x
+            return
+        v = x if sign > 0 else -<double>x
+        #Neumaier's variant of Kahan summation
+        t = self.fsum + v
+        if fabs(self.fsum) >= fabs(v):
+            self.fcomp += (self.fsum - t) + v
+        else:
+            self.fcomp += (v - t) + self.fsum
+        self.fsum = t
+        self.nfloat += sign
+        if self.nfloat == 0:
+            self.fsum = self.fcomp = 0.0
+            
+    cdef void restat_(self) except *:
+        """
+        Recomputes the mean and M2 from the whole window, to stop rounding
+        errors from the incremental updates accumulating. Done once every 
+        size items, so the cost per item stays constant.
+        """
+        cdef:
+            double x, mean=0.0, M2=0.0
+            object item
+        for item in self.ring:
+            mean += <double>item
+        mean /= self.size
+        for item in self.ring:
+            x = <double>item - mean
+            M2 += x*x
+        self.mean = mean
+        self.M2 = M2
+                
+    cdef void send_(self, object item) except *:
+        cdef object extremes=self.extremes
+        self.count += 1
+        if self.kind == WINDOW_MIN:
+            while extremes and extremes[-1][1] > item:
+                extremes.pop()
+            extremes.append((self.count, item))
+            if extremes[0][0] <= self.count - self.size:
+                extremes.popleft()
+        elif self.kind == WINDOW_MAX:
+            while extremes and extremes[-1][1] < item:
+                extremes.pop()
+            extremes.append((self.count, item))
+            if extremes[0][0] <= self.count - self.size:
+                extremes.popleft()
+        else:
+            self.push_(item)
+        if self.count >= self.size and (self.count - self.size) % self.step == 0:
+            self.target.send_(self.current_())
+            
+    cdef object sum_(self):
+        if self.nfloat == 0:
+            return self.total
+        return self.total + (self.fsum + self.fcomp)
+        
+    cdef object current_(self):
+        """The aggregate of the current window"""
+        if self.kind == WINDOW_LIST:
+            return self.ring[self.pos:] + self.ring[:self.pos]
+        elif self.kind == WINDOW_SUM:
+            return self.sum_()
+        elif self.kind == WINDOW_AVE:
+            return self.sum_()/self.size
+        elif self.kind == WINDOW_STATS:
+            #rounding can leave M2 slightly negative when the window's
+            #items are all equal
+            return (self.size, self.mean, 
+                    sqrt(max(self.M2, 0.0)/(self.size - 1)) if self.size > 1 
+                    else 0.0)
+        return self.extremes[0][1]
     
     
 cdef class NULL_OBJ(object):
@@ -422,6 +2059,146 @@ cdef class NULL_OBJ(object):
             return NotImplemented
 
 
+cdef class Sorted(ConsumerNode):
+    """
+    Sorted(target, key=None, memory_limit=64*2**20, max_open=64, dir=None) 
+        -> Consumer
+    
+    Sorts the items sent in (by key(item), if key is given) and sends them
+    on to target, in order, when closed. The sort is stable. Once the items
+    held in memory exceed memory_limit bytes (estimated with sys.getsizeof)
+    they are sorted and written to a temporary file (in dir) as a run. On 
+    close, the runs are merged into target. At most max_open runs are kept;
+    when there are more, the newest runs are merged with others of the same
+    size, so the number of open files stays bounded while each item is only
+    rewritten a logarithmic number of times.
+    
+    Use Sorted ahead of GroupByKey to group unsorted data of any size:
+    >>> send(data, Sorted(GroupByKey(keyfunc, []), key=keyfunc))
+    """
+    cdef:
+        object key, dir
+        list items, runs, levels
+        Py_ssize_t memory_limit, max_open, nbytes, itemsize
+        
+    def __cinit__(self, target, key=None, Py_ssize_t memory_limit=64*2**20, 
+                  Py_ssize_t max_open=64, dir=None):
+        if key is not None and not isinstance(key, Callable):
+            raise TypeError("key must be a callable")
+        if memory_limit < 1:
+            raise ValueError("memory_limit must be a positive number of bytes")
+        if max_open < 2:
+            raise ValueError("max_open must be at least 2")
+        self.target = check(target)
+        self.key = key
+        self.memory_limit = memory_limit
+        self.max_open = max_open
+        self.dir = dir
+        self.items = []
+        self.runs = []
+        self.levels = []
+        self.itemsize = 1
+        
+    cdef void send_(self, object item) except *:
+        if not self._alive:
+            raise StopIteration
+        self.items.append(item)
+        self.nbytes += getsizeof(item) + sizeof(void*)
+        if self.nbytes > self.memory_limit:
+            self.spill_()
+            
+    cdef void send_many_(self, object chunk) except *:
+        if not self._alive:
+            raise StopIteration
+        self.items.extend(chunk)
+        self.nbytes += sum(map(getsizeof, chunk)) + len(chunk)*sizeof(void*)
+        if self.nbytes > self.memory_limit:
+            self.spill_()
+        
+    cdef SpilledSequence write_run_(self, object items):
+        """
+        Writes sorted items to a new run, in blocks small enough for max_open
+        of them to fit in memory_limit
+        """
+        cdef:
+            SpilledSequence run
+            Py_ssize_t block=max(1, (self.memory_limit//self.max_open)//
+                                    self.itemsize)
+            list chunk
+        run = SpilledSequence(self.memory_limit, self.dir)
+        items = iter(items)
+        while True:
+            chunk = list(islice(items, block))
+            if not chunk:
+                break
+            run.tail = chunk
+            run.spill_()
+        return run
+    
+    cdef void spill_(self) except *:
+        cdef: 
+            SpilledSequence run
+            Py_ssize_t n, nruns
+        #the largest size per item of any run so far, which also sizes the 
+        #blocks of runs merged from them
+        self.itemsize = max(self.itemsize, 
+                            self.nbytes//max(len(self.items), 1), 1)
+        self.items.sort(key=self.key)
+        self.runs.append(self.write_run_(self.items))
+        self.levels.append(0)
+        self.items = []
+        self.nbytes = 0
+        nruns = len(self.runs)
+        if nruns < self.max_open:
+            return
+        #each run has a level, the number of merges its items have been
+        #through, which never increases from the oldest run to the newest.
+        #Only the newest runs at the lowest level are merged, or if there is 
+        #one of those, together with those at the level above. The merged 
+        #runs are adjacent, so the merge stays stable.
+        n = 1
+        while n < nruns and self.levels[nruns - n - 1] == self.levels[nruns - 1]:
+            n += 1
+        if n == 1:
+            n = 2
+            while (n < nruns and 
+                   self.levels[nruns - n - 1] == self.levels[nruns - 2]):
+                n += 1
+        merged = self.write_run_(heap_merge(*self.runs[nruns - n:], 
+                                            key=self.key))
+        for run in self.runs[nruns - n:]:
+            run.close()
+        self.runs[nruns - n:] = [merged]
+        self.levels[nruns - n:] = [self.levels[nruns - n] + 1]
+        
+    cdef void close_(self):
+        cdef:
+            SpilledSequence run
+            list chunk
+        if self._alive:
+            self._alive = 0
+            self.items.sort(key=self.key)
+            if self.runs:
+                items = heap_merge(*self.runs, self.items, key=self.key)
+            else:
+                items = iter(self.items)
+            try:
+                while True:
+                    chunk = list(islice(items, PREFETCH_CHUNKSIZE))
+                    if not chunk:
+                        break
+                    self.target.send_many_(chunk)
+            except StopIteration:
+                pass
+            finally:
+                for run in self.runs:
+                    run.close()
+                self.runs = []
+                self.levels = []
+                self.items = []
+        self.target.close_()
+        
+        
 cdef class GroupByKey(ConsumerNode):
     """
     GroupByKey(keyfunc, target, factory=list) -> Consumer
@@ -477,26 +2254,234 @@ cdef class GroupByKey(ConsumerNode):
         if key==self.thiskey:
             pass
         else:
-            self.target.send_(self.this_grp.result_())
+            self.this_grp.close_()
+            try:
+                self.target.send_(self.this_grp.result_())
+            except StopIteration:
+                self._alive = 0
+                raise
             self.this_grp = self.factory()
-        self.this_grp.send_(item)
+        send_to_group(self.this_grp, item)
         self.thiskey = key
 
     cdef void close_(self):
-        self.target.send_(self.this_grp.result_())
-        self._alive = 0
+        if self._alive:
+            #the last group is only sent on if the target is still running
+            self._alive = 0
+            self.this_grp.close_()
+            try:
+                self.target.send_(self.this_grp.result_())
+            except StopIteration:
+                pass
+        self.target.close_()
+        
+        
+cdef class TimeWindow(ConsumerNode):
+    """
+    TimeWindow(timefunc, width, target, factory=list, allowed_lateness=0) 
+        -> Consumer
+    
+    Tumbling time windows. timefunc(item) gives the time of each item, and 
+    items are grouped into windows [start, start + width) where start is a 
+    multiple of width. Each group is created by calling factory, as for 
+    GroupByKey.
+    
+    The watermark is the latest time seen, less allowed_lateness. When the
+    watermark passes the end of a window, the window is finished and 
+    (start, result) is sent on to target, so only open windows are held in
+    memory. Items may arrive out of order by up to allowed_lateness; later
+    items, whose window has already been sent on, are dropped and counted 
+    by the late attribute. Open windows are sent on when the consumer is 
+    closed.
+    """
+    cdef:
+        object timefunc, factory, width, lateness, watermark, horizon
+        dict windows
+        readonly Py_ssize_t late
+        
+    def __cinit__(self, timefunc, width, target, factory=list, 
+                  allowed_lateness=0):
+        if not isinstance(timefunc, Callable):
+            raise TypeError("timefunc must be a callable")
+        if not width > 0:
+            raise ValueError("width must be positive")
+        self.timefunc = timefunc
+        self.width = width
+        self.target = check(target)
+        self.factory = Factory(factory)
+        self.lateness = allowed_lateness
+        self.windows = {}
+        self.watermark = None
+        self.horizon = None
+        self.late = 0
+        
+    cdef void send_(self, object item) except *:
+        cdef Consumer grp
+        if not self._alive:
+            raise StopIteration
+        t = self.timefunc(item)
+        start = (t//self.width)*self.width
+        end = start + self.width
+        if self.watermark is not None and end <= self.watermark:
+            self.late += 1
+            return
+        grp = self.windows.get(start)
+        if grp is None:
+            grp = self.windows[start] = self.factory()
+            if self.horizon is None or end < self.horizon:
+                self.horizon = end
+        send_to_group(grp, item)
+        if self.watermark is None or t - self.lateness > self.watermark:
+            self.watermark = t - self.lateness
+            if self.horizon <= self.watermark:
+                self.flush_(self.watermark)
+            
+    cdef void flush_(self, object watermark) except *:
+        """Sends on all windows which end at or before watermark (or all 
+        windows, if watermark is None) in time order"""
+        cdef Consumer grp
+        for start in sorted(self.windows):
+            if watermark is not None and start + self.width > watermark:
+                self.horizon = start + self.width
+                return
+            grp = self.windows.pop(start)
+            grp.close_()
+            try:
+                self.target.send_((start, grp.result_()))
+            except StopIteration:
+                self._alive = 0
+                raise
+        self.horizon = None
+        
+    cdef void close_(self):
+        if self._alive:
+            try:
+                self.flush_(None)
+            except StopIteration:
+                pass
+            self._alive = 0
+        self.target.close_()
+            
+            
+cdef class SessionWindow(ConsumerNode):
+    """
+    SessionWindow(timefunc, gap, target, factory=list, allowed_lateness=0)
+        -> Consumer
+    
+    Session windows. timefunc(item) gives the time of each item, and items
+    closer together in time than gap belong to the same session. Each 
+    session's group is created by calling factory, as for GroupByKey. An 
+    item which joins two sessions merges their groups, so the groups must 
+    support merge() if items can arrive out of order.
+    
+    The watermark is the latest time seen, less allowed_lateness. When the 
+    watermark is more than gap after the end of a session, the session is 
+    finished and (start, end, result) is sent on to target, where start and
+    end are the times of the session's first and last items. Items which 
+    arrive too late to join an open session, and would have joined a 
+    finished one, are dropped and counted by the late attribute. Open 
+    sessions are sent on when the consumer is closed.
+    """
+    cdef:
+        object timefunc, factory, gap, lateness, watermark
+        list sessions
+        readonly Py_ssize_t late
+        
+    def __cinit__(self, timefunc, gap, target, factory=list, 
+                  allowed_lateness=0):
+        if not isinstance(timefunc, Callable):
+            raise TypeError("timefunc must be a callable")
+        if not gap > 0:
+            raise ValueError("gap must be positive")
+        self.timefunc = timefunc
+        self.gap = gap
+        self.target = check(target)
+        self.factory = Factory(factory)
+        self.lateness = allowed_lateness
+        self.sessions = []
+        self.watermark = None
+        self.late = 0
+        
+    cdef void send_(self, object item) except *:
+        cdef:
+            list session, found=[], sessions=self.sessions
+            Py_ssize_t i, pos=len(sessions)
+        if not self._alive:
+            raise StopIteration
+        t = self.timefunc(item)
+        #sessions are kept in time order, as [start, end, group] lists
+        for i in range(len(sessions)):
+            session = sessions[i]
+            if t < session[0] - self.gap:
+                pos = i
+                break
+            if t <= session[1] + self.gap:
+                found.append(session)
+        if not found:
+            if self.watermark is not None and t + self.gap < self.watermark:
+                self.late += 1
+                return
+            session = [t, t, self.factory()]
+            sessions.insert(pos, session)
+        else:
+            session = found[0]
+            for other in found[1:]:
+                (<Consumer>session[2]).merge(other[2])
+                session[1] = other[1]
+                sessions.remove(other)
+            if t < session[0]:
+                session[0] = t
+            if t > session[1]:
+                session[1] = t
+        send_to_group(session[2], item)
+        if self.watermark is None or t - self.lateness > self.watermark:
+            self.watermark = t - self.lateness
+            self.flush_(self.watermark)
+            
+    cdef void flush_(self, object watermark) except *:
+        """Sends on all sessions which finished before watermark (or all 
+        sessions, if watermark is None) in time order"""
+        cdef:
+            list session
+            Consumer grp
+        while self.sessions:
+            session = self.sessions[0]
+            if watermark is not None and session[1] + self.gap >= watermark:
+                return
+            del self.sessions[0]
+            grp = session[2]
+            grp.close_()
+            try:
+                self.target.send_((session[0], session[1], grp.result_()))
+            except StopIteration:
+                self._alive = 0
+                raise
+            
+    cdef void close_(self):
+        if self._alive:
+            try:
+                self.flush_(None)
+            except StopIteration:
+                pass
+            self._alive = 0
+        self.target.close_()
         
         
 cdef class Switch(Consumer):
     cdef:
         tuple targets
+        list live
+        Py_ssize_t nalive
         object func
         
     def __cinit__(self, func, *targets):
+        cdef Consumer t
         if not isinstance(func, Callable):
             raise TypeError("Fist argument must be a callable returning an int")
         self.func = func
-        self.targets = tuple([check(t) for t in targets])
+        self.targets = tuple([check(target) for target in targets])
+        self.live = [t if t._alive else None for t in self.targets]
+        self.nalive = len(self.live) - self.live.count(None)
         
     cdef object result_(self):
         cdef Consumer t
@@ -507,8 +2492,45 @@ cdef class Switch(Consumer):
             int i
             Consumer target
         i = self.func(item)
-        target = self.targets[i]
-        target.send_(item)
+        #finished targets are replaced by None
+        target = self.live[i]
+        if target is None:
+            return
+        try:
+            target.send_(item)
+        except StopIteration:
+            target._alive = 0
+            self.live[i] = None
+            self.nalive -= 1
+            if self.nalive == 0:
+                self._alive = 0
+                raise
+            
+    cdef void close_(self):
+        cdef Consumer t
+        self._alive = 0
+        for t in self.targets:
+            t.close_()
+        
+    cdef object unmergeable_(self):
+        return unmergeable_of(self.targets)
+    
+    cdef object state_(self):
+        cdef Consumer t
+        return tuple([t.state_() for t in self.targets])
+    
+    cdef void merge_state_(self, object state) except *:
+        merge_states(self.targets, state)
+        
+    cdef list children_(self):
+        return list(self.targets)
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        cdef list targets = list(self.targets)
+        targets[i] = child
+        self.targets = tuple(targets)
+        if self.live[i] is not None:
+            self.live[i] = child
         
         
 cdef class SwitchByKey(Consumer):
@@ -532,16 +2554,53 @@ cdef class SwitchByKey(Consumer):
         return dict([(k,(<Consumer>self.output[k]).result_()) for k in self.output])
         
     cdef void send_(self, item) except *:
+        cdef Consumer target
         if self.func is None:
-            (<Consumer>self.output[item]).send_(item)
+            target = self.output[item]
         else:
-            (<Consumer>self.output[self.func(item)]).send_(item)
+            target = self.output[self.func(item)]
+        #items for finished keys are dropped
+        send_to_group(target, item)
+        
+    cdef void close_(self):
+        cdef Consumer t
+        self._alive = 0
+        for t in self.output.values():
+            t.close_()
+            
+    cdef object unmergeable_(self):
+        node = unmergeable_of(self.output.values())
+        if node is None:
+            #check a consumer as made by the factory for keys not yet seen
+            node = (<Consumer>self.output.default_factory()).unmergeable_()
+        return node
+    
+    cdef object state_(self):
+        return dict([(k,(<Consumer>self.output[k]).state_()) for k in self.output])
+    
+    cdef void merge_state_(self, object state) except *:
+        for k in state:
+            (<Consumer>self.output[k]).merge_state_(state[k])
     
     
 ##############################################################################
 ###Aggregate functions: min, max, sum, count, ave, std, first, last, select###
 ##############################################################################
 
+cdef object as_array(object chunk):
+    """
+    Returns chunk as a numpy array if it is an array or other buffer-protocol
+    object and numpy is installed, otherwise None
+    """
+    if numpy is None:
+        return None
+    if isinstance(chunk, numpy.ndarray):
+        return chunk
+    if PyObject_CheckBuffer(chunk) and not isinstance(chunk, (bytes, bytearray)):
+        return numpy.asarray(chunk)
+    return None
+
+
 cdef class Aggregate(Consumer):
     cdef object output
     
@@ -551,29 +2610,109 @@ cdef class Aggregate(Consumer):
     cdef object result_(self):
         return self.output
     
+    cdef object state_(self):
+        return self.output
+    
     
 cdef class All(Aggregate):
+    """
+    All() -> Consumer
+    
+    Result is True if all items are true. Raises StopIteration once a false
+    item is seen.
+    """
     def __cinit__(self):
         self.output = True
     
     cdef void send_(self, item) except *:
+        if not self._alive:
+            raise StopIteration
         if not item:
             self.output = False
+            self._alive = 0
+            raise StopIteration
+            
+    cdef void send_many_(self, object chunk) except *:
+        if not self._alive:
+            raise StopIteration
+        arr = as_array(chunk)
+        if arr is None:
+            if all(chunk):
+                return
+        elif arr.all():
+            return
+        self.output = False
+        self._alive = 0
+        raise StopIteration
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if not state:
+            self.output = False
+            self._alive = 0
             
 
 cdef class Any(Aggregate):
+    """
+    Any() -> Consumer
+    
+    Result is True if any item is true. Raises StopIteration once a true 
+    item is seen.
+    """
     def __cinit__(self):
         self.output = False
     
     cdef void send_(self, item) except *:
+        if not self._alive:
+            raise StopIteration
         if item:
             self.output = True
+            self._alive = 0
+            raise StopIteration
+            
+    cdef void send_many_(self, object chunk) except *:
+        if not self._alive:
+            raise StopIteration
+        arr = as_array(chunk)
+        if arr is None:
+            if not any(chunk):
+                return
+        elif not arr.any():
+            return
+        self.output = True
+        self._alive = 0
+        raise StopIteration
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if state:
+            self.output = True
+            self._alive = 0
 
 
 cdef class Min(Aggregate):
     cdef void send_(self, item) except *:
         if item < self.output:
             self.output = item
+            
+    cdef void send_many_(self, object chunk) except *:
+        arr = as_array(chunk)
+        if arr is None:
+            if len(chunk):
+                self.send_(min(chunk))
+        elif arr.size:
+            self.send_(arr.min().item())
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if not isinstance(state, NULL_OBJ):
+            self.send_(state)
 
 
 cdef class Max(Aggregate):
@@ -581,11 +2720,40 @@ cdef class Max(Aggregate):
         if item > self.output:
             self.output = item
             
+    cdef void send_many_(self, object chunk) except *:
+        arr = as_array(chunk)
+        if arr is None:
+            if len(chunk):
+                self.send_(max(chunk))
+        elif arr.size:
+            self.send_(arr.max().item())
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if not isinstance(state, NULL_OBJ):
+            self.send_(state)
+            
             
 cdef class Sum(Aggregate):
     cdef void send_(self, item) except *:
         self.output += item
         
+    cdef void send_many_(self, object chunk) except *:
+        arr = as_array(chunk)
+        if arr is None:
+            Aggregate.send_many_(self, chunk)
+        elif arr.size:
+            self.output += arr.sum().item()
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if not isinstance(state, NULL_OBJ):
+            self.output += state
+        
         
 cdef class Count(Aggregate):
     cdef unsigned int count
@@ -595,10 +2763,153 @@ cdef class Count(Aggregate):
     
     cdef void send_(self, item) except *:
         self.count += 1
+        
+    cdef void send_many_(self, object chunk) except *:
+        #count the elements of an array, as the other aggregates see them,
+        #rather than its rows
+        arr = as_array(chunk)
+        if arr is None:
+            self.count += len(chunk)
+        else:
+            self.count += arr.size
             
     cdef object result_(self):
         return self.count
     
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return self.count
+    
+    cdef void merge_state_(self, object state) except *:
+        self.count += state
+    
+    
+cdef inline uint64_t mix64(uint64_t x) noexcept:
+    """The splitmix64 finaliser"""
+    x ^= x >> 30
+    x *= 0xbf58476d1ce4e5b9ULL
+    x ^= x >> 27
+    x *= 0x94d049bb133111ebULL
+    x ^= x >> 31
+    return x
+
+
+cdef uint64_t hash_bytes(const char *data, Py_ssize_t n) noexcept:
+    """FNV-1a hash of n bytes"""
+    cdef: 
+        uint64_t h=0xcbf29ce484222325ULL
+        Py_ssize_t i
+    for i in range(n):
+        h = (h ^ <uint8_t>data[i])*0x100000001b3ULL
+    return mix64(h)
+
+
+cdef uint64_t hash64(object item) except? 0:
+    """
+    A well-mixed 64-bit hash of item. str and bytes are hashed from their 
+    contents, so their hashes don't depend on PYTHONHASHSEED and sketches 
+    from different processes can be merged. Other objects use hash().
+    """
+    cdef: 
+        const char *data
+        Py_ssize_t n
+    if type(item) is str:
+        data = PyUnicode_AsUTF8AndSize(item, &n)
+        return hash_bytes(data, n)
+    elif type(item) is bytes:
+        return hash_bytes(PyBytes_AS_STRING(item), PyBytes_GET_SIZE(item))
+    return mix64(<uint64_t>hash(item))
+
+
+cdef class ApproxCountDistinct(Aggregate):
+    """
+    ApproxCountDistinct(precision=14, key=None) -> Consumer
+    
+    Aggregate Consumer. Estimates the number of distinct items (or distinct 
+    values of key(item), if key is given) using a HyperLogLog sketch. The
+    sketch uses 2**precision bytes, whatever the number of items, and the 
+    typical relative error is 1.04/sqrt(2**precision) (0.8% at the default
+    precision). precision must be between 4 and 18.
+    """
+    cdef:
+        uint8_t *registers
+        int precision
+        Py_ssize_t m
+        object key
+        
+    def __cinit__(self, int precision=14, key=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        if key is not None and not isinstance(key, Callable):
+            raise TypeError("key must be a callable")
+        self.precision = precision
+        self.key = key
+        self.m = 1 << precision
+        self.registers = <uint8_t*>PyMem_Malloc(self.m)
+        if self.registers == NULL:
+            raise MemoryError()
+        memset(self.registers, 0, self.m)
+        
+    def __dealloc__(self):
+        PyMem_Free(self.registers)
+        
+    cdef void send_(self, item) except *:
+        cdef:
+            uint64_t h
+            Py_ssize_t idx
+            uint8_t rank=1, maxrank=65 - self.precision
+        h = hash64(item if self.key is None else self.key(item))
+        idx = h >> (64 - self.precision)
+        h <<= self.precision
+        while rank < maxrank and not (h & (1ULL << 63)):
+            h <<= 1
+            rank += 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+            
+    cdef object result_(self):
+        cdef: 
+            double total=0.0, alpha, estimate
+            Py_ssize_t i, zeros=0
+        for i in range(self.m):
+            total += 1.0/(1ULL << self.registers[i])
+            if self.registers[i] == 0:
+                zeros += 1
+        if self.m == 16:
+            alpha = 0.673
+        elif self.m == 32:
+            alpha = 0.697
+        elif self.m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213/(1.0 + 1.079/self.m)
+        estimate = alpha*self.m*self.m/total
+        if estimate <= 2.5*self.m and zeros > 0:
+            #small range correction (linear counting)
+            estimate = self.m*log(<double>self.m/zeros)
+        return int(estimate + 0.5)
+    
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return (self.precision, (<char*>self.registers)[:self.m])
+    
+    cdef void merge_state_(self, object state) except *:
+        cdef:
+            bytes registers
+            Py_ssize_t i
+            const uint8_t *other
+        precision, registers = state
+        if precision != self.precision:
+            raise ValueError("cannot merge sketches of different precision")
+        other = <const uint8_t*>PyBytes_AS_STRING(registers)
+        for i in range(self.m):
+            if other[i] > self.registers[i]:
+                self.registers[i] = other[i]
+    
     
 cdef class Ave(Aggregate):
     cdef unsigned int count
@@ -611,6 +2922,28 @@ cdef class Ave(Aggregate):
         self.count += 1
         self.output += (item-self.output)/self.count
         
+    cdef void send_many_(self, object chunk) except *:
+        arr = as_array(chunk)
+        if arr is None:
+            Aggregate.send_many_(self, chunk)
+        elif arr.size:
+            self.combine_(arr.size, arr.mean().item())
+            
+    cdef void combine_(self, unsigned int n, object mean):
+        if n == 0:
+            return
+        self.count += n
+        self.output += (mean - self.output)*n/self.count
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return (self.count, self.output)
+    
+    cdef void merge_state_(self, object state) except *:
+        self.combine_(state[0], state[1])
+        
         
 cdef class Stats(Aggregate):
     """
@@ -634,22 +2967,383 @@ cdef class Stats(Aggregate):
         delta = item - self.mean
         self.mean += delta/self.n
         self.M2 += delta*(item - self.mean)
+        
+    cdef void combine_(self, unsigned int n, double mean, double M2):
+        """
+        Combines the count, mean and sum of squared deviations of another
+        set of values with the running state (Chan et al.'s parallel update)
+        """
+        cdef:
+            unsigned int total=self.n + n
+            double delta=mean - self.mean
+        if n == 0:
+            return
+        self.mean += delta*n/total
+        self.M2 += M2 + delta*delta*(<double>self.n)*n/total
+        self.n = total
+        
+    cdef void send_many_(self, object chunk) except *:
+        arr = as_array(chunk)
+        if arr is None:
+            Aggregate.send_many_(self, chunk)
+        elif arr.size:
+            mean = arr.mean()
+            dev = arr - mean
+            self.combine_(arr.size, mean, (dev*dev).sum())
+            
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return (self.n, self.mean, self.M2)
+    
+    cdef void merge_state_(self, object state) except *:
+        self.combine_(state[0], state[1], state[2])
+    
+    cdef object result_(self):
+        return (self.n, self.mean, sqrt(self.M2/(self.n - 1)))
+    
     
+cdef struct Centroid:
+    double mean
+    double weight
+    
+    
+cdef int compare_centroids(const void *a, const void *b) noexcept nogil:
+    cdef double x=(<const Centroid*>a).mean, y=(<const Centroid*>b).mean
+    return (x > y) - (x < y)
+
+
+cdef class Quantiles(Aggregate):
+    """
+    Quantiles(qs, compression=100) -> Consumer
+    
+    Aggregate Consumer. Estimates quantiles of numerical input using a 
+    merging t-digest, in memory bounded by the compression parameter. 
+    Larger values of compression give more accurate estimates, at the cost 
+    of more memory. Accuracy is best towards the tails (q near 0 or 1).
+    
+    qs is a quantile (between 0 and 1) or a sequence of quantiles. The 
+    result is the estimated value at each quantile, as a float or a tuple
+    of floats. NaN input values are ignored.
+    """
+    cdef:
+        Centroid *centroids
+        Py_ssize_t ncentroids, nbuffered, capacity
+        double compression, total, minimum, maximum
+        tuple qs
+        bint scalar
+        
+    def __cinit__(self, qs, double compression=100):
+        if compression < 10:
+            raise ValueError("compression must be at least 10")
+        self.scalar = not isinstance(qs, (tuple, list))
+        self.qs = (float(qs),) if self.scalar else tuple([float(q) for q in qs])
+        for q in self.qs:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError("quantiles must be between 0 and 1")
+        self.compression = compression
+        self.capacity = <Py_ssize_t>(7*compression) + 10
+        self.centroids = <Centroid*>PyMem_Malloc(self.capacity*sizeof(Centroid))
+        if self.centroids == NULL:
+            raise MemoryError()
+        self.ncentroids = 0
+        self.nbuffered = 0
+        self.total = 0.0
+        
+    def __dealloc__(self):
+        PyMem_Free(self.centroids)
+        
+    cdef void add_(self, double value, double weight):
+        cdef Centroid *c
+        if value != value:
+            return
+        if self.ncentroids + self.nbuffered == self.capacity:
+            self.compress_()
+        c = &self.centroids[self.ncentroids + self.nbuffered]
+        c.mean = value
+        c.weight = weight
+        self.nbuffered += 1
+        if self.total == 0.0 or value < self.minimum:
+            self.minimum = value
+        if self.total == 0.0 or value > self.maximum:
+            self.maximum = value
+        self.total += weight
+        
+    cdef void compress_(self):
+        """
+        Sorts the centroids and buffered values together and merges 
+        neighbours, as long as each merged centroid spans no more than one 
+        unit of the k1 scale function
+        """
+        cdef:
+            Centroid *c=self.centroids
+            Centroid current
+            Py_ssize_t i, n=self.ncentroids + self.nbuffered, out=0
+            double so_far=0.0, limit, proposed
+            double scale=self.compression/(2*M_PI)
+        if self.nbuffered == 0:
+            return
+        qsort(c, n, sizeof(Centroid), compare_centroids)
+        current = c[0]
+        limit = (sin((scale*asin(-1.0) + 1)/scale) + 1)/2
+        for i in range(1, n):
+            proposed = current.weight + c[i].weight
+            if (so_far + proposed)/self.total <= limit:
+                current.mean += (c[i].mean - current.mean)*c[i].weight/proposed
+                current.weight = proposed
+            else:
+                c[out] = current
+                out += 1
+                so_far += current.weight
+                limit = so_far/self.total
+                if limit < 1.0:
+                    limit = (sin((scale*asin(2*limit - 1) + 1)/scale) + 1)/2
+                current = c[i]
+        c[out] = current
+        self.ncentroids = out + 1
+        self.nbuffered = 0
+        
+    cdef double quantile_(self, double q):
+        cdef:
+            Centroid *c=self.centroids
+            Py_ssize_t i, n=self.ncentroids
+            double target=q*self.total, cumulative=0.0, left, right
+        if n == 1:
+            return c[0].mean
+        if target < c[0].weight/2:
+            return self.minimum + (c[0].mean - self.minimum)*target/(c[0].weight/2)
+        for i in range(n - 1):
+            left = cumulative + c[i].weight/2
+            right = cumulative + c[i].weight + c[i+1].weight/2
+            if target <= right:
+                return c[i].mean + (c[i+1].mean - c[i].mean)*(target - left)/(right - left)
+            cumulative += c[i].weight
+        left = self.total - c[n-1].weight/2
+        return c[n-1].mean + (self.maximum - c[n-1].mean)*(target - left)/(c[n-1].weight/2)
+        
+    cdef void send_(self, item) except *:
+        self.add_(item, 1.0)
+        
+    cdef void send_many_(self, object chunk) except *:
+        cdef:
+            double[::1] values
+            Py_ssize_t i
+        arr = as_array(chunk)
+        if arr is None:
+            Aggregate.send_many_(self, chunk)
+            return
+        values = numpy.ascontiguousarray(arr, dtype=numpy.float64).ravel()
+        for i in range(values.shape[0]):
+            self.add_(values[i], 1.0)
+        
+    cdef object result_(self):
+        cdef double q
+        self.compress_()
+        if self.ncentroids == 0:
+            out = tuple([float("nan") for q in self.qs])
+        else:
+            out = tuple([self.quantile_(q) for q in self.qs])
+        return out[0] if self.scalar else out
+    
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        cdef Py_ssize_t i
+        self.compress_()
+        return (self.minimum, self.maximum,
+                [(self.centroids[i].mean, self.centroids[i].weight) 
+                 for i in range(self.ncentroids)])
+    
+    cdef void merge_state_(self, object state) except *:
+        minimum, maximum, centroids = state
+        if not centroids:
+            return
+        empty = self.total == 0.0
+        for mean, weight in centroids:
+            self.add_(mean, weight)
+        if empty or minimum < self.minimum:
+            self.minimum = minimum
+        if empty or maximum > self.maximum:
+            self.maximum = maximum
+            
+    
+cdef class TopK(Aggregate):
+    """
+    TopK(k, key=None, largest=True) -> Consumer
+    
+    Aggregate Consumer. Keeps the k largest items (or the k smallest, if 
+    largest is False) in a heap, ranked by key(item) if key is given. Items
+    which can't enter a full heap are rejected with a single comparison. 
+    The result is a list of the items, best first. Of equally ranked items, 
+    the first ones seen are kept.
+    """
+    cdef:
+        Py_ssize_t k
+        list keys, items
+        object key
+        bint largest
+        
+    def __cinit__(self, Py_ssize_t k, key=None, largest=True):
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        if key is not None and not isinstance(key, Callable):
+            raise TypeError("key must be a callable")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.keys = []
+        self.items = []
+        
+    cdef inline bint worse_(self, object a, object b) except -1:
+        """True if a key of a ranks below a key of b"""
+        if self.largest:
+            return a < b
+        return a > b
+    
+    cdef void push_(self, object k, object item) except *:
+        cdef:
+            list keys=self.keys, items=self.items
+            Py_ssize_t i, child, parent, n=len(keys)
+        if n < self.k:
+            #sift the new item up from the end
+            keys.append(k)
+            items.append(item)
+            i = n
+            while i > 0:
+                parent = (i - 1) >> 1
+                if not self.worse_(k, keys[parent]):
+                    break
+                keys[i] = keys[parent]
+                items[i] = items[parent]
+                i = parent
+        elif self.worse_(keys[0], k):
+            #replace the root and sift down
+            i = 0
+            while True:
+                child = 2*i + 1
+                if child >= n:
+                    break
+                if child + 1 < n and self.worse_(keys[child + 1], keys[child]):
+                    child += 1
+                if not self.worse_(keys[child], k):
+                    break
+                keys[i] = keys[child]
+                items[i] = items[child]
+                i = child
+        else:
+            return
+        keys[i] = k
+        items[i] = item
+        
+    cdef void send_(self, item) except *:
+        self.push_(item if self.key is None else self.key(item), item)
+        
+    cdef object result_(self):
+        cdef list keys=self.keys, items=self.items
+        order = sorted(range(len(keys)), key=keys.__getitem__, 
+                       reverse=self.largest)
+        return [items[i] for i in order]
+    
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        return (self.keys, self.items)
+    
+    cdef void merge_state_(self, object state) except *:
+        for k, item in zip(*state):
+            self.push_(k, item)
+            
+            
+cdef class BottomK(TopK):
+    """
+    BottomK(k, key=None) -> Consumer
+    
+    Aggregate Consumer. Keeps the k smallest items, ranked by key(item) if 
+    key is given. The result is a list of the items, smallest first. 
+    Equivalent to TopK(k, key, largest=False).
+    """
+    def __cinit__(self, Py_ssize_t k, key=None):
+        self.largest = False
+        
+        
+cdef class Sample(Aggregate):
+    """
+    Sample(k, seed=None) -> Consumer
+    
+    Aggregate Consumer. Collects a uniform random sample of k items from 
+    its input (or all the items, if there are fewer than k), using reservoir
+    sampling with Li's Algorithm L. Random numbers are only drawn for items
+    which enter the sample, so most items cost a counter decrement. seed 
+    initialises the random number generator, for repeatable samples. The 
+    result is a list of the sampled items.
+    """
+    cdef:
+        Py_ssize_t k, skip
+        double w
+        list reservoir
+        object rng
+        
+    def __cinit__(self, Py_ssize_t k, seed=None):
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        self.k = k
+        self.reservoir = []
+        self.rng = Random(seed)
+        
+    cdef double uniform_(self) except? -1.0:
+        """A random number in the interval (0, 1]"""
+        return 1.0 - self.rng.random()
+        
+    cdef void next_(self) except *:
+        """Draws the weight for the next replacement and the number of items
+        to skip before it"""
+        self.w *= exp(log(self.uniform_())/self.k)
+        self.skip = <Py_ssize_t>floor(log(self.uniform_())/log(1.0 - self.w))
+        
+    cdef void send_(self, item) except *:
+        if self.skip > 0:
+            self.skip -= 1
+        elif len(self.reservoir) < self.k:
+            self.reservoir.append(item)
+            if len(self.reservoir) == self.k:
+                self.w = 1.0
+                self.next_()
+        else:
+            self.reservoir[<Py_ssize_t>((1.0 - self.uniform_())*self.k)] = item
+            self.next_()
+            
     cdef object result_(self):
-        return (self.n, self.mean, sqrt(self.M2/(self.n - 1)))
+        return list(self.reservoir)
     
     
 cdef class First(Aggregate):
+    """
+    First() -> Consumer
+    
+    Result is the first item sent. Raises StopIteration once it has been 
+    received.
+    """
     cdef void send_(self, item) except *:
-        if self._alive != 1:
+        if self._alive:
             self.output = item
             self._alive = 0
+        raise StopIteration
             
             
 cdef class Last(Aggregate):
     cdef void send_(self, item) except *:
         self.output = item
         
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef void merge_state_(self, object state) except *:
+        if not isinstance(state, NULL_OBJ):
+            self.output = state
+        
 
 cdef class Select(Aggregate):
     cdef:
@@ -664,17 +3358,208 @@ cdef class Select(Aggregate):
         self.transform = transform
             
     cdef void send_(self, item) except *:
-        if self._alive==1:
-            if self.n == self.count:
-                if self.transform is None:
-                    self.output = item
-                else:
-                    self.output = self.transform(item)
-                self._alive = 0
-            self.count += 1
+        if not self._alive:
+            raise StopIteration
+        if self.n == self.count:
+            if self.transform is None:
+                self.output = item
+            else:
+                self.output = self.transform(item)
+            self._alive = 0
+            raise StopIteration
+        self.count += 1
         
-            
+    cdef void send_many_(self, object chunk) except *:
+        cdef Py_ssize_t i
+        if not self._alive:
+            raise StopIteration
+        i = <Py_ssize_t>self.n - <Py_ssize_t>self.count
+        if i >= len(chunk):
+            self.count += len(chunk)
+        else:
+            self.count = self.n
+            self.send_(chunk[i])
+
+
+cdef tuple GROUP_AGGREGATES = ("sum", "count", "min", "max", "mean")
+
 
+cdef class GroupAggregate(Consumer):
+    """
+    GroupAggregate(keyfunc, aggs=("sum","count","min","max","mean"), 
+                   value=None, columnar=False) -> Consumer
+    
+    Computes aggregates of the items in each group, where items are grouped
+    by keyfunc(item) (or by the item itself, if keyfunc is None). This is 
+    equivalent to SwitchByKey(keyfunc, factory=...) with a factory making 
+    aggregates, but keeps the running aggregates of all groups in C arrays
+    instead of creating consumers for each key, so it is much faster and 
+    smaller when there are many groups.
+    
+    aggs names the aggregates to compute, from "sum", "count", "min", "max"
+    and "mean". value, if given, is called to get the number to aggregate 
+    from each item, otherwise the item itself is used. Values are converted
+    to floats.
+    
+    The result is a dict mapping each key to a tuple of the aggregates (or
+    to a single value, if aggs is a single name). If columnar is true, the 
+    result is instead a dict with a list of the keys under "key" and an 
+    array of values for each aggregate (numpy arrays, or array.array if 
+    numpy is not installed).
+    """
+    cdef:
+        object keyfunc, value
+        tuple aggs
+        bint scalar, columnar, numeric
+        dict index
+        list keys
+        Py_ssize_t capacity
+        long long *counts
+        double *sums
+        double *minima
+        double *maxima
+        
+    def __cinit__(self, keyfunc, aggs=GROUP_AGGREGATES, value=None, 
+                  columnar=False):
+        if keyfunc is not None and not isinstance(keyfunc, Callable):
+            raise TypeError("keyfunc must be a callable")
+        if value is not None and not isinstance(value, Callable):
+            raise TypeError("value must be a callable")
+        self.scalar = isinstance(aggs, str)
+        self.aggs = (aggs,) if self.scalar else tuple(aggs)
+        for name in self.aggs:
+            if name not in GROUP_AGGREGATES:
+                raise ValueError("unknown aggregate %s; expected one of %s"%(
+                                 repr(name), ", ".join(GROUP_AGGREGATES)))
+        #only counting needs no value, so items need not be numbers
+        self.numeric = any([name != "count" for name in self.aggs])
+        self.keyfunc = keyfunc
+        self.value = value
+        self.columnar = columnar
+        self.index = {}
+        self.keys = []
+        self.capacity = 0
+        
+    def __dealloc__(self):
+        PyMem_Free(self.counts)
+        PyMem_Free(self.sums)
+        PyMem_Free(self.minima)
+        PyMem_Free(self.maxima)
+        
+    cdef void grow_(self) except *:
+        cdef:
+            Py_ssize_t capacity=max(2*self.capacity, 64)
+            long long *counts
+            double *sums
+            double *minima
+            double *maxima
+        counts = <long long*>PyMem_Realloc(self.counts, capacity*sizeof(long long))
+        if counts == NULL:
+            raise MemoryError()
+        self.counts = counts
+        sums = <double*>PyMem_Realloc(self.sums, capacity*sizeof(double))
+        if sums == NULL:
+            raise MemoryError()
+        self.sums = sums
+        minima = <double*>PyMem_Realloc(self.minima, capacity*sizeof(double))
+        if minima == NULL:
+            raise MemoryError()
+        self.minima = minima
+        maxima = <double*>PyMem_Realloc(self.maxima, capacity*sizeof(double))
+        if maxima == NULL:
+            raise MemoryError()
+        self.maxima = maxima
+        self.capacity = capacity
+        
+    cdef Py_ssize_t row_(self, object key) except -1:
+        """Returns the row of the accumulator arrays for key"""
+        cdef Py_ssize_t row
+        found = self.index.get(key)
+        if found is not None:
+            return found
+        row = len(self.keys)
+        if row == self.capacity:
+            self.grow_()
+        self.counts[row] = 0
+        self.sums[row] = 0.0
+        self.minima[row] = INFINITY
+        self.maxima[row] = -INFINITY
+        self.index[key] = row
+        self.keys.append(key)
+        return row
+    
+    cdef void add_(self, Py_ssize_t row, long long count, double total,
+                   double minimum, double maximum):
+        self.counts[row] += count
+        self.sums[row] += total
+        if minimum < self.minima[row]:
+            self.minima[row] = minimum
+        if maximum > self.maxima[row]:
+            self.maxima[row] = maximum
+        
+    cdef void send_(self, object item) except *:
+        cdef:
+            Py_ssize_t row
+            double v
+        row = self.row_(item if self.keyfunc is None else self.keyfunc(item))
+        if not self.numeric:
+            self.counts[row] += 1
+            return
+        v = item if self.value is None else self.value(item)
+        self.add_(row, 1, v, v, v)
+        
+    cdef object values_(self, str name, Py_ssize_t row):
+        if name == "sum":
+            return self.sums[row]
+        elif name == "count":
+            return self.counts[row]
+        elif name == "min":
+            return self.minima[row]
+        elif name == "max":
+            return self.maxima[row]
+        return self.sums[row]/self.counts[row]
+        
+    cdef object column_(self, str name):
+        cdef:
+            Py_ssize_t row, n=len(self.keys)
+            TypedBuffer column
+        column = TypedBuffer("q" if name == "count" else "d", n)
+        for row in range(n):
+            column.append_(self.values_(name, row))
+        if numpy is None:
+            return array(column.typecode, memoryview(column))
+        return column.asarray()
+        
+    cdef object result_(self):
+        cdef Py_ssize_t row
+        if self.columnar:
+            out = {"key": list(self.keys)}
+            for name in self.aggs:
+                out[name] = self.column_(name)
+            return out
+        if self.scalar:
+            name = self.aggs[0]
+            return dict([(k, self.values_(name, row)) 
+                         for row, k in enumerate(self.keys)])
+        return dict([(k, tuple([self.values_(name, row) for name in self.aggs]))
+                     for row, k in enumerate(self.keys)])
+    
+    cdef object unmergeable_(self):
+        return None
+    
+    cdef object state_(self):
+        cdef Py_ssize_t row, n=len(self.keys)
+        return (self.keys, 
+                [self.counts[row] for row in range(n)],
+                [self.sums[row] for row in range(n)],
+                [self.minima[row] for row in range(n)],
+                [self.maxima[row] for row in range(n)])
+    
+    cdef void merge_state_(self, object state) except *:
+        for k, count, total, minimum, maximum in zip(*state):
+            self.add_(self.row_(k), count, total, minimum, maximum)
+        
+        
 cdef check(target):
     """
     check(target) -> wrapped target
@@ -698,28 +3583,929 @@ cdef check(target):
         raise TypeError("Can't convert %s to Consumer"%repr(target))
 
 
-def send(object itr, object target_in):
+cdef enum StageKind:
+    STAGE_GET, STAGE_ATTR, STAGE_MAP, STAGE_FILTER, STAGE_LIMIT, STAGE_SLICE,
+    STAGE_DEAD
+    
+    
+cdef struct Stage:
+    StageKind kind
+    #the selector, attribute name or function, owned by Fused.args
+    PyObject *arg
+    Py_ssize_t count, nxt, stop, step
+    
+    
+@cython.final
+cdef class Fused(ConsumerNode):
+    """
+    Fused(nodes, target) -> Consumer
+    
+    Performs the work of a straight chain of Get, Attr, Map, Filter, Limit 
+    and Slice nodes, ending in target, with a single call per item. The 
+    current state of the nodes is copied. Not usually instantiated directly,
+    but created by compile().
+    """
+    cdef:
+        Stage *stages
+        Py_ssize_t nstages, pos
+        tuple args, catches
+        list output
+        
+    def __cinit__(self, list nodes, Consumer target):
+        cdef:
+            Py_ssize_t i
+            Stage *stage
+            Consumer node
+            list args=[], catches=[]
+        self.stages = <Stage*>PyMem_Malloc(max(len(nodes), 1)*sizeof(Stage))
+        if self.stages == NULL:
+            raise MemoryError()
+        self.nstages = len(nodes)
+        for i, node in enumerate(nodes):
+            stage = &self.stages[i]
+            stage.count = stage.nxt = stage.stop = stage.step = 0
+            catch = None
+            if type(node) is Get:
+                stage.kind = STAGE_GET
+                arg = (<Get>node).selector
+            elif type(node) is Attr:
+                stage.kind = STAGE_ATTR
+                arg = (<Attr>node).attrname
+            elif type(node) is Map:
+                stage.kind = STAGE_MAP
+                arg = (<Map>node).func
+                catch = (<Map>node).exc
+            elif type(node) is Filter:
+                stage.kind = STAGE_FILTER
+                arg = (<Filter>node).func
+            elif type(node) is Limit:
+                stage.kind = STAGE_LIMIT
+                stage.count = (<Limit>node).count
+                stage.stop = (<Limit>node).total
+                arg = None
+            elif type(node) is Slice:
+                stage.kind = STAGE_SLICE
+                stage.count = (<Slice>node).count
+                stage.nxt = (<Slice>node).nxt
+                stage.stop = (<Slice>node).stop
+                stage.step = (<Slice>node).step
+                arg = None
+            else:
+                raise TypeError("%s consumers cannot be fused"%type(node).__name__)
+            if not node._alive and (stage.kind == STAGE_MAP or 
+                                    stage.kind == STAGE_FILTER):
+                stage.kind = STAGE_DEAD
+            args.append(arg)
+            catches.append(catch)
+        self.args = tuple(args)
+        self.catches = tuple(catches)
+        for i in range(self.nstages):
+            self.stages[i].arg = <PyObject*>self.args[i]
+        self.target = target
+        if type(target) is ListAppend:
+            self.output = (<ListAppend>target).output
+            
+    def __dealloc__(self):
+        PyMem_Free(self.stages)
+        
+    cdef int run_(self, object item) except -1:
+        """
+        Passes item through the stages and on to the target. self.pos is 
+        left at the stage which raised, if any, or nstages for the target.
+        """
+        cdef:
+            Py_ssize_t i
+            Stage *stage=self.stages
+            StageKind kind
+        for i in range(self.nstages):
+            self.pos = i
+            #compiled to a C switch
+            kind = stage.kind
+            if kind == STAGE_MAP:
+                item = (<object>stage.arg)(item)
+            elif kind == STAGE_FILTER:
+                if not (<object>stage.arg)(item):
+                    return 0
+            elif kind == STAGE_GET:
+                item = item[<object>stage.arg]
+            elif kind == STAGE_ATTR:
+                item = getattr(item, <object>stage.arg)
+            elif kind == STAGE_LIMIT:
+                if stage.count >= stage.stop:
+                    raise StopIteration
+                stage.count += 1
+            elif kind == STAGE_SLICE:
+                if stage.nxt >= stage.stop > 0:
+                    raise StopIteration
+                stage.count += 1
+                if stage.count - 1 != stage.nxt:
+                    return 0
+                stage.nxt += stage.step
+            else:
+                raise StopIteration
+            stage += 1
+        self.pos = self.nstages
+        if self.output is None:
+            self.target.send_(item)
+        else:
+            self.output.append(item)
+        return 0
+        
+    cdef void send_(self, object item) except *:
+        try:
+            self.run_(item)
+        except BaseException as exc:
+            if not self.handle_(self.pos, exc):
+                raise
+            
+    cdef void send_many_(self, object chunk) except *:
+        cdef:
+            Py_ssize_t i=0, n
+            list items
+        items = chunk if type(chunk) is list else list(chunk)
+        n = len(items)
+        #the exception handler is set up again only after an item fails
+        while i < n:
+            try:
+                while i < n:
+                    self.run_(items[i])
+                    i += 1
+            except BaseException as exc:
+                if not self.handle_(self.pos, exc):
+                    raise
+                i += 1
+        
+    cdef bint handle_(self, Py_ssize_t failed, object exc):
+        """
+        Applies the effect of an exception raised at stage failed (or by 
+        the target, if failed == nstages) as the chain of nodes would have: 
+        the nearest Map whose catch matches swallows the exception, the Maps
+        and Filters it passed through die, and the Limits and Slices it 
+        passed through do not count the item. A Map's catch applies to its
+        own function but not to the StopIteration of a Map which has died. 
+        Returns True if the exception was caught.
+        """
+        cdef:
+            Py_ssize_t i, caught=-1, start=failed
+            Stage *stage
+        if failed == self.nstages or self.stages[failed].kind == STAGE_DEAD:
+            start = failed - 1
+        for i in range(start, -1, -1):
+            catch = self.catches[i]
+            if catch is not None and isinstance(exc, catch):
+                caught = i
+                break
+        for i in range(caught + 1, min(failed + 1, self.nstages)):
+            stage = &self.stages[i]
+            if stage.kind == STAGE_MAP or stage.kind == STAGE_FILTER:
+                stage.kind = STAGE_DEAD
+            elif i < failed and stage.kind == STAGE_LIMIT:
+                stage.count -= 1
+            elif i < failed and stage.kind == STAGE_SLICE:
+                stage.count -= 1
+                stage.nxt -= stage.step
+        return caught >= 0
+    
+    cdef void set_child_(self, Py_ssize_t i, Consumer child) except *:
+        ConsumerNode.set_child_(self, i, child)
+        self.output = (<ListAppend>child).output if type(child) is ListAppend \
+            else None
+    
+    cdef object unmergeable_(self):
+        cdef Py_ssize_t i
+        for i in range(self.nstages):
+            if self.stages[i].kind == STAGE_LIMIT or \
+                    self.stages[i].kind == STAGE_SLICE:
+                return self
+        return self.target.unmergeable_()
+    
+    
+cdef Consumer fuse(Consumer target):
+    cdef:
+        list chain=[], children
+        Consumer node=target
+        Py_ssize_t i
+    while type(node) in (Get, Attr, Map, Filter, Limit, Slice):
+        chain.append(node)
+        node = (<ConsumerNode>node).target
+    children = node.children_()
+    for i in range(len(children)):
+        node.set_child_(i, fuse(children[i]))
+    if chain:
+        return Fused(chain, node)
+    return node
+
+
+def compile(target):
+    """
+    compile(target) -> Consumer
+    
+    Returns a consumer equivalent to target (which may be anything accepted
+    by send()) in which each straight chain of Get, Attr, Map, Filter, Limit
+    and Slice nodes is fused into a single consumer, so items pass through the
+    chain with one call. Split, Unzip, Switch and the grouping objects are 
+    compiled in place. The original nodes should not be used afterwards.
+    """
+    return fuse(check(target))
+
+
+cdef class Probe(Consumer):
+    """
+    Probe(node) -> Consumer
+    
+    Passes items to node, counting the items and exceptions and timing the
+    calls. Inserted above each node of a target by send(..., profile=True).
+    Items which a node with children refuses because it has finished (as 
+    Limit does once its limit is reached) are counted as refused, so they 
+    are not reported as dropped.
+    """
+    cdef:
+        Consumer node
+        list children
+        Py_ssize_t items_in, exceptions, refused
+        double elapsed
+        bint stopped
+        
+    def __cinit__(self, Consumer node):
+        self.node = node
+        self._alive = node._alive
+        #the probes of node's children, as set up by instrument()
+        self.children = node.children_()
+        
+    cdef bint refused_(self):
+        """
+        True if node raised StopIteration itself, rather than passing it up
+        from a child which finished
+        """
+        cdef Probe child
+        self.stopped = 1
+        for child in self.children:
+            if child.stopped:
+                return 0
+        return 1
+        
+    cdef Py_ssize_t forwarded_(self):
+        cdef Probe child
+        return sum([child.items_in for child in self.children])
+        
+    cdef void send_(self, object item) except *:
+        cdef double start=perf_counter()
+        self.items_in += 1
+        try:
+            self.node.send_(item)
+        except StopIteration:
+            #aggregates with no children raise on their last item, having 
+            #used it
+            if self.refused_() and self.children:
+                self.refused += 1
+            raise
+        except BaseException:
+            self.exceptions += 1
+            raise
+        finally:
+            self.elapsed += perf_counter() - start
+            self._alive = self.node._alive
+        
+    cdef void send_many_(self, object chunk) except *:
+        cdef:
+            double start=perf_counter()
+            Py_ssize_t forwarded=self.forwarded_()
+        self.items_in += len(chunk)
+        try:
+            self.node.send_many_(chunk)
+        except StopIteration:
+            if self.refused_() and self.children:
+                #the part of the chunk node did not pass on
+                self.refused += len(chunk) - (self.forwarded_() - forwarded)
+            raise
+        except BaseException:
+            self.exceptions += 1
+            raise
+        finally:
+            self.elapsed += perf_counter() - start
+            self._alive = self.node._alive
+            
+    cdef object result_(self):
+        return self.node.result_()
+    
+    cdef void close_(self):
+        cdef double start=perf_counter()
+        self.node.close_()
+        self.elapsed += perf_counter() - start
+        self._alive = 0
+        
+    cdef object unmergeable_(self):
+        return self.node.unmergeable_()
+    
+    cdef object state_(self):
+        return self.node.state_()
+    
+    cdef void merge_state_(self, object state) except *:
+        self.node.merge_state_(state)
+        
+        
+cdef Probe instrument(Consumer node):
+    cdef:
+        list children=node.children_()
+        Py_ssize_t i
+    for i in range(len(children)):
+        node.set_child_(i, instrument(children[i]))
+    return Probe(node)
+
+
+cdef ProfileReport uninstrument(Probe probe):
+    """
+    Removes the probes from the tree below probe, returning the report
+    """
+    cdef:
+        Consumer node=probe.node
+        list children=node.children_(), reports=[]
+        Py_ssize_t i
+        Probe child
+        ProfileReport report=ProfileReport()
+    for i in range(len(children)):
+        child = children[i]
+        node.set_child_(i, child.node)
+        reports.append(uninstrument(child))
+    report.name = type(node).__name__
+    report.items_in = probe.items_in
+    report.exceptions = probe.exceptions
+    report.time = probe.elapsed
+    report.children = tuple(reports)
+    if reports:
+        report.items_out = sum([r.items_in for r in reports])
+        if isinstance(node, DROPPING):
+            report.dropped = report.items_in - report.items_out - \
+                probe.refused
+    return report
+
+
+#nodes which pass on at most one item for each item received
+cdef tuple DROPPING = (Filter, Map, CachedMap, Limit, Slice, Unique, FilterBatch, 
+                       Fused)
+
+
+cdef class ProfileReport(object):
+    """
+    Statistics for one node of a profiled target, as returned by 
+    send(..., profile=True). items_out is None for nodes with no children 
+    and dropped is given only for filtering nodes (Filter, Map, CachedMap,
+    Limit, Slice, Unique, FilterBatch and fused chains). time is the total time spent in 
+    the node, including its children, and self_time excludes the children.
+    Items sent to consumers created on the fly (by SwitchByKey or the 
+    grouping objects) are counted in the creating node.
+    """
+    cdef:
+        readonly str name
+        readonly Py_ssize_t items_in, exceptions
+        readonly object items_out, dropped
+        readonly double time
+        readonly tuple children
+        
+    property self_time:
+        def __get__(self):
+            cdef ProfileReport r
+            return self.time - sum([r.time for r in self.children])
+        
+    def as_dict(self):
+        """
+        as_dict() -> dict
+        
+        Returns the report as nested dicts
+        """
+        cdef ProfileReport r
+        return {"name": self.name,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "dropped": self.dropped,
+                "exceptions": self.exceptions,
+                "time": self.time,
+                "self_time": self.self_time,
+                "children": [r.as_dict() for r in self.children]}
+    
+    cdef list lines_(self, str indent):
+        cdef ProfileReport r
+        fields = ["in=%d"%self.items_in]
+        if self.items_out is not None:
+            fields.append("out=%d"%self.items_out)
+        if self.dropped is not None:
+            fields.append("dropped=%d"%self.dropped)
+        if self.exceptions:
+            fields.append("exceptions=%d"%self.exceptions)
+        fields.append("time=%.3fms"%(self.time*1000))
+        fields.append("self=%.3fms"%(self.self_time*1000))
+        lines = ["%-24s %s"%(indent + self.name, " ".join(fields))]
+        for r in self.children:
+            lines.extend(r.lines_(indent + "  "))
+        return lines
+    
+    def __str__(self):
+        return "\n".join(self.lines_(""))
+    
+    def __repr__(self):
+        return "<ProfileReport %s in=%d>"%(self.name, self.items_in)
+
+
+cdef Py_ssize_t PREFETCH_CHUNKSIZE = 1024
+
+
+def _read_ahead(object itr, Py_ssize_t n, object queue, object stop):
+    """
+    Reader thread for prefetched(). Reads lists of up to n items from itr 
+    into queue until itr is exhausted or stop is set. An exception raised by
+    the source is passed through the queue.
+    """
+    try:
+        itr = iter(itr)
+        while not stop.is_set():
+            chunk = list(islice(itr, n))
+            if not chunk:
+                break
+            queue_put(queue, stop, chunk)
+        else:
+            if isinstance(itr, GeneratorType):
+                itr.close()
+            return
+        queue_put(queue, stop, None)
+    except BaseException as exc:
+        queue_put(queue, stop, exc)
+        
+        
+cdef void queue_put(object queue, object stop, object item) except *:
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.05)
+            return
+        except Full:
+            pass
+        
+        
+def prefetched(object itr, Py_ssize_t n, Py_ssize_t depth):
+    """
+    prefetched(itr, n, depth) -> generator
+    
+    Yields lists of up to n items read from itr by a background thread, 
+    which stays up to depth lists ahead of the consumer. Closing the 
+    generator stops the reader thread, which closes itr if it is a generator.
+    """
+    queue = Queue(depth)
+    stop = Event()
+    reader = Thread(target=_read_ahead, args=(itr, n, queue, stop), 
+                    name="sendtools-prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            chunk = queue.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        stop.set()
+        reader.join()
+
+
+def send(object itr, object target_in, chunksize=None, chunked=False, 
+         prefetch=0, profile=False):
     """Consumes the given iterator and directs the result
     to the target pipeline
     
     params: itr - an iterator which supplies data
             target - a pipeline generator or a tuple of such items
+            chunksize - if given, items are read from itr in lists of 
+                this size and passed to the target using send_many()
+            chunked - if true, each item from itr is itself a chunk (e.g. a 
+                numpy array) and is passed to the target using send_many()
+            prefetch - if non-zero, itr is read by a background thread which
+                keeps up to this many chunks ahead of the target, so I/O
+                overlaps with consumption
+            profile - if true, each node of the target is instrumented and 
+                a (result, ProfileReport) tuple is returned
+            
+    returns: a value, list or tuple of such items with structure corresponding
+           to the target pipeline
+           
+    Reading stops as soon as the whole target is finished (raises 
+    StopIteration). A generator source is then closed.
+    """
+    cdef:
+        Consumer target
+        Py_ssize_t n=PREFETCH_CHUNKSIZE
+    
+    target = check(target_in)
+    if chunksize is not None:
+        if chunked:
+            raise ValueError("chunksize cannot be used with chunked input")
+        n = chunksize
+        if n < 1:
+            raise ValueError("chunksize must be a positive integer")
+    if prefetch < 0:
+        raise ValueError("prefetch must be a non-negative integer")
+    if not profile:
+        return send_to(itr, target, chunksize, chunked, prefetch, n)
+    target = instrument(target)
+    try:
+        out = send_to(itr, target, chunksize, chunked, prefetch, n)
+    finally:
+        #the probes are removed even if the target raised
+        report = uninstrument(<Probe>target)
+    return out, report
+    
+    
+cdef object send_to(object itr, Consumer target, object chunksize, 
+                    bint chunked, Py_ssize_t prefetch, Py_ssize_t n):
+    """The body of send(), once its arguments have been checked"""
+    cdef list chunk
+    if prefetch:
+        itr = prefetched(itr, 1 if chunked else n, prefetch)
+    try:
+        if prefetch:
+            for chunk in itr:
+                if chunked:
+                    target.send_many_(chunk[0])
+                elif chunksize is None:
+                    for item in chunk:
+                        target.send_(item)
+                else:
+                    target.send_many_(chunk)
+        elif chunked:
+            for item in itr:
+                target.send_many_(item)
+        elif chunksize is None:
+            for item in itr:
+                target.send_(item)
+        else:
+            itr = iter(itr)
+            while True:
+                chunk = list(islice(itr, n))
+                if not chunk:
+                    break
+                target.send_many_(chunk)
+    except StopIteration:
+        #the target is finished, so a generator source won't be resumed
+        if not prefetch and type(itr) is GeneratorType:
+            itr.close()
+    finally:
+        if prefetch:
+            itr.close()
+    target.close_()
+    return target.result_()
+
+
+cdef Py_ssize_t READ_BLOCKSIZE = 1 << 20
+
+
+cdef object line_(const char *p, Py_ssize_t n, const char *encoding, 
+                  const char *errors):
+    if encoding == NULL:
+        return PyBytes_FromStringAndSize(p, n)
+    return PyUnicode_Decode(p, n, encoding, errors)
+
+
+cdef list split_lines(const char *buf, Py_ssize_t n, Py_ssize_t *used, 
+                      const char *encoding, const char *errors, bint keepends,
+                      bint final):
+    """
+    Splits the n bytes at buf into lines, decoded with encoding (or as bytes
+    if encoding is NULL). The number of bytes consumed is stored in used; an
+    incomplete last line is left unconsumed unless final is true.
+    """
+    cdef:
+        list lines=[]
+        Py_ssize_t start=0, end, length
+        const char *p
+    while start < n:
+        p = <const char*>memchr(buf + start, b'\n', n - start)
+        if p == NULL:
+            if final:
+                lines.append(line_(buf + start, n - start, encoding, errors))
+                start = n
+            break
+        end = p - buf
+        if keepends:
+            length = end + 1 - start
+        else:
+            length = end - start
+            if length > 0 and buf[end - 1] == b'\r':
+                length -= 1
+        lines.append(line_(buf + start, length, encoding, errors))
+        start = end + 1
+    used[0] = start
+    return lines
+
+
+cdef tuple open_binary(object source):
+    """
+    Returns (file, owned) for source, a path or a binary file object
+    """
+    if hasattr(source, "read"):
+        return source, False
+    return open(source, "rb"), True
+
+
+def send_lines(object source, object target_in, encoding="utf-8", 
+               errors="strict", keepends=False, use_mmap=False, 
+               Py_ssize_t blocksize=READ_BLOCKSIZE):
+    """Sends the lines of a text file into the target pipeline
+    
+    params: source - a path, or a file object opened in binary mode
+            target - a pipeline generator or a tuple of such items
+            encoding - the encoding of the file, which must be ASCII 
+                compatible (so UTF-16 and UTF-32 are not supported). If None,
+                the lines are sent as bytes
+            errors - the decoding error handler, as for bytes.decode()
+            keepends - if true, the line endings are kept. Otherwise "\\n" 
+                and "\\r\\n" endings are removed
+            use_mmap - if true, the file is memory-mapped rather than read
+            blocksize - the number of bytes read (or scanned) at a time
+            
+    returns: the result of the target
+    
+    The file is read in blocks which are split into lines in C, and each 
+    block's lines are passed to the target using send_many(). Reading stops
+    when the target is finished.
+    """
+    cdef:
+        Consumer target
+        const char *enc=NULL
+        const char *err
+        bytes enc_b, err_b=errors.encode("ascii"), data=b""
+        Py_ssize_t used=0, start=0, size, n
+        const unsigned char[::1] view
+        list lines
+    if blocksize < 1:
+        raise ValueError("blocksize must be a positive integer")
+    if encoding is not None:
+        #lines are split on b"\n" before decoding
+        try:
+            ascii_compatible = codec_lookup(encoding).decode(
+                                    b"\r\n", "strict")[0] == "\r\n"
+        except UnicodeDecodeError:
+            ascii_compatible = False
+        if not ascii_compatible:
+            raise ValueError("send_lines needs an ASCII compatible encoding, "
+                             "not %s"%encoding)
+        enc_b = encoding.encode("ascii")
+        enc = enc_b
+    target = check(target_in)
+    err = err_b
+    f, owned = open_binary(source)
+    try:
+        if use_mmap:
+            size = os.fstat(f.fileno()).st_size
+            mapped = mmap(f.fileno(), 0, access=ACCESS_READ) if size else b""
+            try:
+                view = mapped
+                n = blocksize
+                while start < size:
+                    n = min(n, size - start)
+                    lines = split_lines(<const char*>&view[start], n, &used,
+                                        enc, err, keepends, start + n == size)
+                    if used == 0:
+                        #a line longer than the block
+                        n *= 2
+                        continue
+                    start += used
+                    n = blocksize
+                    target.send_many_(lines)
+            finally:
+                view = None
+                if size:
+                    mapped.close()
+        else:
+            while True:
+                block = f.read(blocksize)
+                if block:
+                    data = data[used:] + block
+                else:
+                    data = data[used:]
+                lines = split_lines(PyBytes_AS_STRING(data), 
+                                    PyBytes_GET_SIZE(data), &used, enc, err,
+                                    keepends, not block)
+                if lines:
+                    target.send_many_(lines)
+                if not block:
+                    break
+    except StopIteration:
+        pass
+    finally:
+        if owned:
+            f.close()
+    target.close_()
+    return target.result_()
+
+
+def send_csv(object source, object target_in, columns=None, header=False, 
+             encoding="utf-8", **fmtparams):
+    """Sends the rows of a CSV file into the target pipeline
+    
+    params: source - a path, or a file object opened in text mode with 
+                newline=""
+            target - a pipeline generator or a tuple of such items
+            columns - if given, an index or a sequence of indices selecting 
+                the columns sent. A single index sends the column's value 
+                for each row; a sequence sends a tuple. If header is true,
+                the indices may be column names
+            header - if true, the first row gives the column names and is 
+                not sent
+            encoding - the encoding of the file
+            fmtparams - formatting parameters passed to csv.reader
+            
+    returns: the result of the target
+    
+    Rows are parsed by the csv module and passed to the target in lists 
+    using send_many(). Reading stops when the target is finished.
+    """
+    cdef:
+        Consumer target
+        list rows, row, names=None
+        tuple cols=None
+        Py_ssize_t i, col=-1
+        bint single=False
+    target = check(target_in)
+    if hasattr(source, "read"):
+        f, owned = source, False
+    else:
+        f, owned = open(source, newline="", encoding=encoding), True
+    try:
+        reader = csv_reader(f, **fmtparams)
+        if header:
+            names = next(reader, [])
+        if columns is not None:
+            single = isinstance(columns, (int, str))
+            if single:
+                columns = (columns,)
+            index = []
+            for c in columns:
+                if isinstance(c, str):
+                    if names is None:
+                        raise ValueError("column names require header=True")
+                    c = names.index(c)
+                index.append(c)
+            cols = tuple(index)
+            col = cols[0]
+        try:
+            while True:
+                rows = list(islice(reader, PREFETCH_CHUNKSIZE))
+                if not rows:
+                    break
+                if single:
+                    rows = [row[col] for row in rows]
+                elif cols is not None:
+                    rows = [tuple([row[i] for i in cols]) for row in rows]
+                target.send_many_(rows)
+        except StopIteration:
+            pass
+    finally:
+        if owned:
+            f.close()
+    target.close_()
+    return target.result_()
+
+
+def send_records(object source, object fmt, object target_in, use_mmap=False,
+                 Py_ssize_t blocksize=READ_BLOCKSIZE):
+    """Sends the fixed-size binary records of a file into the target pipeline
+    
+    params: source - a path, or a file object opened in binary mode
+            fmt - a struct format string (or struct.Struct) describing one 
+                record
+            target - a pipeline generator or a tuple of such items
+            use_mmap - if true, the file is memory-mapped rather than read
+            blocksize - the (approximate) number of bytes read at a time
+            
+    returns: the result of the target
+    
+    Each record is unpacked to a tuple. The records of each block are passed
+    to the target using send_many(). ValueError is raised if the file ends
+    with a partial record. Reading stops when the target is finished.
+    """
+    cdef:
+        Consumer target
+        Py_ssize_t size, start=0, n
+    if not isinstance(fmt, Struct):
+        fmt = Struct(fmt)
+    if fmt.size == 0:
+        raise ValueError("record format has zero size")
+    n = max(1, blocksize//fmt.size)*fmt.size
+    target = check(target_in)
+    f, owned = open_binary(source)
+    try:
+        if use_mmap:
+            size = os.fstat(f.fileno()).st_size
+            if size % fmt.size:
+                raise ValueError("file size is not a multiple of the record size")
+            if size:
+                mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+                view = memoryview(mapped)
+                try:
+                    while start < size:
+                        target.send_many_(list(fmt.iter_unpack(
+                                                view[start:start + n])))
+                        start += n
+                finally:
+                    view.release()
+                    mapped.close()
+        else:
+            while True:
+                block = f.read(n)
+                if not block:
+                    break
+                if len(block) % fmt.size:
+                    raise ValueError("file ends with a partial record")
+                target.send_many_(list(fmt.iter_unpack(block)))
+    except StopIteration:
+        pass
+    finally:
+        if owned:
+            f.close()
+    target.close_()
+    return target.result_()
+
+
+async def asend(object aitr, object target_in, chunked=False):
+    """Consumes the given asynchronous iterable and directs the result
+    to the target pipeline. This is a coroutine.
+    
+    params: aitr - an asynchronous iterable which supplies data
+            target - a pipeline generator or a tuple of such items
+            chunked - if true, each item from aitr is a batch of items (a 
+                list of rows from a cursor, for example) and is passed to the
+                target using send_many()
             
     returns: a value, list or tuple of such items with structure corresponding
            to the target pipeline
+           
+    If the target finishes before the source is exhausted, the aclose() 
+    method (if any) of the iterator given by aitr.__aiter__() is awaited so 
+    it can release its resources.
     """
     cdef Consumer target
     
     target = check(target_in)
+    #an async iterable may return a new iterator, which is the one to close
+    aitr = type(aitr).__aiter__(aitr)
+    try:
+        if chunked:
+            async for item in aitr:
+                target.send_many_(item)
+        else:
+            async for item in aitr:
+                target.send_(item)
+    except StopIteration:
+        aclose = getattr(aitr, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    target.close_()
+    out = target.result_()
+    return out
+
+
+def _send_shard(args):
+    """
+    Worker function for send_parallel: sends one shard into a newly created
+    target and returns its partial state
+    """
+    cdef Consumer target
+    target_factory, shard = args
+    target = check(target_factory())
     try:
-        for item in itr:
+        for item in shard:
             target.send_(item)
     except StopIteration:
         pass
-    out = target.result_()
     target.close_()
-    return out
+    state = target.state_()
+    return state
+
 
+def send_parallel(object source_shards, object target_factory, workers=None):
+    """Consumes each of the given shards in a pool of worker processes and
+    merges the partial results
+    
+    params: source_shards - an iterable of picklable iterables, one per shard
+            target_factory - a picklable callable returning a new target for 
+                each shard. All consumers in the target must be mergeable
+            workers - number of worker processes (default: number of CPUs)
+            
+    returns: the merged result, with the same structure as returned by send().
+            Partial results are merged in shard order.
+    """
+    cdef Consumer target
+    
+    target = check(target_factory())
+    node = target.unmergeable_()
+    if node is not None:
+        raise TypeError("send_parallel requires mergeable consumers, but "
+                        "%s consumers cannot be merged"%type(node).__name__)
+    with Pool(workers) as pool:
+        for state in pool.imap(_send_shard, 
+                               [(target_factory, shard) for shard in source_shards]):
+            target.merge_state_(state)
+    target.close_()
+    out = target.result_()
+    return out
 
 
 cdef class GeneratorConsumer(Consumer):
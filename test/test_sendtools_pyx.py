@@ -8,10 +8,25 @@ pyximport.install()
 
 import sendtools as st
 import itertools
+import asyncio
 import random
+import bisect
+import os
+import struct
+import tempfile
 from collections import defaultdict
 from math import sqrt
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def parallel_target():
+    return (st.Sum(), st.Count(), st.Stats(), st.Min(), st.Max(), [],
+            st.SwitchByKey(lambda x:x%3, factory=st.Sum))
+
+
 class TestSendtools(unittest.TestCase):
     def test_send(self):
         a = list(range(5))
@@ -260,6 +275,1232 @@ class TestAggregates(unittest.TestCase):
             
         
         
+class TestSendMany(unittest.TestCase):
+    def test_chunksize(self):
+        data = list(range(100))
+        for n in (1, 7, 100, 1000):
+            a, b, c = st.send(data, ([], st.Count(), st.Map(lambda x:x*2, [])),
+                              chunksize=n)
+            self.assertEqual(a, data)
+            self.assertEqual(b, 100)
+            self.assertEqual(c, [x*2 for x in data])
+            
+    def test_limit(self):
+        a = itertools.count()
+        b = st.send(a, st.Limit(15, []), chunksize=10)
+        self.assertEqual(b, list(range(15)))
+        self.assertEqual(next(a), 20)
+        
+    def test_slice(self):
+        data = list(range(50))
+        for args in [(7,), (7,13), (7,23,3), (None,None,3), (2,None,4), 
+                     (None,15,3), (20,10)]:
+            for n in (1, 3, 4, 10, 100):
+                ret = st.send(data, st.Slice(*(args+([],))), chunksize=n)
+                self.assertEqual(ret, data[slice(*args)])
+                
+    def test_get_attr_filter(self):
+        data = [(x, complex(x, -x)) for x in range(20)]
+        a, b = st.send(data, (st.Get(0, st.Filter(lambda x:x%2, [])),
+                              st.Get(1, st.Attr("imag", []))), chunksize=6)
+        self.assertEqual(a, list(range(1,20,2)))
+        self.assertEqual(b, [float(-x) for x in range(20)])
+        
+    def test_map_catch(self):
+        a = list(range(10))
+        a[5] = "moo"
+        target = st.Map(lambda x:x/2., [], catch=TypeError)
+        target.send_many(a)
+        del a[5]
+        self.assertEqual(target.result(), [x/2. for x in a])
+        
+    def test_map_catch_target(self):
+        #exceptions from the target are caught whether or not chunked
+        data = [1, 2, 0, 4]
+        factory = lambda :st.Map(lambda x:x, st.Map(lambda x:1/x, []), 
+                                 catch=ZeroDivisionError)
+        for n in (None, 1, 3, 4):
+            self.assertEqual(st.send(data, factory(), chunksize=n), [1.0, 0.5])
+        
+    def test_fallback(self):
+        target = st.GroupByN(3, [])
+        target.send_many(range(10))
+        self.assertEqual(target.result(), [[0,1,2],[3,4,5],[6,7,8]])
+        
+        
+class TestTypedAppend(unittest.TestCase):
+    def test_double(self):
+        data = [random.random() for i in range(1000)]
+        ret = st.send(data, st.TypedAppend("d"))
+        self.assertEqual(len(ret), 1000)
+        self.assertEqual(list(ret), data)
+        
+    def test_int_chunks(self):
+        from array import array
+        target = st.TypedAppend("q")
+        target.send_many(array("q", range(100)))
+        target.send_many(list(range(100, 150)))
+        self.assertEqual(list(target.result()), list(range(150)))
+        
+    def test_overflow(self):
+        self.assertRaises(OverflowError, st.send, [1, 2, 300], 
+                          st.TypedAppend("b"))
+        
+    def test_bad_dtype(self):
+        self.assertRaises(TypeError, st.TypedAppend, "z")
+        
+    def test_no_copy(self):
+        buf = st.TypedBuffer("i")
+        buf.extend(range(10))
+        view = memoryview(buf)
+        self.assertEqual(view.tolist(), list(range(10)))
+        buf.extend(range(100))
+        self.assertEqual(view.tolist(), list(range(10)))
+        view.release()
+        buf.extend(range(100))
+        self.assertEqual(len(buf), 210)
+        self.assertEqual(memoryview(buf).tolist(), 
+                         list(range(10)) + list(range(100))*2)
+        
+    def test_non_integral(self):
+        self.assertRaises(TypeError, st.send, [1.5, 2], st.TypedAppend("q"))
+        self.assertRaises(TypeError, st.send, ["1"], st.TypedAppend("B"))
+        self.assertEqual(list(st.send([True, 2], st.TypedAppend("q"))), [1, 2])
+        self.assertEqual(list(st.send([1, 2.5], st.TypedAppend("d"))), [1.0, 2.5])
+        
+    def test_group_target(self):
+        target = st.GroupByN(2, st.TypedAppend("q"), factory=st.Sum)
+        self.assertEqual(list(st.send(range(100), target)), 
+                         [4*i + 1 for i in range(50)])
+        target = st.GroupByKey(lambda x:x//3, st.TypedAppend("q"), 
+                               factory=st.Count)
+        self.assertEqual(list(st.send(range(100), target)), [3]*33 + [1])
+        
+        
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestArrayAggregates(unittest.TestCase):
+    def setUp(self):
+        self.data = [random.random() for i in range(1000)]
+        self.chunks = [numpy.array(self.data[i:i+70]) for i in range(0,1000,70)]
+        
+    def test_scalar_aggregates(self):
+        targets = (st.Sum(), st.Min(), st.Max(), st.Count(), st.Ave())
+        a = st.send(self.chunks, targets, chunked=True)
+        b = st.send(self.data, (st.Sum(), st.Min(), st.Max(), st.Count(), 
+                                st.Ave()))
+        self.assertAlmostEqual(a[0], b[0])
+        self.assertEqual(a[1:4], b[1:4])
+        self.assertAlmostEqual(a[4], b[4])
+        
+    def test_2d_chunks(self):
+        chunks = [numpy.arange(12.0).reshape(3, 4), numpy.ones((2, 5))]
+        total, count, ave = st.send(chunks, (st.Sum(), st.Count(), st.Ave()), 
+                                    chunked=True)
+        self.assertEqual(count, 22)
+        self.assertEqual(total, 76.0)
+        self.assertAlmostEqual(ave, total/count)
+        
+    def test_stats(self):
+        a = st.send(self.chunks, st.Stats(), chunked=True)
+        b = st.send(self.data, st.Stats())
+        self.assertEqual(a[0], b[0])
+        self.assertAlmostEqual(a[1], b[1], places=12)
+        self.assertAlmostEqual(a[2], b[2], places=12)
+        
+    def test_any_all(self):
+        chunks = [numpy.ones(10), numpy.zeros(10)]
+        self.assertEqual(st.send(chunks, (st.Any(), st.All()), chunked=True), 
+                         (True, False))
+        chunks = [numpy.ones(10), numpy.ones(10)]
+        self.assertEqual(st.send(chunks, (st.Any(), st.All()), chunked=True), 
+                         (True, True))
+        
+    def test_list_chunks(self):
+        chunks = [self.data[i:i+70] for i in range(0,1000,70)]
+        a = st.send(chunks, (st.Min(), st.Max(), st.Stats()), chunked=True)
+        self.assertEqual(a[:2], (min(self.data), max(self.data)))
+        self.assertEqual(a[2], st.send(self.data, st.Stats()))
+        
+        
+class TestMerge(unittest.TestCase):
+    def test_send_parallel(self):
+        shards = [range(0, 100), range(100, 250), range(250, 300)]
+        result = st.send_parallel(shards, parallel_target, workers=2)
+        expected = st.send(range(300), parallel_target())
+        self.assertEqual(result[:2], expected[:2])
+        self.assertEqual(result[2][0], expected[2][0])
+        self.assertAlmostEqual(result[2][1], expected[2][1])
+        self.assertAlmostEqual(result[2][2], expected[2][2])
+        self.assertEqual(result[3:], expected[3:])
+        
+    def test_merge(self):
+        a = st.Split(st.Ave(), [], st.Map(abs, st.All()))
+        b = st.Split(st.Ave(), [], st.Map(abs, st.All()))
+        a.send_many([1, 2])
+        b.send_many([0, 5])
+        a.merge(b)
+        self.assertEqual(a.result(), (2.0, [1, 2, 0, 5], False))
+        
+    def test_empty_shard(self):
+        a, b = st.Min(), st.Min()
+        a.send(5)
+        a.merge(b)
+        self.assertEqual(a.result(), 5)
+        b.merge(a)
+        self.assertEqual(b.result(), 5)
+        
+    def test_unmergeable(self):
+        self.assertRaises(TypeError, st.send_parallel, [range(10)], 
+                          lambda :(st.Sum(), st.Map(abs, st.First())))
+        self.assertRaises(TypeError, st.send_parallel, [range(10)],
+                          lambda :st.SwitchByKey(factory=lambda :st.GroupByKey(None, [])))
+        self.assertRaises(TypeError, st.Sum().merge, st.Count())
+        
+        
+class TestAsend(unittest.TestCase):
+    def test_asend(self):
+        async def source():
+            for i in range(10):
+                yield (i, i*2)
+        a, b = asyncio.run(st.asend(source(), (st.Get(0, []), st.Get(1, st.Sum()))))
+        self.assertEqual(a, list(range(10)))
+        self.assertEqual(b, 90)
+        
+    def test_chunked(self):
+        async def source():
+            for i in range(0, 100, 10):
+                yield list(range(i, i+10))
+        ret = asyncio.run(st.asend(source(), ([], st.Count()), chunked=True))
+        self.assertEqual(ret, (list(range(100)), 100))
+        
+    def test_early_exit(self):
+        closed = []
+        async def source():
+            try:
+                for i in itertools.count():
+                    yield i
+            finally:
+                closed.append(True)
+        ret = asyncio.run(st.asend(source(), st.Limit(5, [])))
+        self.assertEqual(ret, list(range(5)))
+        self.assertEqual(closed, [True])
+        
+    def test_early_exit_iterable(self):
+        closed = []
+        async def source():
+            try:
+                for i in itertools.count():
+                    yield i
+            finally:
+                closed.append(True)
+        class Source(object):
+            def __aiter__(self):
+                return source()
+        ret = asyncio.run(st.asend(Source(), st.Limit(3, [])))
+        self.assertEqual(ret, [0, 1, 2])
+        self.assertEqual(closed, [True])
+        
+        
+class TestPrefetch(unittest.TestCase):
+    def test_prefetch(self):
+        data = list(range(5000))
+        a, b = st.send(iter(data), ([], st.Sum()), prefetch=4)
+        self.assertEqual(a, data)
+        self.assertEqual(b, sum(data))
+        a = st.send(data, st.Map(str, []), prefetch=2, chunksize=100)
+        self.assertEqual(a, [str(x) for x in data])
+        
+    def test_early_exit(self):
+        closed = []
+        def source():
+            try:
+                for i in itertools.count():
+                    yield i
+            finally:
+                closed.append(True)
+        ret = st.send(source(), st.Limit(10, []), prefetch=2, chunksize=3)
+        self.assertEqual(ret, list(range(10)))
+        self.assertEqual(closed, [True])
+        
+    def test_reader_error(self):
+        def source():
+            yield 1
+            raise ValueError("bad read")
+        self.assertRaises(ValueError, st.send, source(), [], prefetch=1)
+        
+    def test_negative(self):
+        self.assertRaises(ValueError, st.send, range(10), [], prefetch=-1)
+        
+        
+class TestCompile(unittest.TestCase):
+    def check_same(self, data, factory):
+        expected = st.send(data, factory())
+        self.assertEqual(st.send(data, st.compile(factory())), expected)
+        self.assertEqual(st.send(data, st.compile(factory()), chunksize=3), 
+                         expected)
+        
+    def test_chain(self):
+        data = [(i, "x"*i) for i in range(50)]
+        self.check_same(data, lambda :st.Get(1, st.Map(len, 
+                                    st.Filter(lambda x:x%3, []))))
+        self.check_same(data, lambda :(st.Get(0, st.Slice(3, 40, 4, st.Sum())), 
+                                       st.Get(1, st.Attr("upper", st.Count()))))
+        
+    def test_catch(self):
+        data = list(range(20))
+        data[5] = "moo"
+        data[7] = None
+        self.check_same(data, lambda :st.Map(lambda x:x/2., 
+                                    st.Limit(6, []), catch=TypeError))
+        self.check_same(data, lambda :st.Map(str, st.Map(int, 
+                                    st.Slice(2, None, 2, []), catch=TypeError), 
+                                    catch=ValueError))
+        
+    def test_dead_map(self):
+        #the inner Map dies on the TypeError, and its StopIteration on the 
+        #next item is not swallowed by its own catch
+        def func(x):
+            if x == 1:
+                raise TypeError
+            return x
+        self.check_same(list(range(5)), lambda :st.Map(abs, st.Map(func, 
+                                    st.Count(), catch=StopIteration), 
+                                    catch=TypeError))
+        target = st.compile(st.Map(abs, st.Map(func, st.Count(), 
+                            catch=StopIteration), catch=TypeError))
+        a = iter(range(5))
+        self.assertEqual(st.send(a, target), 1)
+        self.assertEqual(next(a), 3)
+        
+    def test_limit_stops(self):
+        a = itertools.count()
+        b = st.send(a, st.compile(st.Map(lambda x:x*2, st.Limit(5, []))))
+        self.assertEqual(b, [0, 2, 4, 6, 8])
+        self.assertEqual(next(a), 6)
+        
+    def test_nested(self):
+        data = [(i, i*2) for i in range(20)]
+        target = st.compile(st.GroupByN(4, st.Map(lambda x:x*10, []), 
+                            factory=lambda :st.Get(1, st.Sum())))
+        self.assertEqual(st.send(data, target), [120, 440, 760, 1080, 1400])
+        
+    def test_error(self):
+        target = st.compile(st.Map(lambda x:1/x, []))
+        self.assertRaises(ZeroDivisionError, target.send, 0)
+        self.assertRaises(StopIteration, target.send, 1)
+        
+        
+class TestUnique(unittest.TestCase):
+    def test_unique(self):
+        data = [3,1,3,2,1,5,2,3,4]
+        self.assertEqual(st.send(data, st.Unique([])), [3,1,2,5,4])
+        
+    def test_key(self):
+        data = ["a", "B", "b", "A", "c"]
+        ret = st.send(data, st.Unique([], key=str.lower))
+        self.assertEqual(ret, ["a", "B", "c"])
+        
+    def test_window(self):
+        data = [1,2,1,3,4,1,5,6,7,1]
+        ret = st.send(data, st.Unique([], window=3))
+        self.assertEqual(ret, [1,2,3,4,5,6,7,1])
+        self.assertRaises(ValueError, st.Unique, [], window=0)
+        
+        
+class TestApproxCountDistinct(unittest.TestCase):
+    def test_estimate(self):
+        data = [i % 20000 for i in range(60000)]
+        ret = st.send(data, st.ApproxCountDistinct())
+        self.assertTrue(abs(ret - 20000) < 20000*0.03)
+        data = ["user%d"%(i % 50) for i in range(1000)]
+        self.assertEqual(st.send(data, st.ApproxCountDistinct()), 50)
+        
+    def test_merge(self):
+        a = st.ApproxCountDistinct(12)
+        b = st.ApproxCountDistinct(12)
+        a.send_many(["x%d"%i for i in range(3000)])
+        b.send_many(["x%d"%i for i in range(2000, 6000)])
+        a.merge(b)
+        self.assertTrue(abs(a.result() - 6000) < 6000*0.06)
+        self.assertRaises(ValueError, a.merge, st.ApproxCountDistinct(10))
+        
+    def test_by_key(self):
+        data = [(k, j%(10*(k+1))) for j in range(100) for k in range(3)]
+        ret = st.send(data, st.SwitchByKey(lambda x:x[0], 
+                            factory=lambda :st.ApproxCountDistinct(key=lambda x:x[1])))
+        self.assertEqual(ret, {0:10, 1:20, 2:30})
+        
+        
+class TestQuantiles(unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(1)
+        self.data = [rand.gauss(0, 1) for i in range(20000)]
+        self.sorted = sorted(self.data)
+        
+    def exact(self, q):
+        return self.sorted[int(q*(len(self.sorted) - 1))]
+    
+    def rank(self, value):
+        return bisect.bisect(self.sorted, value)/len(self.sorted)
+        
+    def test_quantiles(self):
+        qs = (0.01, 0.25, 0.5, 0.95, 0.99)
+        ret = st.send(self.data, st.Quantiles(qs))
+        for q, val in zip(qs, ret):
+            self.assertAlmostEqual(self.rank(val), q, delta=0.002)
+        self.assertAlmostEqual(st.send(self.data, st.Quantiles(0.5)), 
+                               self.exact(0.5), delta=0.02)
+        
+    def test_small(self):
+        self.assertEqual(st.send(range(100), st.Quantiles((0.5, 0, 1))),
+                         (49.5, 0, 99))
+        
+    def test_merge(self):
+        a, b = st.Quantiles(0.9), st.Quantiles(0.9)
+        a.send_many(self.data[:5000])
+        b.send_many(self.data[5000:])
+        a.merge(b)
+        self.assertAlmostEqual(a.result(), self.exact(0.9), delta=0.02)
+        
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_array_chunks(self):
+        chunks = [numpy.array(self.data[i:i+1000]) for i in range(0, 20000, 1000)]
+        ret = st.send(chunks, st.Quantiles(0.99), chunked=True)
+        self.assertAlmostEqual(ret, self.exact(0.99), delta=0.02)
+        
+    def test_factory(self):
+        data = [(i%2, i) for i in range(1000)]
+        ret = st.send(data, st.SwitchByKey(lambda x:x[0], 
+                    factory=lambda :st.Get(1, st.Quantiles(0.5))))
+        self.assertAlmostEqual(ret[0], 499, delta=2)
+        self.assertAlmostEqual(ret[1], 500, delta=2)
+        
+        
+class TestTopK(unittest.TestCase):
+    def setUp(self):
+        self.data = random.sample(range(1000), 500)
+        
+    def test_topk(self):
+        top, bottom = st.send(self.data, (st.TopK(10), st.BottomK(10)))
+        self.assertEqual(top, sorted(self.data, reverse=True)[:10])
+        self.assertEqual(bottom, sorted(self.data)[:10])
+        
+    def test_key(self):
+        data = [(x, i) for i, x in enumerate(self.data)]
+        ret = st.send(data, st.TopK(5, key=lambda x:-x[0]))
+        self.assertEqual(ret, sorted(data)[:5])
+        
+    def test_small(self):
+        self.assertEqual(st.send([3, 1, 2], st.TopK(5)), [3, 2, 1])
+        self.assertRaises(ValueError, st.TopK, 0)
+        
+    def test_merge(self):
+        a, b = st.TopK(7), st.TopK(7)
+        a.send_many(self.data[:200])
+        b.send_many(self.data[200:])
+        a.merge(b)
+        self.assertEqual(a.result(), sorted(self.data, reverse=True)[:7])
+        
+        
+class TestSample(unittest.TestCase):
+    def test_sample(self):
+        ret = st.send(range(10000), st.Sample(50))
+        self.assertEqual(len(ret), 50)
+        self.assertEqual(len(set(ret)), 50)
+        self.assertTrue(all(0 <= x < 10000 for x in ret))
+        self.assertEqual(st.send(range(5), st.Sample(10)), list(range(5)))
+        
+    def test_seed(self):
+        a = st.send(range(10000), st.Sample(20, seed=42))
+        b = st.send(range(10000), st.Sample(20, seed=42))
+        self.assertEqual(a, b)
+        
+    def test_uniform(self):
+        counts = [0]*10
+        for seed in range(500):
+            for x in st.send(range(100), st.Sample(10, seed=seed)):
+                counts[x//10] += 1
+        #each decile should get about 500 of the 5000 samples
+        self.assertTrue(all(400 < c < 600 for c in counts), counts)
+        
+    def test_stratified(self):
+        data = [(i%3, i) for i in range(3000)]
+        ret = st.send(data, st.SwitchByKey(lambda x:x[0], 
+                                           factory=lambda :st.Sample(5)))
+        self.assertEqual(sorted(ret), [0, 1, 2])
+        for key, sample in ret.items():
+            self.assertEqual(len(sample), 5)
+            self.assertTrue(all(x[0] == key for x in sample))
+        
+        
+class TestGroupAggregate(unittest.TestCase):
+    def setUp(self):
+        self.data = [(random.randint(0, 30), random.random()) for i in range(2000)]
+        
+    def test_count_only(self):
+        data = ["a", "b", "a", None]
+        self.assertEqual(st.send(data, st.GroupAggregate(None, "count")), 
+                         {"a": 2, "b": 1, None: 1})
+        ret = st.send(data, st.GroupAggregate(None, ["count"], columnar=True))
+        self.assertEqual(list(ret["count"]), [2, 1, 1])
+        self.assertRaises(TypeError, st.send, data, 
+                          st.GroupAggregate(None, ("count", "sum")))
+        
+    def test_group_aggregate(self):
+        ret = st.send(self.data, st.GroupAggregate(lambda x:x[0], 
+                                                   value=lambda x:x[1]))
+        groups = defaultdict(list)
+        for k, v in self.data:
+            groups[k].append(v)
+        self.assertEqual(set(ret), set(groups))
+        for k, values in groups.items():
+            total, count, low, high, mean = ret[k]
+            self.assertAlmostEqual(total, sum(values))
+            self.assertEqual(count, len(values))
+            self.assertEqual((low, high), (min(values), max(values)))
+            self.assertAlmostEqual(mean, sum(values)/len(values))
+            
+    def test_single(self):
+        data = [1, 2, 2, 3, 3, 3]
+        self.assertEqual(st.send(data, st.GroupAggregate(None, "count")),
+                         {1:1, 2:2, 3:3})
+        self.assertRaises(ValueError, st.GroupAggregate, None, "median")
+        
+    def test_columnar(self):
+        data = [("a", 1), ("b", 2), ("a", 3)]
+        ret = st.send(data, st.GroupAggregate(lambda x:x[0], ("count", "mean"),
+                                    value=lambda x:x[1], columnar=True))
+        self.assertEqual(ret["key"], ["a", "b"])
+        self.assertEqual(list(ret["count"]), [2, 1])
+        self.assertEqual(list(ret["mean"]), [2.0, 2.0])
+        
+    def test_merge(self):
+        a = st.GroupAggregate(None, ("min", "max", "sum"))
+        b = st.GroupAggregate(None, ("min", "max", "sum"))
+        a.send_many([1, 2, 2])
+        b.send_many([2, 3])
+        a.merge(b)
+        self.assertEqual(a.result(), {1:(1.0, 1.0, 1.0), 2:(2.0, 2.0, 6.0), 
+                                      3:(3.0, 3.0, 3.0)})
+        
+        
+class TestWindow(unittest.TestCase):
+    def windows(self, data, size, step):
+        return [data[i:i+size] for i in range(0, len(data) - size + 1, step)]
+        
+    def test_list(self):
+        data = list(range(20))
+        for size, step in [(1, 1), (3, 1), (5, 2), (4, 7)]:
+            ret = st.send(data, st.Window(size, step, []))
+            self.assertEqual(ret, self.windows(data, size, step))
+            
+    def test_aggregates(self):
+        data = [random.randint(0, 100) for i in range(200)]
+        windows = self.windows(data, 10, 3)
+        ret = st.send(data, tuple(st.Window(10, 3, [], agg=agg) for agg in 
+                                  (st.Sum, st.Ave, st.Min, st.Max, st.Stats)))
+        self.assertEqual(ret[0], [sum(w) for w in windows])
+        self.assertEqual(ret[1], [sum(w)/10 for w in windows])
+        self.assertEqual(ret[2], [min(w) for w in windows])
+        self.assertEqual(ret[3], [max(w) for w in windows])
+        for (n, mean, std), w in zip(ret[4], windows):
+            self.assertEqual(n, 10)
+            self.assertAlmostEqual(mean, sum(w)/10)
+            self.assertAlmostEqual(std, sqrt(sum((x - mean)**2 for x in w)/9))
+            
+    def test_float_sum(self):
+        data = [1e16, 1.0, -1e16, 1, 1, 1, 1, 1]
+        self.assertEqual(st.send(data, st.Window(2, 1, [], agg=st.Sum))[3:], 
+                         [2.0]*4)
+        self.assertEqual(st.send(data, st.Window(2, 1, [], agg=st.Ave))[3:], 
+                         [1.0]*4)
+        data = [1e16, 1.0, -1e16] + [0.1]*10
+        ret = st.send(data, st.Window(3, 1, [], agg=st.Sum))
+        self.assertAlmostEqual(ret[-1], 0.3)
+        self.assertEqual(st.send([1, 2, 3], st.Window(2, 1, [], agg=st.Sum)), 
+                         [3, 5])
+        
+    def test_constant_stats(self):
+        for data in ([1, 2, 3, 5, 5, 5, 5], [3, -7, 3, 3, 3], 
+                     [0.1, 1e8, 0.1, 0.1, 0.1, 0.1]):
+            n, mean, std = st.send(data, st.Window(3, 1, [], agg=st.Stats))[-1]
+            self.assertAlmostEqual(mean, data[-1])
+            self.assertAlmostEqual(std, 0.0)
+            
+    def test_long_stats(self):
+        data = [1e6 + random.random() for i in range(10000)]
+        n, mean, std = st.send(data, st.Window(10, 1, [], agg=st.Stats))[-1]
+        w = data[-10:]
+        self.assertAlmostEqual(mean, sum(w)/10)
+        self.assertAlmostEqual(std, sqrt(sum((x - sum(w)/10)**2 for x in w)/9))
+        
+    def test_bad_agg(self):
+        self.assertRaises(TypeError, st.Window, 3, 1, [], agg=st.Count)
+        
+        
+class TestTimeWindow(unittest.TestCase):
+    def test_tumbling(self):
+        ret = st.send(range(35), st.TimeWindow(lambda x:x, 10, []))
+        self.assertEqual(ret, [(i, list(range(i, min(i+10, 35)))) 
+                               for i in range(0, 35, 10)])
+        
+    def test_lateness(self):
+        target = st.TimeWindow(lambda x:x, 10, [], allowed_lateness=5)
+        ret = st.send([0, 1, 12, 3, 25, 8, 21], target)
+        self.assertEqual(ret, [(0, [0, 1, 3]), (10, [12]), (20, [25, 21])])
+        self.assertEqual(target.late, 1)
+        
+    def test_aggregate_target(self):
+        ret = st.send(range(100), st.TimeWindow(lambda x:x, 10, 
+                                    st.Get(1, st.Sum()), factory=st.Count))
+        self.assertEqual(ret, 100)
+        
+    def test_session(self):
+        data = [1, 2, 4, 10, 11, 20, 21, 23]
+        ret = st.send(data, st.SessionWindow(lambda x:x, 3, []))
+        self.assertEqual(ret, [(1, 4, [1, 2, 4]), (10, 11, [10, 11]), 
+                               (20, 23, [20, 21, 23])])
+        
+    def test_session_out_of_order(self):
+        data = [1, 2, 8, 5, 20, 0, 30]
+        target = st.SessionWindow(lambda x:x, 3, [], allowed_lateness=4)
+        ret = st.send(data, target)
+        self.assertEqual(ret, [(1, 8, [1, 2, 8, 5]), (20, 20, [20]), 
+                               (30, 30, [30])])
+        self.assertEqual(target.late, 1)
+        
+    def test_containers(self):
+        data = list(range(25))
+        out = st.send(data, st.Switch(lambda x:0, 
+                                      st.TimeWindow(lambda x:x, 10, [])))
+        self.assertEqual(out, ([(0, data[:10]), (10, data[10:20]), 
+                                (20, data[20:])],))
+        out = st.send([(x, x) for x in [1, 2, 10, 11]], 
+                      st.Unzip(st.SessionWindow(lambda x:x, 3, []), 
+                               st.TimeWindow(lambda x:x, 10, [], 
+                                             factory=st.Count)))
+        self.assertEqual(out, ([(1, 2, [1, 2]), (10, 11, [10, 11])],
+                               [(0, 2), (10, 2)]))
+        out = st.send(data, st.SwitchByKey(lambda x:x%2, 
+                        factory=lambda :st.TimeWindow(lambda x:x, 10, [],
+                                                      factory=st.Count)))
+        self.assertEqual(out, {0: [(0, 5), (10, 5), (20, 3)], 
+                               1: [(0, 5), (10, 5), (20, 2)]})
+        
+        
+class TestUnzipColumns(unittest.TestCase):
+    def test_columns(self):
+        data = [(i, i/2., "r%d"%i) for i in range(100)]
+        ret = st.send(data, st.UnzipColumns(("q", "d", "O"), 
+                                            names=("id", "value", "name")))
+        self.assertEqual(list(ret["id"]), list(range(100)))
+        self.assertEqual(list(ret["value"]), [i/2. for i in range(100)])
+        self.assertEqual(ret["name"], ["r%d"%i for i in range(100)])
+        
+    def test_sequences(self):
+        data = [[1, 2.5], (3, 4.5, "extra"), iter((5, 6.5))]
+        ret = st.send(data, st.UnzipColumns({"a":"i", "b":"f"}))
+        self.assertEqual(list(ret["a"]), [1, 3, 5])
+        self.assertEqual(list(ret["b"]), [2.5, 4.5, 6.5])
+        self.assertRaises(TypeError, st.send, [(1,)], st.UnzipColumns("qq"))
+        
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_structured(self):
+        data = [(i, i*1.5) for i in range(10)]
+        ret = st.send(data, st.UnzipColumns(("l", numpy.float32), 
+                                            structured=True))
+        self.assertEqual(ret.dtype.names, ("f0", "f1"))
+        self.assertEqual(ret["f0"].tolist(), list(range(10)))
+        self.assertEqual(ret["f1"].tolist(), [i*1.5 for i in range(10)])
+        
+        
+class TestProfile(unittest.TestCase):
+    def test_counts(self):
+        data = list(range(20))
+        data[3] = None
+        factory = lambda :(st.Filter(lambda x:x is not None and x%2, 
+                                     st.Map(lambda x:x*2, [])),
+                           st.Map(lambda x:x+1, st.Limit(5, st.Sum()), 
+                                  catch=TypeError))
+        out, report = st.send(data, factory(), profile=True)
+        self.assertEqual(out, st.send(data, factory()))
+        self.assertEqual(report.name, "Split")
+        self.assertEqual(report.items_in, 20)
+        self.assertEqual(report.items_out, 20 + 7)
+        f, m = report.children
+        self.assertEqual((f.name, f.items_in, f.items_out, f.dropped), 
+                         ("Filter", 20, 9, 11))
+        self.assertEqual((m.name, m.items_in, m.items_out, m.dropped), 
+                         ("Map", 7, 6, 1))
+        #the item Limit refused is not dropped
+        limit = m.children[0]
+        self.assertEqual((limit.items_in, limit.items_out, limit.dropped), 
+                         (6, 5, 0))
+        self.assertEqual(limit.children[0].items_out, None)
+        self.assertTrue(report.time >= f.time + m.time)
+        self.assertTrue(report.self_time >= 0)
+        
+    def test_restored(self):
+        out = []
+        f = st.Filter(lambda x:x>1, out)
+        target = st.Get(0, f)
+        result, report = st.send([(i,) for i in range(5)], target, profile=True)
+        self.assertEqual(result, [2, 3, 4])
+        self.assertIs(result, out)
+        self.assertEqual(st.send([], target), [2, 3, 4])
+        
+    def test_exceptions(self):
+        target = st.Map(lambda x:x, st.Map(lambda x:1/x, []), 
+                        catch=ZeroDivisionError)
+        out, report = st.send([1, 0, 2], target, profile=True)
+        self.assertEqual(out, [1.0])
+        inner = report.children[0]
+        self.assertEqual((report.exceptions, inner.exceptions), (0, 1))
+        self.assertEqual((report.items_in, report.dropped), (3, 0))
+        out, report = st.send([1, 2], [], chunksize=2, profile=True)
+        self.assertEqual(report.items_in, 2)
+        
+    def test_limit(self):
+        out, report = st.send(range(10), st.Limit(3, []), profile=True)
+        self.assertEqual((report.items_in, report.items_out, report.dropped), 
+                         (4, 3, 0))
+        out, report = st.send(range(10), st.Limit(3, []), chunksize=4, 
+                              profile=True)
+        self.assertEqual((report.items_in, report.items_out, report.dropped), 
+                         (4, 3, 0))
+        out, report = st.send(range(10), st.Slice(0, 6, 2, []), profile=True)
+        self.assertEqual((report.items_in, report.items_out, report.dropped), 
+                         (6, 3, 2))
+        out, report = st.send(range(10), st.First(), profile=True)
+        self.assertEqual((out, report.items_in), (0, 1))
+        
+    def test_removed_on_error(self):
+        out = []
+        target = st.Map(lambda x:1/x, out)
+        self.assertRaises(ZeroDivisionError, st.send, [1, 0], target, 
+                          profile=True)
+        self.assertIs(st.send([], target), out)
+        self.assertEqual(out, [1.0])
+        
+    def test_report(self):
+        out, report = st.send(range(10), st.Map(str, []), profile=True)
+        d = report.as_dict()
+        self.assertEqual(d["name"], "Map")
+        self.assertEqual(d["dropped"], 0)
+        self.assertEqual(d["children"][0]["items_in"], 10)
+        lines = str(report).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("Map"))
+        self.assertTrue(lines[1].startswith("  ListAppend"))
+        self.assertIn("in=10", lines[1])
+        
+    def test_compiled(self):
+        target = st.compile(st.Map(lambda x:x*2, st.Filter(lambda x:x%3, [])))
+        out, report = st.send(range(9), target, profile=True)
+        self.assertEqual(out, [2, 4, 8, 10, 14, 16])
+        self.assertEqual((report.name, report.dropped), ("Fused", 3))
+        
+        
+class TestEarlyStop(unittest.TestCase):
+    def test_aggregates(self):
+        a = iter(range(10))
+        self.assertEqual(st.send(a, st.First()), 0)
+        self.assertEqual(next(a), 1)
+        a = iter([1, 2, 0, 3, 4])
+        self.assertEqual(st.send(a, st.All()), False)
+        self.assertEqual(next(a), 3)
+        a = iter([0, 0, 5, 6])
+        self.assertEqual(st.send(a, st.Any()), True)
+        self.assertEqual(next(a), 6)
+        a = iter(range(10))
+        self.assertEqual(st.send(a, st.Select(3)), 3)
+        self.assertEqual(next(a), 4)
+        
+    def test_send_many(self):
+        self.assertEqual(st.send(range(10), st.Select(5), chunksize=4), 5)
+        self.assertEqual(st.send(range(10), st.First(), chunksize=4), 0)
+        chunks = iter([[1, 1], [1, 0], [1, 1]])
+        self.assertEqual(st.send(chunks, st.All(), chunked=True), False)
+        self.assertEqual(next(chunks), [1, 1])
+        
+    def test_split(self):
+        a = iter(range(10))
+        self.assertEqual(st.send(a, (st.First(), st.Select(4))), (0, 4))
+        self.assertEqual(next(a), 5)
+        
+    def test_unzip(self):
+        a = iter([(i, -i) for i in range(10)])
+        self.assertEqual(st.send(a, st.Unzip(st.First(), st.Limit(3, []))), 
+                         (0, [0, -1, -2]))
+        self.assertEqual(next(a), (4, -4))
+        
+    def test_switch(self):
+        a = iter(range(20))
+        result = st.send(a, st.Switch(lambda x:x%2, st.Limit(2, []), 
+                                      st.Limit(5, [])))
+        self.assertEqual(result, ([0, 2], [1, 3, 5, 7, 9]))
+        self.assertEqual(next(a), 12)
+        
+    def test_switch_by_key(self):
+        result = st.send(range(20), st.SwitchByKey(lambda x:x%3, factory=st.First))
+        self.assertEqual(result, {0:0, 1:1, 2:2})
+        
+    def test_group_by_n(self):
+        data = [1, 1, 0, 1, 1, 1, 0, 1, 1]
+        self.assertEqual(st.send(data, st.GroupByN(3, [], factory=st.All)), 
+                         [False, True, False])
+        self.assertEqual(st.send(data, st.GroupByN(3, [], factory=st.Any)), 
+                         [True, True, True])
+        self.assertEqual(st.send(range(9), st.GroupByN(3, [], factory=st.First)), 
+                         [0, 3, 6])
+        self.assertEqual(st.send(range(9), st.GroupByN(3, [], 
+                                            factory=lambda :st.Select(1))), 
+                         [1, 4, 7])
+        
+    def test_group_by_key(self):
+        key = lambda x:x//3
+        self.assertEqual(st.send([0, 1, 2, 3, 4, 5, 6, 7], 
+                                 st.GroupByKey(key, [], factory=st.Any)), 
+                         [True, True, True])
+        self.assertEqual(st.send([1, 0, 2, 3, 4, 5, 6, 7], 
+                                 st.GroupByKey(key, [], factory=st.All)), 
+                         [False, True, True])
+        self.assertEqual(st.send(range(8), st.GroupByKey(key, [], 
+                                                         factory=st.First)), 
+                         [0, 3, 6])
+        self.assertEqual(st.send(range(8), st.GroupByKey(key, [], 
+                                            factory=lambda :st.Select(1))), 
+                         [1, 4, 7])
+        
+    def test_finished_target(self):
+        #the grouping nodes stop when their target does, and don't send the
+        #last group to it on close
+        self.assertEqual(st.send([1, 1, 2, 2], st.GroupByKey(None, st.First())), 
+                         [1, 1])
+        self.assertEqual(st.send([1, 1, 2, 2, 3, 3], 
+                                 st.GroupByKey(None, st.Limit(2, []))), 
+                         [[1, 1], [2, 2]])
+        self.assertEqual(st.send(range(6), st.GroupByN(2, st.First())), [0, 1])
+        self.assertEqual(st.send(range(10), st.GroupByN(2, st.Limit(2, []))), 
+                         [[0, 1], [2, 3]])
+        self.assertEqual(st.send(range(20), st.TimeWindow(lambda x:x, 5, 
+                                                          st.First())), 
+                         (0, [0, 1, 2, 3, 4]))
+        self.assertEqual(st.send(range(20), st.TimeWindow(lambda x:x, 5, 
+                                                          st.Limit(2, []))), 
+                         [(0, [0, 1, 2, 3, 4]), (5, [5, 6, 7, 8, 9])])
+        data = [0, 1, 5, 6, 10]
+        self.assertEqual(st.send(data, st.SessionWindow(lambda x:x, 1, 
+                                                        st.First())), 
+                         (0, 1, [0, 1]))
+        self.assertEqual(st.send(data, st.SessionWindow(lambda x:x, 1, 
+                                                        st.Limit(1, []))), 
+                         [(0, 1, [0, 1])])
+        self.assertEqual(st.send([2, 1, 2, 1], st.Sorted(st.GroupByKey(None, 
+                                                                st.First()))), 
+                         [1, 1])
+        a = iter([1, 1, 2, 2, 3, 3])
+        st.send(a, st.GroupByKey(None, st.First()))
+        self.assertEqual(next(a), 2)
+        
+    def test_time_window(self):
+        window = lambda factory:st.TimeWindow(lambda x:x, 10, [], factory=factory)
+        self.assertEqual(st.send(range(30), window(lambda :st.Map(lambda x:x>5, 
+                                                                  st.Any()))),
+                         [(0, True), (10, True), (20, True)])
+        self.assertEqual(st.send(range(30), window(lambda :st.Map(lambda x:x<15, 
+                                                                  st.All()))),
+                         [(0, True), (10, False), (20, False)])
+        self.assertEqual(st.send(range(30), window(st.First)),
+                         [(0, 0), (10, 10), (20, 20)])
+        self.assertEqual(st.send(range(30), window(lambda :st.Select(2))),
+                         [(0, 2), (10, 12), (20, 22)])
+        
+    def test_session_window(self):
+        window = lambda factory:st.SessionWindow(lambda x:x, 3, [], factory=factory)
+        data = [1, 2, 10, 11, 12]
+        self.assertEqual(st.send(data, window(st.First)), 
+                         [(1, 2, 1), (10, 12, 10)])
+        self.assertEqual(st.send(data, window(lambda :st.Select(1))), 
+                         [(1, 2, 2), (10, 12, 11)])
+        self.assertEqual(st.send(data, window(lambda :st.Map(lambda x:x>1, 
+                                                             st.Any()))), 
+                         [(1, 2, True), (10, 12, True)])
+        self.assertEqual(st.send(data, window(lambda :st.Map(lambda x:x<11, 
+                                                             st.All()))), 
+                         [(1, 2, True), (10, 12, False)])
+        
+    def test_generator_closed(self):
+        closed = []
+        def source():
+            try:
+                for i in itertools.count():
+                    yield i
+            finally:
+                closed.append(True)
+        self.assertEqual(st.send(source(), st.Limit(3, [])), [0, 1, 2])
+        self.assertEqual(closed, [True])
+        
+        
+class TestBatch(unittest.TestCase):
+    def test_map_batch(self):
+        calls = []
+        def func(batch):
+            calls.append(len(batch))
+            return [x*2 for x in batch]
+        self.assertEqual(st.send(range(10), st.MapBatch(func, [], size=4)), 
+                         [x*2 for x in range(10)])
+        self.assertEqual(calls, [4, 4, 2])
+        
+    def test_send_many(self):
+        calls = []
+        def func(batch):
+            calls.append(len(batch))
+            return batch
+        target = st.MapBatch(func, [], size=3)
+        target.send(0)
+        target.send_many(list(range(1, 8)))
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(target.result(), list(range(8)))
+        self.assertEqual(calls, [3, 3, 2])
+        
+    def test_filter_batch(self):
+        pred = lambda batch:[x%3 == 0 for x in batch]
+        self.assertEqual(st.send(range(20), st.FilterBatch(pred, [], size=7)), 
+                         list(range(0, 20, 3)))
+        
+    def test_length_mismatch(self):
+        target = st.MapBatch(lambda batch:batch[1:], [], size=2)
+        target.send(1)
+        self.assertRaises(ValueError, target.send, 2)
+        self.assertRaises(StopIteration, target.send, 3)
+        self.assertRaises(ValueError, st.send, range(5), 
+                          st.FilterBatch(lambda batch:[True], [], size=3))
+        
+    def test_limit(self):
+        a = iter(range(100))
+        out = st.send(a, st.MapBatch(lambda b:b, st.Limit(5, []), size=4))
+        self.assertEqual(out, [0, 1, 2, 3, 4])
+        self.assertEqual(next(a), 8)
+        
+    @unittest.skipIf(numpy is None, "numpy not available")
+    def test_asarray(self):
+        out = st.send(range(10), st.MapBatch(numpy.sqrt, 
+                                    st.TypedAppend("d"), size=4, asarray=True))
+        self.assertTrue(numpy.allclose(out, numpy.sqrt(numpy.arange(10))))
+        out = st.send(range(10), st.FilterBatch(lambda a:a%2 == 0, 
+                                    st.TypedAppend("d"), size=4, asarray=True))
+        self.assertEqual(list(out), [0, 2, 4, 6, 8])
+        
+        
+class TestSpillAppend(unittest.TestCase):
+    def test_objects(self):
+        data = [(i, str(i)) for i in range(1000)]
+        out = st.send(data, st.SpillAppend(2000))
+        self.assertEqual(len(out), 1000)
+        self.assertEqual(list(out), data)
+        self.assertEqual(out[0], data[0])
+        self.assertEqual(out[567], data[567])
+        self.assertEqual(out[-1], data[-1])
+        self.assertEqual(out[10:20:3], data[10:20:3])
+        self.assertTrue(len(list(out.blocks())) > 1)
+        self.assertRaises(IndexError, out.__getitem__, 1000)
+        out.close()
+        
+    def test_send_many(self):
+        out = st.send(range(1000), st.SpillAppend(1000), chunksize=64)
+        self.assertEqual(list(out), list(range(1000)))
+        self.assertEqual(sum(len(b) for b in out.blocks()), 1000)
+        
+    def test_in_memory(self):
+        out = st.send(range(10), st.SpillAppend())
+        self.assertEqual(list(out.blocks()), [list(range(10))])
+        self.assertEqual(out[3], 3)
+        
+    def test_typed(self):
+        data = [i*0.5 for i in range(1000)]
+        out = st.send(data, st.SpillAppend(800, dtype="d"))
+        self.assertEqual(out.typecode, "d")
+        self.assertEqual(len(out), 1000)
+        self.assertEqual(list(out), data)
+        self.assertEqual(out[150], 75.0)
+        self.assertEqual(out[-1], data[-1])
+        self.assertEqual(sum(len(b) for b in out.blocks()), 1000)
+        
+    @unittest.skipIf(numpy is None, "numpy not available")
+    def test_typed_chunks(self):
+        chunks = [numpy.arange(i*100, (i + 1)*100) for i in range(10)]
+        out = st.send(chunks, st.SpillAppend(1000, dtype="q"), chunked=True)
+        blocks = list(out.blocks())
+        self.assertTrue(numpy.array_equal(numpy.concatenate(blocks), 
+                                          numpy.arange(1000)))
+        self.assertEqual(out[999], 999)
+        
+        
+class TestSorted(unittest.TestCase):
+    def test_in_memory(self):
+        data = [random.random() for i in range(100)]
+        self.assertEqual(st.send(data, st.Sorted([])), sorted(data))
+        
+    def test_spilled(self):
+        rnd = random.Random(3)
+        data = [(rnd.randrange(50), i) for i in range(3000)]
+        key = lambda x:x[0]
+        out = st.send(data, st.Sorted([], key=key, memory_limit=4000, max_open=4))
+        self.assertEqual(out, sorted(data, key=key))
+        
+    def test_many_runs(self):
+        #enough runs for merged runs to be merged again, in several levels
+        rnd = random.Random(5)
+        data = [(rnd.randrange(20), i) for i in range(5000)]
+        key = lambda x:x[0]
+        for max_open in (2, 3, 5):
+            out = st.send(data, st.Sorted([], key=key, memory_limit=1000, 
+                                          max_open=max_open))
+            self.assertEqual(out, sorted(data, key=key))
+        
+    def test_group(self):
+        data = [i%7 for i in range(500)]
+        out = st.send(data, st.Sorted(st.GroupByKey(None, st.Map(len, [])), 
+                                      memory_limit=1000, max_open=3))
+        self.assertEqual(out, [72, 72, 72, 71, 71, 71, 71])
+        
+    def test_send_many(self):
+        data = list(range(1000, 0, -1))
+        out = st.send(data, st.Sorted([], memory_limit=2000), chunksize=100)
+        self.assertEqual(out, list(range(1, 1001)))
+        
+    def test_limit(self):
+        data = list(range(1000, 0, -1))
+        out = st.send(data, st.Sorted(st.Limit(3, []), memory_limit=2000))
+        self.assertEqual(out, [1, 2, 3])
+        
+    def test_containers(self):
+        data = [(i*7)%10 for i in range(10)]
+        out = st.send([(x, -x) for x in data], st.Unzip(st.Sorted([]), []))
+        self.assertEqual(out, (list(range(10)), [-x for x in data]))
+        out = st.send(data, st.Switch(lambda x:x%2, st.Sorted([]), []))
+        self.assertEqual(out, ([0, 2, 4, 6, 8], [7, 1, 5, 9, 3]))
+        out = st.send(data, st.SwitchByKey(lambda x:x%2, 
+                                           factory=lambda :st.Sorted([])))
+        self.assertEqual(out, {0: [0, 2, 4, 6, 8], 1: [1, 3, 5, 7, 9]})
+        
+    def test_below_finished(self):
+        #nodes which finish early still close the Sorted below them
+        self.assertEqual(st.send(range(100), st.Limit(5, st.Sorted([]))), 
+                         [0, 1, 2, 3, 4])
+        self.assertEqual(st.send(range(10, 0, -1), 
+                                 (st.Limit(3, st.Sorted([])), st.Count())), 
+                         ([8, 9, 10], 10))
+        self.assertEqual(st.send(range(10, 0, -1), st.Split(st.Limit(3, 
+                                        st.Sorted([])), st.Limit(2, []))), 
+                         ([8, 9, 10], [10, 9]))
+        self.assertEqual(st.send([3, 1, 2, 0], st.Switch(lambda x:x%2, 
+                                    st.Limit(1, st.Sorted([])), st.Limit(1, []))), 
+                         ([2], [3]))
+        self.assertEqual(st.send(range(20), st.Limit(7, st.TimeWindow(
+                                                        lambda x:x, 5, []))), 
+                         [(0, [0, 1, 2, 3, 4]), (5, [5, 6])])
+        
+    def test_incomplete_group(self):
+        closed = []
+        factory = lambda :st.Sorted(st.Map(closed.append, []))
+        st.send(range(50, 0, -1), st.GroupByN(30, [], factory=factory))
+        #the incomplete group is not passed on, but is closed
+        self.assertEqual(closed, list(range(21, 51)) + list(range(1, 21)))
+            
+    def test_many_merges(self):
+        rnd = random.Random(5)
+        data = [rnd.random() for i in range(5000)]
+        out = st.send(data, st.Sorted([], memory_limit=1000, max_open=3))
+        self.assertEqual(out, sorted(data))
+        
+        
+class TestCachedMap(unittest.TestCase):
+    def test_cache(self):
+        calls = []
+        def func(x):
+            calls.append(x)
+            return x*10
+        data = [1, 2, 1, 3, 1, 2, 4]
+        target = st.CachedMap(func, [], maxsize=None)
+        self.assertEqual(st.send(data, target), [x*10 for x in data])
+        self.assertEqual(calls, [1, 2, 3, 4])
+        self.assertEqual((target.hits, target.misses, target.evictions), 
+                         (3, 4, 0))
+        self.assertEqual(target.currsize, 4)
+        
+    def test_lru(self):
+        calls = []
+        def func(x):
+            calls.append(x)
+            return -x
+        data = [1, 2, 1, 3, 2, 1]
+        target = st.CachedMap(func, [], maxsize=2)
+        self.assertEqual(st.send(data, target), [-x for x in data])
+        #3 evicts 2 (1 was used more recently), then 2 evicts 1
+        self.assertEqual(calls, [1, 2, 3, 2, 1])
+        self.assertEqual((target.hits, target.misses, target.evictions), 
+                         (1, 5, 3))
+        
+    def test_key(self):
+        data = [[1, "a"], [2, "b"], [1, "c"]]
+        target = st.CachedMap(lambda row:row[0]*2, [], key=lambda row:row[0])
+        self.assertEqual(st.send(data, target), [2, 4, 2])
+        self.assertEqual(target.hits, 1)
+        
+    def test_catch(self):
+        data = [1, 0, 2, 0, 1]
+        target = st.CachedMap(lambda x:1/x, [], catch=ZeroDivisionError)
+        self.assertEqual(st.send(data, target), [1.0, 0.5, 1.0])
+        self.assertEqual(target.misses, 4)
+        self.assertEqual(st.send(data, st.CachedMap(lambda x:1/x, [], 
+                                catch=ZeroDivisionError), chunksize=2), 
+                         [1.0, 0.5, 1.0])
+        target = st.CachedMap(lambda x:1/x, [])
+        self.assertRaises(ZeroDivisionError, st.send, data, target)
+        self.assertRaises(StopIteration, target.send, 1)
+        factory = lambda :st.CachedMap(lambda x:x, st.Map(lambda x:1/x, []), 
+                                       catch=ZeroDivisionError)
+        #the inner Map dies at the first 0, which is caught
+        for n in (None, 1, 3, 5):
+            self.assertEqual(st.send(data, factory(), chunksize=n), [1.0])
+        
+    def test_send_many(self):
+        data = [i%5 for i in range(100)]
+        target = st.CachedMap(str, [], maxsize=3)
+        self.assertEqual(st.send(data, target, chunksize=7), list(map(str, data)))
+        self.assertEqual(target.hits + target.misses, 100)
+        
+        
+class TestFileSources(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        
+    def tearDown(self):
+        self.dir.cleanup()
+        
+    def write(self, name, data):
+        path = os.path.join(self.dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+        
+    def test_lines(self):
+        lines = ["line %d \u00e9"%i*(i%5) for i in range(2000)]
+        path = self.write("a.txt", "\n".join(lines).encode("utf-8"))
+        for use_mmap in (False, True):
+            self.assertEqual(st.send_lines(path, [], blocksize=100, 
+                                           use_mmap=use_mmap), lines)
+        self.assertEqual(st.send_lines(path, [], encoding=None)[3], 
+                         lines[3].encode("utf-8"))
+        
+    def test_line_endings(self):
+        path = self.write("b.txt", b"a\r\nb\n\nc\n")
+        self.assertEqual(st.send_lines(path, []), ["a", "b", "", "c"])
+        self.assertEqual(st.send_lines(path, [], keepends=True, blocksize=3), 
+                         ["a\r\n", "b\n", "\n", "c\n"])
+        self.assertEqual(st.send_lines(path, [], use_mmap=True, blocksize=1), 
+                         ["a", "b", "", "c"])
+        self.assertEqual(st.send_lines(self.write("c.txt", b""), []), [])
+        self.assertEqual(st.send_lines(self.write("d.txt", b""), [], 
+                                       use_mmap=True), [])
+        
+    def test_lines_encoding(self):
+        path = self.write("f.txt", "a\u00e9\nb\n".encode("latin-1"))
+        self.assertEqual(st.send_lines(path, [], encoding="latin-1"), 
+                         ["a\u00e9", "b"])
+        path = self.write("g.txt", "a\nb\n".encode("utf-16-le"))
+        for encoding in ("utf-16-le", "utf-16", "utf-32", "cp500"):
+            self.assertRaises(ValueError, st.send_lines, path, [], 
+                              encoding=encoding)
+        self.assertRaises(LookupError, st.send_lines, path, [], 
+                          encoding="no-such-codec")
+        
+    def test_lines_stop(self):
+        path = self.write("e.txt", b"\n".join(b"%d"%i for i in range(100)))
+        self.assertEqual(st.send_lines(path, st.Map(int, st.Limit(3, [])), 
+                                       blocksize=16), [0, 1, 2])
+        with open(path, "rb") as f:
+            self.assertEqual(st.send_lines(f, st.Count()), 100)
+        
+    def test_csv(self):
+        path = self.write("f.csv", b"x,y,name\n1,2,a\n3,4,b\n5,6,\"c,d\"\n")
+        self.assertEqual(st.send_csv(path, []), [["x", "y", "name"], 
+                         ["1", "2", "a"], ["3", "4", "b"], ["5", "6", "c,d"]])
+        self.assertEqual(st.send_csv(path, [], columns=["name", "x"], header=True),
+                         [("a", "1"), ("b", "3"), ("c,d", "5")])
+        self.assertEqual(st.send_csv(path, st.Map(int, st.Sum()), columns=1, 
+                                     header=True), 12)
+        self.assertRaises(ValueError, st.send_csv, path, [], columns="x")
+        
+    def test_records(self):
+        fmt = "<iHd"
+        records = [(i, i%7, i*0.25) for i in range(1000)]
+        s = struct.Struct(fmt)
+        path = self.write("g.bin", b"".join(s.pack(*r) for r in records))
+        for use_mmap in (False, True):
+            self.assertEqual(st.send_records(path, fmt, [], blocksize=100, 
+                                             use_mmap=use_mmap), records)
+        self.assertEqual(st.send_records(path, s, st.Get(0, st.Limit(2, []))),
+                         [0, 1])
+        path = self.write("h.bin", s.pack(*records[0]) + b"\x00")
+        self.assertRaises(ValueError, st.send_records, path, fmt, [])
+        self.assertRaises(ValueError, st.send_records, path, fmt, [], 
+                          use_mmap=True)
+        
+        
+class TestUnpack(unittest.TestCase):
+    def check_format(self, fmt, records):
+        s = struct.Struct(fmt)
+        data = b"".join(s.pack(*r) for r in records)
+        nfields = len(records[0])
+        out = st.send([data], st.Unpack(fmt, *[[] for i in range(nfields)]))
+        self.assertEqual(out, tuple(map(list, zip(*records))))
+        
+    def test_formats(self):
+        records = [(i - 3, i*1000, -i*100000, i*0.5, i % 2 == 1, b"ab") 
+                   for i in range(7)]
+        for order in ("@", "=", "<", ">", "!"):
+            self.check_format(order + "bHi d?2s", records)
+        records = [(b"x", 2**64 - 1 - i, -2**63 + i, 1.5) for i in range(3)]
+        self.check_format("<cQqf", records)
+        self.check_format(">cQqf", records)
+        self.check_format("@c3xQqf", records)
+        
+    def test_many_sends(self):
+        s = struct.Struct("<hd")
+        target = st.Unpack(s, [], st.Sum())
+        target.send(s.pack(1, 0.5))
+        target.send(memoryview(s.pack(2, 1.0) + s.pack(3, 1.5)))
+        self.assertEqual(target.result(), ([1, 2, 3], 3.0))
+        self.assertRaises(ValueError, target.send, b"\x00")
+        
+    def test_typed(self):
+        s = struct.Struct(">Iqf?")
+        data = b"".join(s.pack(i, -i, i/4, i%3 == 0) for i in range(100))
+        a, b, c, d = st.send([data], st.Unpack(">Iqf?", st.TypedAppend("q"), 
+                                  st.TypedAppend("d"), st.TypedAppend("f"), 
+                                  st.TypedAppend("B")))
+        self.assertEqual(list(a), list(range(100)))
+        self.assertEqual(list(b), [float(-i) for i in range(100)])
+        self.assertEqual(list(c), [i/4 for i in range(100)])
+        self.assertEqual(list(d), [int(i%3 == 0) for i in range(100)])
+        
+    def test_stop(self):
+        s = struct.Struct("<ii")
+        chunks = iter([b"".join(s.pack(i, i) for i in range(j, j + 4)) 
+                       for j in range(0, 40, 4)])
+        out = st.send(chunks, st.Unpack(s, st.Limit(2, []), st.Limit(6, [])))
+        self.assertEqual(out, ([0, 1], [0, 1, 2, 3, 4, 5]))
+        self.assertEqual(next(chunks)[:4], s.pack(8, 8)[:4])
+        
+    def test_errors(self):
+        self.assertRaises(TypeError, st.Unpack, "<ii", [])
+        self.assertRaises(ValueError, st.Unpack, "<e", [])
+        target = st.Unpack("<2s", st.TypedAppend("d"))
+        self.assertRaises(TypeError, target.send, b"ab")
+        
         
 if __name__=="__main__":
     unittest.main()